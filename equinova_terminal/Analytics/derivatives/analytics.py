@@ -16,15 +16,21 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
+import warnings
 from scipy import stats
+from scipy.stats import qmc
 from scipy.optimize import minimize
 
 from .core import (
-    DerivativeInstrument, MarketData, PricingResult,
+    DerivativeInstrument, MarketData, PricingResult, ExerciseStyle, OptionType,
     ValidationError, ModelValidator, Constants
 )
-from .options import VanillaOption, OptionGreeks, BlackScholesPricingEngine
+from .options import (
+    VanillaOption, OptionGreeks, BlackScholesPricingEngine,
+    black_scholes_price_batch, binomial_batch
+)
 from .forward_commitments import ForwardCommitmentPricingEngine
+from ..quant.mc_runner import run_chunked
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +116,22 @@ class SensitivityResult:
     elasticity: float  # Percentage change per percentage change in parameter
 
 
+@dataclass
+class MonteCarloSummary:
+    """Compact Monte Carlo results: arrays and quantiles instead of per-path objects"""
+    base_portfolio_value: float
+    num_simulations: int
+    time_horizon_days: int
+    mean_pnl: float
+    std_pnl: float
+    var: Dict[float, float]  # P&L quantile per confidence level (negative = loss)
+    cvar: Dict[float, float]  # mean P&L at or beyond that quantile
+    percentiles: Dict[int, float]
+    pnl: Optional[np.ndarray] = None  # per-path P&L (in-process runs only)
+    spot_multipliers: Optional[np.ndarray] = None
+    paths: Optional[np.ndarray] = None  # (sims, steps) spot paths, only if requested
+
+
 class DerivativesPortfolio:
     """Derivatives portfolio management and analytics"""
 
@@ -149,11 +171,54 @@ class DerivativesPortfolio:
         else:
             raise ValueError("Invalid position index")
 
+    def _batch_option_indices(self, market_data: MarketData,
+                              valuation_date: datetime) -> List[int]:
+        """Positions the vectorized Black-Scholes path can price (live European vanillas)"""
+        idx = [
+            i for i, p in enumerate(self.positions)
+            if isinstance(p.instrument, VanillaOption)
+            and p.instrument.exercise_style == ExerciseStyle.EUROPEAN
+            and p.instrument.time_to_expiry(valuation_date) >= 0
+        ]
+        # market data is shared, so one check covers every row
+        if idx and not self.options_engine.validate_inputs(self.positions[idx[0]].instrument, market_data):
+            return []
+        return idx
+
+    def _price_options_batch(self, market_data: MarketData) -> Tuple[List[int], Optional[Any]]:
+        valuation_date = datetime.now()
+        idx = self._batch_option_indices(market_data, valuation_date)
+        if not idx:
+            return [], None
+        try:
+            batch = self.options_engine.price_batch(
+                [self.positions[i].instrument for i in idx], market_data, valuation_date
+            )
+            return idx, batch
+        except Exception as e:
+            logger.warning(f"Batch option pricing failed, pricing one by one: {e}")
+            return [], None
+
     def update_positions(self, market_data: MarketData) -> float:
         """Update all position values and calculate portfolio value"""
         total_value = 0.0
 
-        for position in self.positions:
+        # European vanillas are priced in one vectorized pass
+        batch_idx, batch = self._price_options_batch(market_data)
+        if batch_idx:
+            qty = np.array([self.positions[i].quantity for i in batch_idx])
+            entry = np.array([self.positions[i].entry_price for i in batch_idx])
+            values = batch.price * qty
+            pnl = values - entry * qty
+            for i, v, u in zip(batch_idx, values.tolist(), pnl.tolist()):
+                self.positions[i].current_value = v
+                self.positions[i].unrealized_pnl = u
+            total_value += float(values.sum())
+        batched = set(batch_idx)
+
+        for i, position in enumerate(self.positions):
+            if i in batched:
+                continue
             try:
                 # Price the instrument
                 if hasattr(position.instrument, 'option_type'):  # Options
@@ -183,7 +248,16 @@ class DerivativesPortfolio:
             'vega': 0.0, 'rho': 0.0
         }
 
-        for position in self.positions:
+        batch_idx, batch = self._price_options_batch(market_data)
+        if batch_idx:
+            qty = np.array([self.positions[i].quantity for i in batch_idx])
+            for name in total_greeks:
+                total_greeks[name] += float(getattr(batch, name) @ qty)
+        batched = set(batch_idx)
+
+        for i, position in enumerate(self.positions):
+            if i in batched:
+                continue
             if hasattr(position.instrument, 'option_type'):  # Options only
                 try:
                     greeks = self.options_engine.calculate_greeks(position.instrument, market_data)
@@ -199,6 +273,61 @@ class DerivativesPortfolio:
 
         return total_greeks
 
+    def revalue_scenarios(self, spots: np.ndarray, market_data: MarketData,
+                          horizon_years: float = 0.0,
+                          valuation_date: Optional[datetime] = None,
+                          max_chunk_elements: int = 2_000_000) -> np.ndarray:
+        """
+        Portfolio value for each spot in `spots`, all other market data held fixed
+        and options aged by `horizon_years` from `valuation_date` (default now).
+        European vanillas are priced as one
+        (scenarios x positions) Black-Scholes block, American vanillas on a
+        binomial lattice vectorized over scenarios; anything else is priced per
+        scenario with its own engine (entry price if that fails).
+        """
+        spots = np.asarray(spots, dtype=np.float64).ravel()
+        values = np.zeros_like(spots)
+        valuation_date = valuation_date or datetime.now()
+        r, q, sigma = market_data.risk_free_rate, market_data.dividend_yield, market_data.volatility
+
+        european, american, other = [], [], []
+        for position in self.positions:
+            inst = position.instrument
+            if isinstance(inst, VanillaOption):
+                (european if inst.exercise_style == ExerciseStyle.EUROPEAN else american).append(position)
+            else:
+                other.append(position)
+
+        def option_arrays(positions):
+            T = np.array([p.instrument.time_to_expiry(valuation_date) for p in positions]) - horizon_years
+            return (np.array([p.instrument.strike_price for p in positions]), np.maximum(T, 0.0),
+                    np.array([p.instrument.option_type == OptionType.CALL for p in positions]),
+                    np.array([p.instrument.notional * p.quantity for p in positions]))
+
+        if european:
+            K, T, call, weight = option_arrays(european)
+            chunk = max(1, max_chunk_elements // len(european))
+            for start in range(0, spots.size, chunk):
+                block = spots[start:start + chunk, None]
+                values[start:start + chunk] += black_scholes_price_batch(block, K, T, r, q, sigma, call) @ weight
+
+        if american:
+            K, T, call, weight = option_arrays(american)
+            for k, t, c, w in zip(K, T, call, weight):
+                values += w * binomial_batch(spots, k, t, r, q, sigma, c, True, steps=100)
+
+        for position in other:
+            for i, spot in enumerate(spots.tolist()):
+                try:
+                    scenario = MarketData(spot_price=spot, risk_free_rate=r, dividend_yield=q,
+                                          volatility=sigma,
+                                          time_to_expiry=max(0, market_data.time_to_expiry - horizon_years))
+                    values[i] += self.forwards_engine.price(position.instrument, scenario).fair_value * position.quantity
+                except Exception:
+                    values[i] += position.entry_price * position.quantity
+
+        return values
+
     def get_portfolio_summary(self, market_data: MarketData) -> Dict[str, Any]:
         """Get comprehensive portfolio summary"""
         portfolio_value = self.update_positions(market_data)
@@ -321,6 +450,19 @@ class RiskAnalyzer:
         )
 
 
+def _simulate_portfolio_pnl(rng: np.random.Generator, n: int, portfolio: DerivativesPortfolio,
+                            base_market_data: MarketData, time_horizon: int, drift: float,
+                            volatility: float, antithetic: bool, base_value: float,
+                            valuation_date: datetime) -> np.ndarray:
+    """One Monte Carlo chunk: P&L of n GBM paths (module level so worker processes can run it)"""
+    dt = 1 / 252
+    shocks = ScenarioAnalyzer._normal_shocks(n, time_horizon, rng, antithetic, False)
+    log_end = ((drift - 0.5 * volatility ** 2) * dt * time_horizon
+               + volatility * np.sqrt(dt) * shocks.sum(axis=1))
+    spots = base_market_data.spot_price * np.exp(log_end)
+    return portfolio.revalue_scenarios(spots, base_market_data, time_horizon / 252, valuation_date) - base_value
+
+
 class ScenarioAnalyzer:
     """Scenario analysis and stress testing"""
 
@@ -372,62 +514,104 @@ class ScenarioAnalyzer:
 
         return results
 
+    @staticmethod
+    def _normal_shocks(num_simulations: int, steps: int, rng: np.random.Generator,
+                       antithetic: bool, sobol: bool) -> np.ndarray:
+        """(sims x steps) standard normals, optionally antithetic and/or scrambled Sobol"""
+        n = (num_simulations + 1) // 2 if antithetic else num_simulations
+        if sobol:
+            # balance properties hold for power-of-two sample sizes; others are still valid draws
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                u = qmc.Sobol(d=steps, scramble=True, seed=rng).random(n)
+            z = stats.norm.ppf(np.clip(u, 1e-12, 1 - 1e-12))
+        else:
+            z = rng.standard_normal((n, steps))
+        if antithetic:
+            z = np.concatenate([z, -z])[:num_simulations]
+        return z
+
     def monte_carlo_simulation(self, portfolio: DerivativesPortfolio,
                                base_market_data: MarketData,
                                num_simulations: int = 10000,
-                               time_horizon: int = 30) -> List[ScenarioResult]:
-        """Monte Carlo simulation for portfolio"""
-
-        base_value = portfolio.update_positions(base_market_data)
-        results = []
-
-        # Simulation parameters
+                               time_horizon: int = 30,
+                               seed: Optional[int] = None,
+                               antithetic: bool = False,
+                               sobol: bool = False,
+                               drift: float = 0.0001,
+                               volatility: float = 0.02,
+                               confidence_levels: Tuple[float, ...] = (0.95, 0.99),
+                               keep_paths: bool = False,
+                               workers: Optional[int] = 1,
+                               chunk_size: int = 20000,
+                               valuation_date: Optional[datetime] = None) -> MonteCarloSummary:
+        """
+        Monte Carlo simulation for portfolio.
+
+        All GBM paths are drawn as one (num_simulations x time_horizon) array
+        and the portfolio is revalued at every terminal spot in one batch.
+        With workers != 1 the paths are split into chunks across a process
+        pool (Analytics.quant.mc_runner); memory then stays constant and the
+        summary carries quantiles only (pnl, multipliers and paths are None).
+        Options are aged from `valuation_date` (default now, fixed once per
+        run), so a given seed and date reproduce the same summary.
+        """
         dt = 1 / 252  # Daily time step
-        drift = 0.0001  # Small positive drift
-        volatility = 0.02  # 2% daily volatility
-
-        for i in range(num_simulations):
-            try:
-                # Generate random price path
-                random_shocks = np.random.normal(0, 1, time_horizon)
-
-                # Simulate final market conditions
-                final_spot_multiplier = np.exp(np.sum(
-                    (drift - 0.5 * volatility ** 2) * dt + volatility * np.sqrt(dt) * random_shocks
-                ))
-
-                simulated_market_data = MarketData(
-                    spot_price=base_market_data.spot_price * final_spot_multiplier,
-                    risk_free_rate=base_market_data.risk_free_rate,
-                    dividend_yield=base_market_data.dividend_yield,
-                    volatility=base_market_data.volatility,
-                    time_to_expiry=max(0, base_market_data.time_to_expiry - time_horizon / 252)
-                )
-
-                simulated_value = portfolio.update_positions(simulated_market_data)
-                pnl_change = simulated_value - base_value
-                percentage_change = (pnl_change / base_value * 100) if base_value != 0 else 0
-
-                result = ScenarioResult(
-                    scenario_name=f"MC_Simulation_{i + 1}",
-                    scenario_type=ScenarioType.MONTE_CARLO,
-                    base_portfolio_value=base_value,
-                    scenario_portfolio_value=simulated_value,
-                    pnl_change=pnl_change,
-                    percentage_change=percentage_change,
-                    probability=1 / num_simulations,
-                    scenario_parameters={
-                        "final_spot_multiplier": final_spot_multiplier,
-                        "time_horizon_days": time_horizon
-                    }
-                )
-
-                results.append(result)
-
-            except Exception as e:
-                logger.warning(f"Error in MC simulation {i + 1}: {e}")
+        horizon_years = time_horizon / 252
+        valuation_date = valuation_date or datetime.now()
+
+        base_value = float(portfolio.revalue_scenarios(
+            np.array([base_market_data.spot_price]), base_market_data, 0.0, valuation_date)[0])
+
+        if workers != 1:
+            if sobol or keep_paths:
+                raise ValueError("sobol and keep_paths need workers=1")
+            run = run_chunked(
+                _simulate_portfolio_pnl, num_simulations,
+                args=(portfolio, base_market_data, time_horizon, drift, volatility, antithetic, base_value,
+                      valuation_date),
+                seed=seed, workers=workers, chunk_size=chunk_size
+            )
+            return MonteCarloSummary(
+                base_portfolio_value=base_value,
+                num_simulations=num_simulations,
+                time_horizon_days=time_horizon,
+                mean_pnl=run.mean,
+                std_pnl=run.std,
+                var={level: run.quantile(1 - level) for level in confidence_levels},
+                cvar={level: run.tail_mean(1 - level) for level in confidence_levels},
+                percentiles=run.percentiles()
+            )
 
-        return results
+        shocks = self._normal_shocks(num_simulations, time_horizon, np.random.default_rng(seed),
+                                     antithetic, sobol)
+        log_paths = np.cumsum((drift - 0.5 * volatility ** 2) * dt + volatility * np.sqrt(dt) * shocks, axis=1)
+        multipliers = np.exp(log_paths[:, -1])
+
+        simulated = portfolio.revalue_scenarios(base_market_data.spot_price * multipliers,
+                                                base_market_data, horizon_years, valuation_date)
+        pnl = simulated - base_value
+
+        var, cvar = {}, {}
+        for level in confidence_levels:
+            threshold = float(np.percentile(pnl, (1 - level) * 100))
+            var[level] = threshold
+            cvar[level] = float(pnl[pnl <= threshold].mean())
+        pct = (1, 5, 25, 50, 75, 95, 99)
+
+        return MonteCarloSummary(
+            base_portfolio_value=base_value,
+            num_simulations=num_simulations,
+            time_horizon_days=time_horizon,
+            mean_pnl=float(pnl.mean()),
+            std_pnl=float(pnl.std()),
+            var=var,
+            cvar=cvar,
+            percentiles=dict(zip(pct, np.percentile(pnl, pct).tolist())),
+            pnl=pnl,
+            spot_multipliers=multipliers,
+            paths=base_market_data.spot_price * np.exp(log_paths) if keep_paths else None
+        )
 
     def sensitivity_analysis(self, portfolio: DerivativesPortfolio,
                              base_market_data: MarketData,
@@ -684,6 +868,6 @@ class PortfolioOptimizer:
 # Export main classes
 __all__ = [
     'RiskMeasure', 'ScenarioType', 'PortfolioPosition', 'RiskMetrics',
-    'ScenarioResult', 'SensitivityResult', 'DerivativesPortfolio',
+    'ScenarioResult', 'SensitivityResult', 'MonteCarloSummary', 'DerivativesPortfolio',
     'RiskAnalyzer', 'ScenarioAnalyzer', 'PerformanceAttribution', 'PortfolioOptimizer'
 ]
\ No newline at end of file
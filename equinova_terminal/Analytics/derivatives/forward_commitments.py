@@ -148,8 +148,7 @@ class InterestRateForward(ForwardCommitment):
         t1 = calculate_time_fraction(datetime.now(), self.start_date, self.day_count)
         t2 = calculate_time_fraction(datetime.now(), self.expiry_date, self.day_count)
 
-        r1 = yield_curve.interpolate_rate(t1)
-        r2 = yield_curve.interpolate_rate(t2)
+        r1, r2 = yield_curve.rates([t1, t2])
 
         # Forward rate formula: F = ((1 + r2*T2) / (1 + r1*T1) - 1) / (T2 - T1)
         if self.day_count == DayCountConvention.ACT_360:
@@ -277,22 +276,14 @@ class InterestRateSwap:
     def fair_value(self, yield_curve: CurveData, pay_fixed: bool = True) -> PricingResult:
         """Calculate swap fair value using yield curve"""
         payment_dates = self._generate_payment_dates()
+        discount_factors = self._discount_factors(yield_curve, payment_dates)
 
         # Calculate fixed leg PV
-        fixed_leg_pv = 0.0
-        for payment_date in payment_dates:
-            time_to_payment = calculate_time_fraction(datetime.now(), payment_date, self.day_count)
-            discount_rate = yield_curve.interpolate_rate(time_to_payment)
-            discount_factor = np.exp(-discount_rate * time_to_payment)
-
-            period_length = self.payment_frequency
-            fixed_payment = self.fixed_rate * period_length * self.notional
-            fixed_leg_pv += fixed_payment * discount_factor
+        fixed_payment = self.fixed_rate * self.payment_frequency * self.notional
+        fixed_leg_pv = fixed_payment * discount_factors[:-1].sum()
 
         # Calculate floating leg PV (simplified)
-        floating_leg_pv = self.notional * (1 - np.exp(-yield_curve.interpolate_rate(
-            calculate_time_fraction(datetime.now(), self.end_date, self.day_count)
-        ) * calculate_time_fraction(datetime.now(), self.end_date, self.day_count)))
+        floating_leg_pv = self.notional * (1 - discount_factors[-1])
 
         # Swap value depends on position
         if pay_fixed:
@@ -327,23 +318,22 @@ class InterestRateSwap:
 
         return payment_dates
 
+    def _discount_factors(self, yield_curve: CurveData, payment_dates: List[datetime]) -> np.ndarray:
+        """Discount factors at every payment date, then at the end date, in one curve lookup"""
+        now = datetime.now()
+        times = [calculate_time_fraction(now, d, self.day_count) for d in payment_dates]
+        times.append(calculate_time_fraction(now, self.end_date, self.day_count))
+        return yield_curve.discount_factors(times)
+
     def par_rate(self, yield_curve: CurveData) -> float:
         """Calculate par swap rate (market swap rate)"""
-        payment_dates = self._generate_payment_dates()
+        discount_factors = self._discount_factors(yield_curve, self._generate_payment_dates())
 
         # Calculate annuity factor (sum of discount factors)
-        annuity_factor = 0.0
-        for payment_date in payment_dates:
-            time_to_payment = calculate_time_fraction(datetime.now(), payment_date, self.day_count)
-            discount_rate = yield_curve.interpolate_rate(time_to_payment)
-            discount_factor = np.exp(-discount_rate * time_to_payment)
-            annuity_factor += discount_factor * self.payment_frequency
+        annuity_factor = discount_factors[:-1].sum() * self.payment_frequency
 
         # Par rate = (1 - final_discount_factor) / annuity_factor
-        final_time = calculate_time_fraction(datetime.now(), self.end_date, self.day_count)
-        final_discount_factor = np.exp(-yield_curve.interpolate_rate(final_time) * final_time)
-
-        par_rate = (1 - final_discount_factor) / annuity_factor
+        par_rate = (1 - discount_factors[-1]) / annuity_factor
         return par_rate
 
 
@@ -415,19 +405,15 @@ class CurrencySwap:
         total_time = calculate_time_fraction(self.start_date, self.end_date, DayCountConvention.ACT_365)
         num_payments = int(total_time / self.payment_frequency)
 
-        leg_pv = 0.0
-        for i in range(1, num_payments + 1):
-            payment_time = i * self.payment_frequency
-            discount_rate = yield_curve.interpolate_rate(payment_time)
-            discount_factor = np.exp(-discount_rate * payment_time)
+        # coupon dates, then maturity, in one curve lookup
+        payment_times = np.arange(1, num_payments + 1) * self.payment_frequency
+        discount_factors = yield_curve.discount_factors(np.append(payment_times, total_time))
 
-            coupon_payment = fixed_rate * self.payment_frequency * notional
-            leg_pv += coupon_payment * discount_factor
+        coupon_payment = fixed_rate * self.payment_frequency * notional
+        leg_pv = coupon_payment * discount_factors[:-1].sum()
 
         # Add principal repayment at maturity
-        final_discount_rate = yield_curve.interpolate_rate(total_time)
-        final_discount_factor = np.exp(-final_discount_rate * total_time)
-        leg_pv += notional * final_discount_factor
+        leg_pv += notional * discount_factors[-1]
 
         return leg_pv
 
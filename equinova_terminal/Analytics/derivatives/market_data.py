@@ -22,6 +22,7 @@ from .core import (
     UnderlyingType, DayCountConvention, ValidationError,
     ModelValidator, calculate_time_fraction
 )
+from ..quant.curves import CurveInterpolator
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,7 @@ class DataFrequency(Enum):
     MONTHLY = "1month"
 
 
-@dataclass
+@dataclass(frozen=True)
 class YieldCurvePoint:
     """Single point on yield curve"""
     maturity: float  # Years
@@ -100,50 +101,43 @@ class CurveData:
     day_count: DayCountConvention
     points: List[YieldCurvePoint] = field(default_factory=list)
 
+    # interpolators built on first use, one per method; dropped when points change
+    _curves: Dict[str, CurveInterpolator] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # points are frozen, so only add_point or a new points list can stale the cache
+        if name == "points" and "_curves" in self.__dict__:
+            self._curves.clear()
+        super().__setattr__(name, value)
+
     def add_point(self, maturity: float, rate: float, instrument_type: str = "government"):
         """Add point to curve"""
         self.points.append(YieldCurvePoint(maturity, rate, instrument_type))
         self.points.sort(key=lambda x: x.maturity)
+        self._curves.clear()
+
+    def interpolator(self, method: str = "linear") -> CurveInterpolator:
+        """Pre-sorted, pre-fitted curve (continuous compounding) for the current points"""
+        curve = self._curves.get(method)
+        if curve is None:
+            if not self.points:
+                raise ValueError("No curve points available")
+            by_maturity = {p.maturity: p.rate for p in self.points}  # last quote wins
+            curve = CurveInterpolator(list(by_maturity), list(by_maturity.values()), method=method)
+            self._curves[method] = curve
+        return curve
 
     def interpolate_rate(self, maturity: float, method: str = "linear") -> float:
         """Interpolate rate for given maturity"""
-        if not self.points:
-            raise ValueError("No curve points available")
-
-        # Sort points by maturity
-        sorted_points = sorted(self.points, key=lambda x: x.maturity)
-
-        # Handle edge cases
-        if maturity <= sorted_points[0].maturity:
-            return sorted_points[0].rate
-        if maturity >= sorted_points[-1].maturity:
-            return sorted_points[-1].rate
-
-        # Find interpolation points
-        for i in range(len(sorted_points) - 1):
-            if sorted_points[i].maturity <= maturity <= sorted_points[i + 1].maturity:
-                if method == "linear":
-                    return self._linear_interpolation(
-                        sorted_points[i], sorted_points[i + 1], maturity
-                    )
-                elif method == "cubic":
-                    return self._cubic_interpolation(sorted_points, maturity, i)
-
-        raise ValueError(f"Cannot interpolate rate for maturity {maturity}")
-
-    def _linear_interpolation(self, p1: YieldCurvePoint, p2: YieldCurvePoint, maturity: float) -> float:
-        """Linear interpolation between two points"""
-        if p2.maturity == p1.maturity:
-            return p1.rate
-
-        weight = (maturity - p1.maturity) / (p2.maturity - p1.maturity)
-        return p1.rate + weight * (p2.rate - p1.rate)
-
-    def _cubic_interpolation(self, points: List[YieldCurvePoint], maturity: float, index: int) -> float:
-        """Cubic spline interpolation (simplified)"""
-        # For simplicity, use linear interpolation
-        # In production, implement proper cubic spline
-        return self._linear_interpolation(points[index], points[index + 1], maturity)
+        return self.interpolator(method).rate(maturity)
+
+    def rates(self, maturities: Union[List[float], np.ndarray], method: str = "linear") -> np.ndarray:
+        """Zero rates for an array of maturities"""
+        return self.interpolator(method).rates(maturities)
+
+    def discount_factors(self, maturities: Union[List[float], np.ndarray], method: str = "linear") -> np.ndarray:
+        """Continuously compounded discount factors for an array of maturities"""
+        return self.interpolator(method).discount_factors(maturities)
 
 
 class MarketDataProvider(ABC):
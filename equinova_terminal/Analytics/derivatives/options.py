@@ -14,6 +14,7 @@ from typing import Optional, Dict, Tuple, List
 from datetime import datetime
 from dataclasses import dataclass
 from scipy.stats import norm
+from scipy.special import ndtr
 from scipy.optimize import brentq
 import logging
 
@@ -42,6 +43,117 @@ class OptionGreeks:
     vomma: float = 0.0  # Vega convexity
 
 
+@dataclass
+class BatchPricingResult:
+    """Vectorized prices and Greeks; every field is an array shaped like the inputs"""
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    rho: np.ndarray
+    vanna: np.ndarray
+    volga: np.ndarray
+    charm: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.price.size)
+
+    def greeks_at(self, i: int) -> OptionGreeks:
+        """Scalar OptionGreeks for one row (for callers that expect the per-option API)"""
+        return OptionGreeks(
+            delta=float(self.delta.flat[i]), gamma=float(self.gamma.flat[i]),
+            theta=float(self.theta.flat[i]), vega=float(self.vega.flat[i]),
+            rho=float(self.rho.flat[i]), vanna=float(self.vanna.flat[i]),
+            volga=float(self.volga.flat[i]), charm=float(self.charm.flat[i])
+        )
+
+
+def black_scholes_batch(spot, strike, time_to_expiry, risk_free_rate, dividend_yield,
+                        volatility, is_call, notional=1.0) -> BatchPricingResult:
+    """
+    Black-Scholes-Merton price and Greeks for many European options in one pass.
+
+    Inputs are scalars or arrays and are broadcast against each other. Units
+    follow BlackScholesPricingEngine.calculate_greeks: theta and charm per
+    calendar day, vega and rho per 1%. Price is scaled by notional, Greeks are
+    per unit. Rows with time_to_expiry <= 0 price at intrinsic with zero Greeks.
+    """
+    S, K, T, r, q, sigma, call, N = np.broadcast_arrays(
+        np.asarray(spot, dtype=np.float64), np.asarray(strike, dtype=np.float64),
+        np.asarray(time_to_expiry, dtype=np.float64), np.asarray(risk_free_rate, dtype=np.float64),
+        np.asarray(dividend_yield, dtype=np.float64), np.asarray(volatility, dtype=np.float64),
+        np.asarray(is_call, dtype=bool), np.asarray(notional, dtype=np.float64)
+    )
+    if np.any(S <= 0) or np.any(K <= 0):
+        raise ValidationError("spot_price and strike_price must be positive")
+    if np.any(sigma < 0):
+        raise ValidationError("Volatility cannot be negative")
+
+    live = T > 0
+    sign = np.where(call, 1.0, -1.0)
+    intrinsic = np.maximum(sign * (S - K), 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Tl = np.where(live, T, 1.0)  # placeholder for expired rows, masked out below
+        sqrt_T = np.sqrt(Tl)
+        sig_sqrt_T = sigma * sqrt_T
+        df_r = np.exp(-r * Tl)
+        df_q = np.exp(-q * Tl)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * Tl) / sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+
+        n_d1 = norm.pdf(d1)
+        N_sd1 = norm.cdf(sign * d1)  # N(d1) for calls, N(-d1) for puts
+        N_sd2 = norm.cdf(sign * d2)
+
+        price = sign * (S * df_q * N_sd1 - K * df_r * N_sd2)
+        delta = sign * df_q * N_sd1
+        theta = (-S * n_d1 * sigma * df_q / (2 * sqrt_T)
+                 - sign * r * K * df_r * N_sd2
+                 + sign * q * S * df_q * N_sd1) / 365
+        rho = sign * K * Tl * df_r * N_sd2 / 100
+        gamma = n_d1 * df_q / (S * sig_sqrt_T)
+        vega = S * n_d1 * sqrt_T * df_q / 100
+        vanna = -vega * d2 / sigma
+        volga = vega * d1 * d2 / sigma
+        charm = (q * df_q * N_sd1
+                 - df_q * n_d1 * (2 * (r - q) * Tl - d2 * sig_sqrt_T) / (2 * Tl * sig_sqrt_T)) / 365
+
+    zero = np.zeros_like(S)
+    return BatchPricingResult(
+        price=np.where(live, price, intrinsic) * N,
+        delta=np.where(live, delta, zero),
+        gamma=np.where(live, gamma, zero),
+        theta=np.where(live, theta, zero),
+        vega=np.where(live, vega, zero),
+        rho=np.where(live, rho, zero),
+        vanna=np.where(live, vanna, zero),
+        volga=np.where(live, volga, zero),
+        charm=np.where(live, charm, zero)
+    )
+
+
+def black_scholes_price_batch(spot, strike, time_to_expiry, risk_free_rate, dividend_yield,
+                              volatility, is_call, notional=1.0) -> np.ndarray:
+    """Prices only (no Greeks) with the same broadcasting as black_scholes_batch; for revaluation"""
+    S, K, T, r, q, sigma, call, N = np.broadcast_arrays(
+        np.asarray(spot, dtype=np.float64), np.asarray(strike, dtype=np.float64),
+        np.asarray(time_to_expiry, dtype=np.float64), np.asarray(risk_free_rate, dtype=np.float64),
+        np.asarray(dividend_yield, dtype=np.float64), np.asarray(volatility, dtype=np.float64),
+        np.asarray(is_call, dtype=bool), np.asarray(notional, dtype=np.float64)
+    )
+    sign = np.where(call, 1.0, -1.0)
+    live = T > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Tl = np.where(live, T, 1.0)
+        sig_sqrt_T = sigma * np.sqrt(Tl)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * Tl) / sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+        price = sign * (S * np.exp(-q * Tl) * ndtr(sign * d1) - K * np.exp(-r * Tl) * ndtr(sign * d2))
+    return np.where(live, price, np.maximum(sign * (S - K), 0.0)) * N
+
+
 @dataclass
 class BinomialNode:
     """Single node in binomial tree"""
@@ -226,11 +338,121 @@ class TwoPeriodBinomialModel:
         }
 
 
+def _peizer_pratt(z: np.ndarray, n: int) -> np.ndarray:
+    """Peizer-Pratt method 2 inversion used by Leisen-Reimer (n odd)"""
+    x = z / (n + 1.0 / 3.0 + 0.1 / (n + 1.0))
+    return 0.5 + np.sign(z) * 0.5 * np.sqrt(1.0 - np.exp(-x * x * (n + 1.0 / 6.0)))
+
+
+def _lattice_params(T, r, q, sigma, K, S, steps: int, method: str):
+    """Per-row (u, d, p, discount) for a recombining tree of `steps` levels"""
+    dt = T / steps
+    if method == "crr":
+        u = np.exp(sigma * np.sqrt(dt))
+        d = 1.0 / u
+        p = (np.exp((r - q) * dt) - d) / (u - d)
+    elif method == "leisen_reimer":
+        sig_sqrt_T = sigma * np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+        p = _peizer_pratt(d2, steps)
+        growth = np.exp((r - q) * dt)
+        u = growth * _peizer_pratt(d1, steps) / p
+        d = (growth - p * u) / (1.0 - p)
+    else:
+        raise ValueError(f"Unknown lattice method: {method}")
+    return u, d, p, np.exp(-r * dt)
+
+
+def _rollback(S, K, sign, american, u, d, p, disc, steps: int) -> np.ndarray:
+    """Backward induction over a (rows, steps + 1) array, one level at a time"""
+    j = np.arange(steps + 1)
+    # terminal prices S * u^(N-j) * d^j, highest first
+    spots = S[:, None] * np.exp((steps - j) * np.log(u)[:, None] + j * np.log(d)[:, None])
+    strike, sgn, inv_u = K[:, None], sign[:, None], (1.0 / u)[:, None]
+    values = np.maximum(sgn * (spots - strike), 0.0)
+    pu, pd = (disc * p)[:, None], (disc * (1.0 - p))[:, None]
+    exercise_rows, all_american = american.any(), american.all()
+    amer = american[:, None]
+    for _ in range(steps):
+        values = pu * values[:, :-1] + pd * values[:, 1:]
+        if exercise_rows:
+            spots = spots[:, :-1] * inv_u  # level i node j is level i+1 node j divided by u
+            early = np.maximum(sgn * (spots - strike), 0.0)
+            values = np.maximum(values, early) if all_american else np.where(amer, np.maximum(values, early), values)
+    return values[:, 0]
+
+
+def binomial_batch(spot, strike, time_to_expiry, risk_free_rate, dividend_yield, volatility,
+                   is_call, is_american=False, steps: int = 200, method: str = "crr",
+                   richardson: bool = False, notional=1.0) -> np.ndarray:
+    """
+    Binomial-lattice prices for many European/American options at once.
+
+    Inputs broadcast like black_scholes_batch; each row gets its own tree
+    (own dt, u, d, p) and all rows are rolled back together on a single
+    (rows, steps + 1) array, so memory is O(rows * steps).
+
+    method:
+      "crr"            Cox-Ross-Rubinstein
+      "leisen_reimer"  Leisen-Reimer (steps rounded up to odd); converges
+                       smoothly and reaches bp accuracy with ~100 steps
+    richardson: cancel the leading discretisation error, per method:
+      "crr"            average P(N) and P(N+1); CRR's error oscillates with
+                       the strike's position between nodes, which an
+                       extrapolation in 1/N does not remove
+      "leisen_reimer"  (N^2 P(N) - M^2 P(M)) / (N^2 - M^2) with M the odd
+                       step count nearest N/2 (about (4 P(N) - P(N/2)) / 3),
+                       cancelling the 1/N^2 term
+    """
+    S, K, T, r, q, sigma, call, amer, N = (a.ravel() for a in np.broadcast_arrays(
+        np.asarray(spot, dtype=np.float64), np.asarray(strike, dtype=np.float64),
+        np.asarray(time_to_expiry, dtype=np.float64), np.asarray(risk_free_rate, dtype=np.float64),
+        np.asarray(dividend_yield, dtype=np.float64), np.asarray(volatility, dtype=np.float64),
+        np.asarray(is_call, dtype=bool), np.asarray(is_american, dtype=bool),
+        np.asarray(notional, dtype=np.float64)
+    ))
+    shape = np.broadcast_shapes(*(np.shape(x) for x in (
+        spot, strike, time_to_expiry, risk_free_rate, dividend_yield, volatility,
+        is_call, is_american, notional)))
+    if np.any(S <= 0) or np.any(K <= 0):
+        raise ValidationError("spot_price and strike_price must be positive")
+    if np.any(sigma <= 0):
+        raise ValidationError("Binomial lattice needs a positive volatility")
+    if steps < 2:
+        raise ValueError("steps must be at least 2")
+    if method == "leisen_reimer" and steps % 2 == 0:
+        steps += 1
+
+    sign = np.where(call, 1.0, -1.0)
+    out = np.maximum(sign * (S - K), 0.0)
+    live = T > 0
+    if live.any():
+        args = (S[live], K[live], sign[live], amer[live])
+
+        def price_at(n: int) -> np.ndarray:
+            u, d, p, disc = _lattice_params(T[live], r[live], q[live], sigma[live], K[live], S[live],
+                                            n, method)
+            return _rollback(*args, u, d, p, disc, n)
+
+        if richardson and method == "leisen_reimer":
+            half = steps // 2 + (1 - (steps // 2) % 2)  # LR trees need an odd step count
+            n2, m2 = float(steps * steps), float(half * half)
+            out[live] = (n2 * price_at(steps) - m2 * price_at(half)) / (n2 - m2)
+        elif richardson:
+            out[live] = 0.5 * (price_at(steps) + price_at(steps + 1))
+        else:
+            out[live] = price_at(steps)
+    return (out * N).reshape(shape)
+
+
 class BinomialPricingEngine(PricingEngine):
     """Multi-period binomial tree pricing engine"""
 
-    def __init__(self, steps: int = 50):
+    def __init__(self, steps: int = 50, method: str = "crr", richardson: bool = False):
         self.steps = steps
+        self.method = method
+        self.richardson = richardson
 
     def price(self, instrument: VanillaOption, market_data: MarketData) -> PricingResult:
         """Price option using binomial tree"""
@@ -247,42 +469,17 @@ class BinomialPricingEngine(PricingEngine):
         if T <= 0:
             return PricingResult(fair_value=instrument.calculate_payoff(S))
 
-        # Calculate tree parameters
-        dt = T / self.steps
-        u = np.exp(sigma * np.sqrt(dt))
-        d = 1 / u
-        prob_up = (np.exp((r - q) * dt) - d) / (u - d)
-
-        # Build stock price tree
-        stock_tree = np.zeros((self.steps + 1, self.steps + 1))
-        option_tree = np.zeros((self.steps + 1, self.steps + 1))
-
-        # Initialize stock prices at expiration
-        for j in range(self.steps + 1):
-            stock_tree[self.steps, j] = S * (u ** (self.steps - j)) * (d ** j)
-
-        # Calculate option values at expiration
-        for j in range(self.steps + 1):
-            option_tree[self.steps, j] = instrument.calculate_payoff(stock_tree[self.steps, j])
-
-        # Work backwards through tree
-        for i in range(self.steps - 1, -1, -1):
-            for j in range(i + 1):
-                stock_tree[i, j] = S * (u ** (i - j)) * (d ** j)
-
-                # European value
-                european_value = (prob_up * option_tree[i + 1, j] +
-                                  (1 - prob_up) * option_tree[i + 1, j + 1]) * np.exp(-r * dt)
-
-                # American exercise value
-                if instrument.exercise_style == ExerciseStyle.AMERICAN:
-                    exercise_value = instrument.calculate_payoff(stock_tree[i, j])
-                    option_tree[i, j] = max(european_value, exercise_value)
-                else:
-                    option_tree[i, j] = european_value
-
-        fair_value = option_tree[0, 0] * instrument.notional
+        fair_value = float(binomial_batch(
+            S, K, T, r, q, sigma,
+            is_call=instrument.option_type == OptionType.CALL,
+            is_american=instrument.exercise_style == ExerciseStyle.AMERICAN,
+            steps=self.steps, method=self.method, richardson=self.richardson,
+            notional=instrument.notional
+        ))
         intrinsic = instrument.intrinsic_value(S)
+        steps = self.steps + (1 if self.method == "leisen_reimer" and self.steps % 2 == 0 else 0)
+        u, d, prob_up, _ = (float(x) for x in _lattice_params(
+            np.float64(T), r, q, sigma, K, S, steps, self.method))
 
         return PricingResult(
             fair_value=fair_value,
@@ -290,14 +487,34 @@ class BinomialPricingEngine(PricingEngine):
             time_value=fair_value - intrinsic,
             calculation_details={
                 "model": "Binomial Tree",
-                "steps": self.steps,
+                "method": self.method,
+                "richardson": self.richardson,
+                "steps": steps,
                 "u": u,
                 "d": d,
                 "prob_up": prob_up,
-                "dt": dt
+                "dt": T / steps
             }
         )
 
+    def price_batch(self, options: List[VanillaOption], market_data: MarketData,
+                    valuation_date: Optional[datetime] = None) -> np.ndarray:
+        """Fair values for many options (any mix of strikes, expiries, styles) sharing market data"""
+        valuation_date = valuation_date or datetime.now()
+        n = len(options)
+        return binomial_batch(
+            market_data.spot_price,
+            np.fromiter((o.strike_price for o in options), np.float64, n),
+            np.fromiter((o.time_to_expiry(valuation_date) for o in options), np.float64, n),
+            market_data.risk_free_rate,
+            market_data.dividend_yield,
+            market_data.volatility,
+            is_call=np.fromiter((o.option_type == OptionType.CALL for o in options), bool, n),
+            is_american=np.fromiter((o.exercise_style == ExerciseStyle.AMERICAN for o in options), bool, n),
+            steps=self.steps, method=self.method, richardson=self.richardson,
+            notional=np.fromiter((o.notional for o in options), np.float64, n)
+        )
+
     def validate_inputs(self, instrument: VanillaOption, market_data: MarketData) -> bool:
         """Validate inputs for binomial pricing"""
         try:
@@ -379,6 +596,24 @@ class BlackScholesPricingEngine(PricingEngine):
 
         return greeks
 
+    def price_batch(self, options: List[VanillaOption], market_data: MarketData,
+                    valuation_date: Optional[datetime] = None) -> BatchPricingResult:
+        """Price and Greeks for many European options sharing one set of market data"""
+        if any(o.exercise_style != ExerciseStyle.EUROPEAN for o in options):
+            raise ValueError("Black-Scholes only valid for European options")
+        valuation_date = valuation_date or datetime.now()
+        return black_scholes_batch(
+            spot=market_data.spot_price,
+            strike=np.fromiter((o.strike_price for o in options), np.float64, len(options)),
+            time_to_expiry=np.fromiter((o.time_to_expiry(valuation_date) for o in options),
+                                       np.float64, len(options)),
+            risk_free_rate=market_data.risk_free_rate,
+            dividend_yield=market_data.dividend_yield,
+            volatility=market_data.volatility,
+            is_call=np.fromiter((o.option_type == OptionType.CALL for o in options), bool, len(options)),
+            notional=np.fromiter((o.notional for o in options), np.float64, len(options))
+        )
+
     def validate_inputs(self, instrument: VanillaOption, market_data: MarketData) -> bool:
         """Validate inputs for Black-Scholes pricing"""
         try:
@@ -490,6 +725,132 @@ class PutCallParity:
         }
 
 
+@dataclass
+class ImpliedVolResult:
+    """Chain-level implied volatilities; arrays shaped like the input prices"""
+    iv: np.ndarray  # NaN where the price violates no-arbitrage bounds or no root was found
+    converged: np.ndarray
+    iterations: np.ndarray  # vectorized Newton/Halley iterations used per element
+
+
+def _bs_price_vega_volga(S, K, T, r, q, sigma, sign):
+    """Undiscounted-by-notional BSM price with raw (not per-1%) vega and volga"""
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    fwd_S = S * np.exp(-q * T)
+    price = sign * (fwd_S * norm.cdf(sign * d1) - K * np.exp(-r * T) * norm.cdf(sign * d2))
+    vega = fwd_S * norm.pdf(d1) * sqrt_T
+    return price, vega, vega * d1 * d2 / sigma
+
+
+def _iv_initial_guess(price, S, K, T, r, q, sign):
+    """Corrado-Miller rational approximation, Manaster-Koehler where it breaks down"""
+    F = S * np.exp((r - q) * T)
+    df = np.exp(-r * T)
+    # work in forward terms on the call side (put-call parity for puts)
+    c = price / df + np.where(sign > 0, 0.0, F - K)
+    half_gap = 0.5 * (F - K)
+    disc = (c - half_gap) ** 2 - (F - K) ** 2 / np.pi
+    cm = np.sqrt(2 * np.pi / T) / (F + K) * (c - half_gap + np.sqrt(np.maximum(disc, 0.0)))
+    mk = np.sqrt(2.0 * np.abs(np.log(F / K)) / T)
+    guess = np.where((disc >= 0) & (cm > 0), cm, mk)
+    return np.where(np.isfinite(guess) & (guess > 0), guess, 0.2)
+
+
+def implied_vol_batch(price, spot, strike, time_to_expiry, risk_free_rate, is_call,
+                      dividend_yield=0.0, tol: float = 1e-8, max_iter: int = 20,
+                      vol_bounds: Tuple[float, float] = (0.001, 5.0),
+                      vol_tol: float = 1e-6) -> ImpliedVolResult:
+    """
+    Black-Scholes-Merton implied volatility for a whole chain.
+
+    All elements iterate together: Halley steps (vega and volga) from a
+    Corrado-Miller guess, kept inside a per-element [lo, hi] bracket that
+    shrinks every iteration and falls back to bisection when a step escapes
+    it. Only elements still unconverged after max_iter go to scalar brentq.
+    Convergence means |model price - price| <= tol and the remaining vol
+    error |model price - price| / vega <= vol_tol; where vega is too small for
+    the price to pin the vol down (deep ITM/OTM, short expiry) the element is
+    reported unconverged with a NaN iv.
+    """
+    P, S, K, T, r, q, call = np.broadcast_arrays(
+        np.asarray(price, dtype=np.float64), np.asarray(spot, dtype=np.float64),
+        np.asarray(strike, dtype=np.float64), np.asarray(time_to_expiry, dtype=np.float64),
+        np.asarray(risk_free_rate, dtype=np.float64), np.asarray(dividend_yield, dtype=np.float64),
+        np.asarray(is_call, dtype=bool)
+    )
+    shape = P.shape
+    P, S, K, T, r, q, call = (x.ravel() for x in (P, S, K, T, r, q, call))
+    sign = np.where(call, 1.0, -1.0)
+    lo_b, hi_b = vol_bounds
+    # rounding error of a BSM price (S N(d1) - K N(d2) cancels); a price this
+    # close to its neighbours cannot tell vols apart
+    noise = 4.0 * np.finfo(np.float64).eps * (np.abs(S) + np.abs(K))
+
+    iv = np.full(P.shape, np.nan)
+    converged = np.zeros(P.shape, dtype=bool)
+    iterations = np.zeros(P.shape, dtype=np.int32)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # a price outside the bounds for vols in vol_bounds has no root
+        p_lo = _bs_price_vega_volga(S, K, T, r, q, np.full_like(P, lo_b), sign)[0]
+        p_hi = _bs_price_vega_volga(S, K, T, r, q, np.full_like(P, hi_b), sign)[0]
+        active = (T > 0) & (S > 0) & (K > 0) & (P >= p_lo - tol) & (P <= p_hi + tol)
+        idx = np.flatnonzero(active)
+
+        sig = np.clip(_iv_initial_guess(P[idx], S[idx], K[idx], T[idx], r[idx], q[idx], sign[idx]),
+                      lo_b, hi_b)
+        lo = np.full(idx.shape, lo_b)
+        hi = np.full(idx.shape, hi_b)
+        for it in range(1, max_iter + 1):
+            if not idx.size:
+                break
+            a = (S[idx], K[idx], T[idx], r[idx], q[idx])
+            model, vega, volga = _bs_price_vega_volga(*a, sig, sign[idx])
+            f = model - P[idx]
+            done = (np.abs(f) <= tol) & (np.abs(f) + noise[idx] <= vol_tol * vega)
+            iv[idx[done]] = sig[done]
+            converged[idx[done]] = True
+            iterations[idx] = it
+            keep = ~done
+            idx, sig, f, vega, volga, lo, hi = (x[keep] for x in (idx, sig, f, vega, volga, lo, hi))
+            # price is increasing in vol, so the sign of f moves one side of the bracket
+            hi = np.where(f > 0, sig, hi)
+            lo = np.where(f < 0, sig, lo)
+            newton = f / vega
+            step = newton / np.maximum(1.0 - 0.5 * newton * volga / vega, 0.5)
+            nxt = sig - step
+            bad = ~np.isfinite(nxt) | (nxt <= lo) | (nxt >= hi)
+            sig = np.where(bad, 0.5 * (lo + hi), nxt)
+
+        # vega is unimodal in vol, peaking at sqrt(2 |ln(F/K)| / T); where even
+        # the largest vega left in [lo, hi] cannot meet vol_tol, brentq's root
+        # would be rejected, so only the rest go to the fallback
+        a = (S[idx], K[idx], T[idx], r[idx], q[idx])
+        peak = np.sqrt(2.0 * np.abs(np.log(a[0] / a[1]) + (a[3] - a[4]) * a[2]) / a[2])
+        vega_max = _bs_price_vega_volga(*a, np.clip(peak, lo, hi), sign[idx])[1]
+        idx = idx[noise[idx] <= vol_tol * vega_max]
+
+    # bracketed fallback for the stragglers
+    for i in idx.tolist():
+        try:
+            root = brentq(
+                lambda v: _bs_price_vega_volga(S[i], K[i], T[i], r[i], q[i], v, sign[i])[0] - P[i],
+                lo_b, hi_b, xtol=1e-10
+            )
+            model, vega = _bs_price_vega_volga(S[i], K[i], T[i], r[i], q[i], root, sign[i])[:2]
+            err = abs(model - P[i])
+            if err <= max(tol, 1e-6) and err + noise[i] <= vol_tol * vega:
+                iv[i] = root
+                converged[i] = True
+        except ValueError:
+            pass
+
+    return ImpliedVolResult(iv.reshape(shape), converged.reshape(shape), iterations.reshape(shape))
+
+
 class ImpliedVolatilityCalculator:
     """Calculate implied volatility from option prices"""
 
@@ -497,35 +858,20 @@ class ImpliedVolatilityCalculator:
     def calculate_iv(option_price: float, spot_price: float, strike_price: float,
                      time_to_expiry: float, risk_free_rate: float,
                      option_type: OptionType, dividend_yield: float = 0.0) -> float:
-        """Calculate implied volatility using Brent's method"""
-
-        def objective_function(vol):
-            """Objective function for root finding"""
-            market_data = MarketData(
-                spot_price=spot_price,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield,
-                volatility=vol,
-                time_to_expiry=time_to_expiry
-            )
-
-            option = VanillaOption(
-                option_type=option_type,
-                underlying_type=UnderlyingType.EQUITY,
-                expiry_date=datetime.now(),
-                strike_price=strike_price
-            )
-
-            theoretical_price = option._black_scholes_price(market_data).fair_value
-            return theoretical_price - option_price
-
-        try:
-            # Brent's method for root finding
-            implied_vol = brentq(objective_function, 0.001, 5.0, xtol=1e-6)
-            return implied_vol
-        except ValueError:
+        """Calculate implied volatility (vectorized solver on a single element)"""
+        result = implied_vol_batch(option_price, spot_price, strike_price, time_to_expiry,
+                                   risk_free_rate, option_type == OptionType.CALL, dividend_yield)
+        if not result.converged:
             logger.warning("Could not calculate implied volatility")
             return np.nan
+        return float(result.iv)
+
+    @staticmethod
+    def calculate_iv_chain(option_prices, spot_price, strike_prices, time_to_expiry,
+                           risk_free_rate, is_call, dividend_yield=0.0) -> ImpliedVolResult:
+        """Implied volatilities for a whole chain; see implied_vol_batch"""
+        return implied_vol_batch(option_prices, spot_price, strike_prices, time_to_expiry,
+                                 risk_free_rate, is_call, dividend_yield)
 
 
 class DeltaHedging:
@@ -563,8 +909,10 @@ class DeltaHedging:
 
 # Export main classes
 __all__ = [
-    'OptionGreeks', 'BinomialNode', 'VanillaOption', 'OnePeriodBinomialModel',
-    'TwoPeriodBinomialModel', 'BinomialPricingEngine', 'BlackScholesPricingEngine',
-    'BlackModelPricingEngine', 'PutCallParity', 'ImpliedVolatilityCalculator',
+    'OptionGreeks', 'BatchPricingResult', 'black_scholes_batch', 'black_scholes_price_batch',
+    'BinomialNode', 'VanillaOption',
+    'OnePeriodBinomialModel', 'TwoPeriodBinomialModel', 'binomial_batch', 'BinomialPricingEngine', 'BlackScholesPricingEngine',
+    'BlackModelPricingEngine', 'PutCallParity', 'ImpliedVolResult', 'implied_vol_batch',
+    'ImpliedVolatilityCalculator',
     'DeltaHedging'
 ]
\ No newline at end of file
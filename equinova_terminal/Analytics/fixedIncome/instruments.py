@@ -3,9 +3,15 @@ Fixed Income Analytics - Instruments Module
 CFA Level I & II Compliant Instrument Implementations
 """
 
+import calendar
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
 from decimal import Decimal
 from datetime import date, timedelta
+import numpy as np
 from models import (
     Bond, CallableBond, PutableBond, FloatingRateNote, ConvertibleBond,
     CashFlow, CallableFeature, PutableFeature, ValidationError
@@ -14,6 +20,112 @@ from config import (
     DayCountConvention, CompoundingFrequency, BusinessDayConvention,
     Currency, BondType, get_market_convention
 )
+from utils import DateUtils
+
+
+@dataclass(frozen=True)
+class CashFlowSchedule:
+    """
+    Cash flows of one bond from a settlement date, as parallel arrays.
+    `times` are day-count year fractions from settlement; the float copies
+    feed the numeric backend.
+    """
+    settlement_date: date
+    dates: Tuple[date, ...]
+    amounts: Tuple[Decimal, ...]
+    times: Tuple[Decimal, ...]
+    types: Tuple[str, ...]
+    float_times: np.ndarray = field(repr=False, compare=False)
+    float_amounts: np.ndarray = field(repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def cash_flows(self) -> List[CashFlow]:
+        """Fresh CashFlow objects (callers may mutate them)"""
+        return [CashFlow(date=d, amount=a, type=t) for d, a, t in zip(self.dates, self.amounts, self.types)]
+
+
+def schedule_terms(bond: Bond) -> tuple:
+    """The bond fields that determine its cash flows; the schedule cache key"""
+    return (bond.issue_date, bond.maturity_date, bond.face_value, bond.coupon_rate,
+            bond.coupon_frequency, bond.day_count_convention, bond.is_zero_coupon)
+
+
+class _ScheduleCache:
+    """LRU of schedules keyed by (terms, settlement date); edited terms simply miss"""
+
+    def __init__(self, max_size: int = 20000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, CashFlowSchedule]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[CashFlowSchedule]:
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return schedule
+
+    def put(self, key: tuple, schedule: CashFlowSchedule):
+        with self._lock:
+            self._entries[key] = schedule
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+schedule_cache = _ScheduleCache()
+
+
+@lru_cache(maxsize=8192)
+def _coupon_dates(issue_date: date, maturity_date: date, frequency: int) -> Tuple[date, ...]:
+    """Coupon dates rolled back from maturity to issue; depends only on the terms"""
+    dates = []
+
+    if frequency == 0:  # Continuous compounding - treat as annual
+        frequency = 1
+
+    # Calculate months between payments
+    months_between = 12 // frequency
+
+    # Start from maturity and work backwards
+    current_date = maturity_date
+
+    while current_date > issue_date:
+        dates.append(current_date)
+        # Subtract months
+        if current_date.month <= months_between:
+            new_month = 12 + current_date.month - months_between
+            new_year = current_date.year - 1
+        else:
+            new_month = current_date.month - months_between
+            new_year = current_date.year
+
+        try:
+            current_date = current_date.replace(year=new_year, month=new_month)
+        except ValueError:
+            # Handle end-of-month dates
+            if new_month == 2 and current_date.day > 28:
+                current_date = current_date.replace(year=new_year, month=new_month, day=28)
+            else:
+                current_date = current_date.replace(year=new_year, month=new_month, day=1)
+                current_date = current_date.replace(day=min(current_date.day,
+                                                            calendar.monthrange(new_year, new_month)[1]))
+
+    # Reverse to get chronological order
+    dates.reverse()
+    return tuple(dates)
 
 
 class BondInstrument:
@@ -23,11 +135,40 @@ class BondInstrument:
         self.bond = bond
         self._cash_flows = None
 
-    def generate_cash_flows(self, settlement_date: Optional[date] = None) -> List[CashFlow]:
-        """Generate bond cash flows from settlement date to maturity"""
+    def cash_flow_schedule(self, settlement_date: Optional[date] = None) -> CashFlowSchedule:
+        """Cached cash-flow schedule; built once per (bond terms, settlement date)"""
         if settlement_date is None:
             settlement_date = date.today()
 
+        key = (schedule_terms(self.bond), settlement_date)
+        schedule = schedule_cache.get(key)
+        if schedule is None:
+            flows = self._build_cash_flows(settlement_date)
+            times = tuple(DateUtils.calculate_day_count_fraction(settlement_date, cf.date,
+                                                                 self.bond.day_count_convention)
+                          for cf in flows)
+            schedule = CashFlowSchedule(
+                settlement_date=settlement_date,
+                dates=tuple(cf.date for cf in flows),
+                amounts=tuple(cf.amount for cf in flows),
+                times=times,
+                types=tuple(cf.type for cf in flows),
+                float_times=np.array([float(t) for t in times]),
+                float_amounts=np.array([float(cf.amount) for cf in flows]),
+            )
+            schedule.float_times.flags.writeable = False
+            schedule.float_amounts.flags.writeable = False
+            schedule_cache.put(key, schedule)
+        return schedule
+
+    def generate_cash_flows(self, settlement_date: Optional[date] = None) -> List[CashFlow]:
+        """Generate bond cash flows from settlement date to maturity"""
+        cash_flows = self.cash_flow_schedule(settlement_date).cash_flows()
+        self._cash_flows = cash_flows
+        return cash_flows
+
+    def _build_cash_flows(self, settlement_date: date) -> List[CashFlow]:
+        """Build the cash flows from the bond terms (uncached)"""
         cash_flows = []
 
         # For zero coupon bonds, only final payment
@@ -64,56 +205,12 @@ class BondInstrument:
                 type="principal"
             ))
 
-        self._cash_flows = cash_flows
         return cash_flows
 
     def _generate_coupon_dates(self, start_date: date) -> List[date]:
         """Generate coupon payment dates"""
-        dates = []
-        frequency = self.bond.coupon_frequency.value
-
-        if frequency == 0:  # Continuous compounding - treat as annual
-            frequency = 1
-
-        # Calculate months between payments
-        months_between = 12 // frequency
-
-        # Start from maturity and work backwards
-        current_date = self.bond.maturity_date
-
-        while current_date > self.bond.issue_date:
-            dates.append(current_date)
-            # Subtract months
-            if current_date.month <= months_between:
-                new_month = 12 + current_date.month - months_between
-                new_year = current_date.year - 1
-            else:
-                new_month = current_date.month - months_between
-                new_year = current_date.year
-
-            try:
-                current_date = current_date.replace(year=new_year, month=new_month)
-            except ValueError:
-                # Handle end-of-month dates
-                if new_month == 2 and current_date.day > 28:
-                    current_date = current_date.replace(year=new_year, month=new_month, day=28)
-                else:
-                    current_date = current_date.replace(year=new_year, month=new_month, day=1)
-                    current_date = current_date.replace(day=min(current_date.day,
-                                                                self._days_in_month(new_year, new_month)))
-
-        # Reverse to get chronological order
-        dates.reverse()
-        return dates
-
-    def _days_in_month(self, year: int, month: int) -> int:
-        """Get number of days in a month"""
-        if month == 12:
-            next_month = date(year + 1, 1, 1)
-        else:
-            next_month = date(year, month + 1, 1)
-        this_month = date(year, month, 1)
-        return (next_month - this_month).days
+        return list(_coupon_dates(self.bond.issue_date, self.bond.maturity_date,
+                                  self.bond.coupon_frequency.value))
 
     def _calculate_coupon_amount(self) -> Decimal:
         """Calculate coupon payment amount"""
@@ -0,0 +1,238 @@
+"""
+Fixed Income Analytics - Numeric Backend
+Float64/numpy fast path for bulk valuation and risk
+
+The Decimal classes remain the settlement-grade path. This module mirrors
+their conventions (annual-compounding discounting, the spot curve's own
+interpolation scheme, day-count year fractions) on arrays, so whole
+portfolios and scenario sets are valued in a few vectorized passes.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from models import Bond
+from instruments import create_bond_instrument
+from yield_curves import SpotCurve
+from equinova_terminal.Analytics.quant.curves import CurveInterpolator
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+# scenarios x cash-flow dates per vectorized block
+_BLOCK_ELEMENTS = 4_000_000
+
+
+class ArrayCurve:
+    """Spot curve on float64 arrays; same interpolation as SpotCurve.get_rate"""
+
+    def __init__(self, maturities: ArrayLike, rates: ArrayLike, interpolation: str = "linear"):
+        self.maturities = np.asarray(maturities, dtype=np.float64)
+        self.rates = np.asarray(rates, dtype=np.float64)
+        if self.maturities.shape != self.rates.shape:
+            raise ValueError("Maturities and rates must have same length")
+        if np.any(np.diff(self.maturities) <= 0):
+            raise ValueError("Maturities must be in ascending order")
+        self.interpolation = interpolation
+        self._interpolator = CurveInterpolator(self.maturities, self.rates, interpolation, compounding="annual")
+
+    @classmethod
+    def from_spot_curve(cls, curve: SpotCurve) -> 'ArrayCurve':
+        return cls([float(m) for m in curve.curve.maturities], [float(r) for r in curve.curve.rates],
+                   curve.interpolation)
+
+    def rates_at(self, t: ArrayLike) -> np.ndarray:
+        """Interpolated spot rates, flat beyond the last pillar"""
+        return self._interpolator.rates(t)
+
+    def discount_factors(self, t: ArrayLike, shift: ArrayLike = 0.0) -> np.ndarray:
+        t = np.asarray(t, dtype=np.float64)
+        return (1.0 + self.rates_at(t) + shift) ** -t
+
+    def shifted(self, shift: ArrayLike) -> 'ArrayCurve':
+        """Parallel shift (scalar) or per-pillar shift (array)"""
+        return ArrayCurve(self.maturities, self.rates + np.asarray(shift, dtype=np.float64), self.interpolation)
+
+
+@dataclass
+class CashFlowMatrix:
+    """Cash flows of many bonds as zero-padded (n_bonds, max_flows) arrays"""
+    times: np.ndarray
+    amounts: np.ndarray
+    frequencies: np.ndarray  # coupon frequency per bond (0 = continuous)
+    ids: List[str]
+
+    def __len__(self) -> int:
+        return self.times.shape[0]
+
+    @classmethod
+    def from_bonds(cls, bonds: Iterable[Bond], settlement_date: Optional[date] = None) -> 'CashFlowMatrix':
+        if settlement_date is None:
+            settlement_date = date.today()
+        rows, freqs, ids = [], [], []
+        for bond in bonds:
+            rows.append(create_bond_instrument(bond).cash_flow_schedule(settlement_date))
+            freqs.append(bond.coupon_frequency.value)
+            ids.append(bond.isin)
+        width = max((len(r) for r in rows), default=0)
+        times = np.zeros((len(rows), width))
+        amounts = np.zeros((len(rows), width))
+        for i, r in enumerate(rows):
+            times[i, :len(r)] = r.float_times
+            amounts[i, :len(r)] = r.float_amounts
+        return cls(times, amounts, np.asarray(freqs, dtype=np.float64), ids)
+
+
+def _as_column(x: ArrayLike, n: int) -> np.ndarray:
+    return np.broadcast_to(np.asarray(x, dtype=np.float64), (n,))[:, None]
+
+
+def present_values_at_yield(schedule: CashFlowMatrix, yields: ArrayLike) -> np.ndarray:
+    """Price of every bond at its own yield (BondValuation.present_value)"""
+    y = _as_column(yields, len(schedule))
+    return (schedule.amounts * (1.0 + y) ** -schedule.times).sum(axis=1)
+
+
+def present_values(schedule: CashFlowMatrix, curve: ArrayCurve,
+                   shifts: Optional[ArrayLike] = None) -> np.ndarray:
+    """
+    Curve PV of every bond (BondValuation.present_value_with_curve).
+    With `shifts` (n_scenarios,) of parallel shifts, returns (n_scenarios, n_bonds).
+    """
+    base = curve.rates_at(schedule.times)
+    if shifts is None:
+        return (schedule.amounts * (1.0 + base) ** -schedule.times).sum(axis=1)
+    shifts = np.asarray(shifts, dtype=np.float64).ravel()
+    out = np.empty((shifts.size, len(schedule)))
+    step = max(1, _BLOCK_ELEMENTS // max(1, schedule.times.size))
+    for s in range(0, shifts.size, step):
+        block = shifts[s:s + step, None, None]
+        out[s:s + step] = (schedule.amounts * (1.0 + base + block) ** -schedule.times).sum(axis=2)
+    return out
+
+
+def portfolio_values(schedule: CashFlowMatrix, quantities: ArrayLike, curve: ArrayCurve,
+                     shifts: ArrayLike) -> np.ndarray:
+    """
+    Portfolio value under each parallel shift.
+
+    Flows are first netted by payment time across all bonds, so the cost is
+    scenarios x distinct dates rather than scenarios x bonds x flows.
+    """
+    q = _as_column(quantities, len(schedule))
+    live = schedule.amounts != 0
+    times, inverse = np.unique(schedule.times[live], return_inverse=True)
+    netted = np.bincount(inverse, weights=(schedule.amounts * q)[live], minlength=times.size)
+    base = curve.rates_at(times)
+
+    shifts = np.asarray(shifts, dtype=np.float64).ravel()
+    out = np.empty(shifts.size)
+    step = max(1, _BLOCK_ELEMENTS // max(1, times.size))
+    for s in range(0, shifts.size, step):
+        block = shifts[s:s + step, None]
+        out[s:s + step] = ((1.0 + base + block) ** -times) @ netted
+    return out
+
+
+def yields_to_maturity(schedule: CashFlowMatrix, prices: ArrayLike, tol: float = 1e-10,
+                       max_iter: int = 50, bounds: Tuple[float, float] = (-0.5, 2.0)
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized YTM: Newton steps kept inside a per-bond bracket, bisecting
+    when a step leaves it. Returns (yields, converged); NaN where no root.
+    """
+    n = len(schedule)
+    P = np.broadcast_to(np.asarray(prices, dtype=np.float64), (n,)).copy()
+    t, a = schedule.times, schedule.amounts
+    lo = np.full(n, bounds[0])
+    hi = np.full(n, bounds[1])
+
+    # guess: total undiscounted flows over price, spread over the last flow time
+    horizon = np.maximum(t.max(axis=1), 1e-6)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = (a.sum(axis=1) / P) ** (1.0 / horizon) - 1.0
+    y = np.where(np.isfinite(y), np.clip(y, lo, hi), 0.05)
+
+    converged = np.zeros(n, dtype=bool)
+    for _ in range(max_iter):
+        disc = (1.0 + y[:, None]) ** -t
+        f = (a * disc).sum(axis=1) - P
+        df = -(a * t * disc).sum(axis=1) / (1.0 + y)
+        converged = np.abs(f) <= tol * np.maximum(P, 1.0)
+        if converged.all():
+            break
+        # price falls as yield rises
+        lo = np.where(f > 0, y, lo)
+        hi = np.where(f < 0, y, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nxt = y - f / df
+        bad = ~np.isfinite(nxt) | (nxt <= lo) | (nxt >= hi)
+        y = np.where(converged, y, np.where(bad, 0.5 * (lo + hi), nxt))
+
+    return np.where(converged, y, np.nan), converged
+
+
+def macaulay_durations(schedule: CashFlowMatrix, yields: ArrayLike) -> np.ndarray:
+    y = _as_column(yields, len(schedule))
+    pv = schedule.amounts * (1.0 + y) ** -schedule.times
+    total = pv.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total != 0, (schedule.times * pv).sum(axis=1) / total, 0.0)
+
+
+def modified_durations(schedule: CashFlowMatrix, yields: ArrayLike) -> np.ndarray:
+    """Macaulay / (1 + y/f), as DurationMeasures.modified_duration (f = 0: unchanged)"""
+    y = np.broadcast_to(np.asarray(yields, dtype=np.float64), (len(schedule),))
+    f = schedule.frequencies
+    return macaulay_durations(schedule, y) / np.where(f > 0, 1.0 + y / np.where(f > 0, f, 1.0), 1.0)
+
+
+def convexities(schedule: CashFlowMatrix, yields: ArrayLike) -> np.ndarray:
+    """Analytical convexity (1/P) d2P/dy2 under annual compounding"""
+    y = _as_column(yields, len(schedule))
+    t = schedule.times
+    disc = (1.0 + y) ** -t
+    price = (schedule.amounts * disc).sum(axis=1)
+    d2 = (schedule.amounts * t * (t + 1.0) * disc).sum(axis=1) / (1.0 + y[:, 0]) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(price != 0, d2 / price, 0.0)
+
+
+def effective_durations_and_convexities(schedule: CashFlowMatrix, curve: ArrayCurve,
+                                        shift: float = 0.0001) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Curve-shift duration (P- - P+) / (2 P0 dy) and convexity for every bond;
+    durations come out positive for ordinary bonds.
+    """
+    down, base, up = present_values(schedule, curve, [-shift, 0.0, shift])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        duration = np.where(base != 0, (down - up) / (2.0 * base * shift), 0.0)
+        convexity = np.where(base != 0, (up + down - 2.0 * base) / (base * shift ** 2), 0.0)
+    return duration, convexity
+
+
+def key_rate_durations(schedule: CashFlowMatrix, curve: ArrayCurve, key_maturities: ArrayLike,
+                       shift: float = 0.0001) -> np.ndarray:
+    """
+    (n_keys, n_bonds) key rate durations; pillars within one year of a key
+    move by shift * (1 - distance), as KeyRateDuration does.
+    """
+    keys = np.asarray(key_maturities, dtype=np.float64)
+    bumps = shift * np.clip(1.0 - np.abs(curve.maturities[None, :] - keys[:, None]), 0.0, None)
+    base = (schedule.amounts * curve.discount_factors(schedule.times)).sum(axis=1)
+    out = np.empty((keys.size, len(schedule)))
+    for k in range(keys.size):
+        shifted = (schedule.amounts * curve.shifted(bumps[k]).discount_factors(schedule.times)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[k] = np.where(base != 0, -(shifted - base) / (base * shift), 0.0)
+    return out
+
+
+def to_decimal(x: Union[float, np.ndarray]) -> Union[Decimal, List[Decimal]]:
+    """Hand float results back to the Decimal API"""
+    if np.ndim(x) == 0:
+        return Decimal(repr(float(x)))
+    return [Decimal(repr(v)) for v in np.asarray(x, dtype=np.float64).ravel().tolist()]
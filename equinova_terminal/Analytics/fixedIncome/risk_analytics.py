@@ -7,12 +7,22 @@ from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 from datetime import date
 import math
+import numpy as np
 from models import Bond, Portfolio, CashFlow
 from instruments import create_bond_instrument
 from yield_curves import SpotCurve
 from valuation import BondValuation, ArbitrageFreeValuation
 from utils import MathUtils, DateUtils, ValidationUtils, cache_calculation
 from config import CompoundingFrequency, ERROR_TOLERANCE
+from numeric import ArrayCurve, CashFlowMatrix, portfolio_values
+from equinova_terminal.Analytics.quant.mc_runner import run_chunked
+
+
+def _parallel_shift_changes(rng, n: int, schedule: CashFlowMatrix, quantities: np.ndarray,
+                            base_curve: ArrayCurve, shock_std: float, current_value: float) -> np.ndarray:
+    """Portfolio value change under n random parallel curve shifts (one Monte Carlo chunk)"""
+    shocks = rng.normal(0.0, shock_std, n)
+    return portfolio_values(schedule, quantities, base_curve, shocks) - current_value
 
 
 class DurationMeasures:
@@ -28,22 +38,17 @@ class DurationMeasures:
         if settlement_date is None:
             settlement_date = date.today()
 
-        bond_instrument = create_bond_instrument(bond)
-        cash_flows = bond_instrument.generate_cash_flows(settlement_date)
+        schedule = create_bond_instrument(bond).cash_flow_schedule(settlement_date)
 
-        if not cash_flows:
+        if not len(schedule):
             return Decimal('0')
 
         # Calculate weighted average time to maturity
         total_pv = Decimal('0')
         weighted_time = Decimal('0')
 
-        for cf in cash_flows:
-            time_to_payment = DateUtils.calculate_day_count_fraction(
-                settlement_date, cf.date, bond.day_count_convention
-            )
-
-            pv = MathUtils.present_value(cf.amount, yield_rate, time_to_payment)
+        for amount, time_to_payment in zip(schedule.amounts, schedule.times):
+            pv = MathUtils.present_value(amount, yield_rate, time_to_payment)
             total_pv += pv
             weighted_time += time_to_payment * pv
 
@@ -213,7 +218,7 @@ class KeyRateDuration:
         )
 
         from yield_curves import SpotCurve
-        return SpotCurve(new_curve)
+        return SpotCurve(new_curve, base_curve.interpolation)
 
 
 class PortfolioRiskMetrics:
@@ -336,36 +341,34 @@ class ValueAtRisk:
     def monte_carlo_var(portfolio: Portfolio, base_curve: SpotCurve,
                         yield_volatility: Decimal, simulations: int = 10000,
                         confidence_level: Decimal = Decimal('0.95'),
-                        time_horizon: Decimal = Decimal('1')) -> Tuple[Decimal, List[Decimal]]:
-        """Calculate VaR using Monte Carlo simulation"""
-        import random
-
-        current_value = Decimal('0')
-        simulated_values = []
-
-        # Calculate current portfolio value
-        for bond, quantity in portfolio.holdings:
-            bond_value = BondValuation.present_value_with_curve(bond, base_curve)
-            current_value += bond_value * quantity
-
-        # Run Monte Carlo simulations
-        for _ in range(simulations):
-            # Generate random yield change
-            random_change = Decimal(str(random.gauss(0, float(yield_volatility * (time_horizon ** Decimal('0.5'))))))
-
-            # Shift curve and revalue portfolio
-            shifted_curve = base_curve.shift_curve(random_change, "parallel")
-            portfolio_value = Decimal('0')
-
-            for bond, quantity in portfolio.holdings:
-                bond_value = BondValuation.present_value_with_curve(bond, shifted_curve)
-                portfolio_value += bond_value * quantity
+                        time_horizon: Decimal = Decimal('1'),
+                        seed: Optional[int] = None, workers: Optional[int] = 1,
+                        keep_values: bool = True) -> Tuple[Decimal, List[Decimal]]:
+        """
+        Calculate VaR using Monte Carlo simulation.
+
+        Paths run in chunks (workers > 1 spreads them over processes). With
+        keep_values=False memory stays constant, VaR comes from the merged
+        histogram and the returned list is empty.
+        """
+        # Cash flows are laid out once; each path is then a single float64 revaluation
+        schedule = CashFlowMatrix.from_bonds(bond for bond, _ in portfolio.holdings)
+        quantities = np.array([float(quantity) for _, quantity in portfolio.holdings])
+        curve = ArrayCurve.from_spot_curve(base_curve)
+        current_value = float(portfolio_values(schedule, quantities, curve, [0.0])[0])
+
+        shock_std = float(yield_volatility * (time_horizon ** Decimal('0.5')))
+        result = run_chunked(
+            _parallel_shift_changes, simulations,
+            args=(schedule, quantities, curve, shock_std, current_value),
+            seed=seed, workers=workers, keep_values=keep_values
+        )
 
-            value_change = portfolio_value - current_value
-            simulated_values.append(value_change)
+        if not keep_values:
+            return Decimal(str(-result.quantile(float(1 - confidence_level)))), []
 
         # Calculate VaR as percentile
-        simulated_values.sort()
+        simulated_values = sorted(Decimal(str(v)) for v in result.values.tolist())
         var_index = int((1 - confidence_level) * simulations)
         var = -simulated_values[var_index]  # VaR is positive number representing loss
 
@@ -6,12 +6,40 @@ CFA Level I & II Compliant Bond Valuation and Pricing Models
 from typing import List, Dict, Optional, Tuple, Callable
 from decimal import Decimal
 from datetime import date
-import random
+import numpy as np
 from models import Bond, CallableBond, PutableBond, ConvertibleBond, CashFlow
 from instruments import BondInstrument, create_bond_instrument
 from yield_curves import SpotCurve
 from utils import MathUtils, DateUtils, ValidationUtils, cache_calculation, black_scholes_call_price
 from config import CompoundingFrequency, ERROR_TOLERANCE
+from equinova_terminal.Analytics.quant.mc_runner import run_chunked
+
+
+def _vasicek_path_values(rng, n: int, r0: float, theta: float, kappa: float, sigma: float,
+                         dt: float, steps: int, cf_times: List[float], cf_amounts: List[float]):
+    """
+    Bond value along n Vasicek short-rate paths at once (one Monte Carlo chunk).
+    Euler steps of dr = kappa (theta - r) dt + sigma dW, floored at 1bp; each
+    cash flow is discounted, annually compounded, at the short rate of the
+    step it falls in.
+    """
+    cf_times = np.asarray(cf_times, dtype=np.float64)
+    cf_amounts = np.asarray(cf_amounts, dtype=np.float64)
+    cf_steps = np.minimum((cf_times / dt).astype(np.int64), steps - 1)
+    needed = np.unique(cf_steps)
+    rates_at = np.empty((n, needed.size))
+
+    r = np.full(n, r0)
+    sqrt_dt = np.sqrt(dt)
+    k = 0
+    for step in range(needed[-1] + 1 if needed.size else 0):
+        r = np.maximum(r + kappa * (theta - r) * dt + sigma * sqrt_dt * rng.standard_normal(n), 0.0001)
+        if step == needed[k]:
+            rates_at[:, k] = r
+            k += 1
+
+    col = np.searchsorted(needed, cf_steps)
+    return (cf_amounts / (1.0 + rates_at[:, col]) ** cf_times).sum(axis=1)
 
 
 class BondValuation:
@@ -27,17 +55,12 @@ class BondValuation:
         if settlement_date is None:
             settlement_date = date.today()
 
-        bond_instrument = create_bond_instrument(bond)
-        cash_flows = bond_instrument.generate_cash_flows(settlement_date)
+        schedule = create_bond_instrument(bond).cash_flow_schedule(settlement_date)
 
         total_pv = Decimal('0')
 
-        for cf in cash_flows:
-            time_to_payment = DateUtils.calculate_day_count_fraction(
-                settlement_date, cf.date, bond.day_count_convention
-            )
-
-            pv = MathUtils.present_value(cf.amount, discount_rate, time_to_payment)
+        for amount, time_to_payment in zip(schedule.amounts, schedule.times):
+            pv = MathUtils.present_value(amount, discount_rate, time_to_payment)
             total_pv += pv
 
         return total_pv
@@ -49,18 +72,13 @@ class BondValuation:
         if settlement_date is None:
             settlement_date = date.today()
 
-        bond_instrument = create_bond_instrument(bond)
-        cash_flows = bond_instrument.generate_cash_flows(settlement_date)
+        schedule = create_bond_instrument(bond).cash_flow_schedule(settlement_date)
 
         total_pv = Decimal('0')
 
-        for cf in cash_flows:
-            time_to_payment = DateUtils.calculate_day_count_fraction(
-                settlement_date, cf.date, bond.day_count_convention
-            )
-
+        for amount, time_to_payment in zip(schedule.amounts, schedule.times):
             spot_rate = spot_curve.get_rate(time_to_payment)
-            pv = MathUtils.present_value(cf.amount, spot_rate, time_to_payment)
+            pv = MathUtils.present_value(amount, spot_rate, time_to_payment)
             total_pv += pv
 
         return total_pv
@@ -285,8 +303,9 @@ class ArbitrageFreeValuation:
 
     @staticmethod
     def monte_carlo_value(bond: Bond, spot_curve: SpotCurve, volatility: Decimal,
-                          paths: int = 10000, steps: int = 252) -> Tuple[Decimal, Decimal]:
-        """Value bond using Monte Carlo simulation"""
+                          paths: int = 10000, steps: int = 252, seed: Optional[int] = None,
+                          workers: Optional[int] = 1) -> Tuple[Decimal, Decimal]:
+        """Value bond using Monte Carlo simulation (chunked; workers > 1 spreads chunks over processes)"""
         ValidationUtils.validate_positive(volatility, "Volatility")
         ValidationUtils.validate_positive(Decimal(str(paths)), "Paths")
 
@@ -297,73 +316,18 @@ class ArbitrageFreeValuation:
         dt = time_to_maturity / Decimal(str(steps))
 
         # Generate bond cash flows
-        bond_instrument = create_bond_instrument(bond)
-        cash_flows = bond_instrument.generate_cash_flows()
-
-        path_values = []
-
-        for _ in range(paths):
-            # Generate interest rate path
-            rate_path = ArbitrageFreeValuation._generate_rate_path(
-                spot_curve, volatility, steps, dt
-            )
-
-            # Value bond along this path
-            path_value = ArbitrageFreeValuation._value_along_path(
-                cash_flows, rate_path, bond, dt
-            )
-            path_values.append(path_value)
-
-        # Calculate statistics
-        mean_value = sum(path_values) / Decimal(str(len(path_values)))
-
-        # Standard error
-        variance = sum((v - mean_value) ** 2 for v in path_values) / Decimal(str(len(path_values) - 1))
-        std_error = (variance / Decimal(str(len(path_values)))) ** Decimal('0.5')
-
-        return mean_value, std_error
-
-    @staticmethod
-    def _generate_rate_path(spot_curve: SpotCurve, volatility: Decimal,
-                            steps: int, dt: Decimal) -> List[Decimal]:
-        """Generate single interest rate path using Vasicek model"""
-        path = []
-        r = spot_curve.get_rate(dt)  # Initial rate
-
-        # Vasicek parameters (simplified)
-        kappa = Decimal('0.1')  # Mean reversion speed
-        theta = spot_curve.get_rate(Decimal('10'))  # Long-term mean
-
-        for _ in range(steps):
-            # Vasicek SDE: dr = kappa(theta - r)dt + sigma * dW
-            drift = kappa * (theta - r) * dt
-            shock = volatility * (dt ** Decimal('0.5')) * Decimal(str(random.gauss(0, 1)))
-
-            r = r + drift + shock
-            r = max(r, Decimal('0.0001'))  # Floor at 1bp
-            path.append(r)
-
-        return path
-
-    @staticmethod
-    def _value_along_path(cash_flows: List[CashFlow], rate_path: List[Decimal],
-                          bond: Bond, dt: Decimal) -> Decimal:
-        """Value bond along specific rate path"""
-        total_value = Decimal('0')
-
-        for cf in cash_flows:
-            time_to_cf = DateUtils.calculate_day_count_fraction(
-                date.today(), cf.date, bond.day_count_convention
-            )
-
-            # Find appropriate rate from path
-            step = min(int(time_to_cf / dt), len(rate_path) - 1)
-            discount_rate = rate_path[step]
-
-            pv = MathUtils.present_value(cf.amount, discount_rate, time_to_cf)
-            total_value += pv
+        schedule = create_bond_instrument(bond).cash_flow_schedule()
+        cf_times = schedule.float_times.tolist()
+        cf_amounts = schedule.float_amounts.tolist()
+
+        result = run_chunked(
+            _vasicek_path_values, paths,
+            args=(float(spot_curve.get_rate(dt)), float(spot_curve.get_rate(Decimal('10'))), 0.1,
+                  float(volatility), float(dt), steps, cf_times, cf_amounts),
+            seed=seed, workers=workers
+        )
 
-        return total_value
+        return Decimal(str(result.mean)), Decimal(str(result.std_error))
 
 
 class OptionAdjustedSpread:
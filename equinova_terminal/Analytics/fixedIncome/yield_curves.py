@@ -3,21 +3,30 @@ Fixed Income Analytics - Yield Curves Module
 CFA Level I & II Compliant Yield Curve Construction and Analysis
 """
 
+from bisect import bisect_left
 from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 from datetime import date
+import numpy as np
 from models import YieldCurve, Bond, MarketData
 from utils import MathUtils, DateUtils, ValidationUtils, cache_calculation
 from config import Currency, CompoundingFrequency, ERROR_TOLERANCE
+from equinova_terminal.Analytics.quant.curves import CurveInterpolator
 
 
 class SpotCurve:
     """Zero-coupon (spot) yield curve implementation"""
 
-    def __init__(self, curve: YieldCurve):
+    def __init__(self, curve: YieldCurve, interpolation: str = "linear"):
         ValidationUtils.validate_date_order(date.today(), curve.curve_date, "Today", "Curve date")
         self.curve = curve
+        self.interpolation = interpolation
         self._validate_curve()
+        # float twin of the curve, fitted once, for non-linear schemes and array lookups
+        self._interpolator = CurveInterpolator(
+            [float(m) for m in curve.maturities], [float(r) for r in curve.rates],
+            method=interpolation, compounding="annual"
+        )
 
     def _validate_curve(self):
         """Validate curve data"""
@@ -33,33 +42,40 @@ class SpotCurve:
         for rate in self.curve.rates:
             ValidationUtils.validate_yield(rate, "Spot rate")
 
-    @cache_calculation
     def get_rate(self, maturity: Decimal) -> Decimal:
         """Get spot rate for given maturity using interpolation"""
         ValidationUtils.validate_positive(maturity, "Maturity")
 
-        # Exact match
-        if maturity in self.curve.maturities:
-            index = self.curve.maturities.index(maturity)
-            return self.curve.rates[index]
+        if self.interpolation != "linear":
+            return Decimal(repr(self._interpolator.rate(float(maturity))))
+
+        maturities = self.curve.maturities
 
         # Extrapolation for very short or long maturities
-        if maturity < self.curve.maturities[0]:
+        if maturity <= maturities[0]:
             return self.curve.rates[0]  # Flat extrapolation
 
-        if maturity > self.curve.maturities[-1]:
+        if maturity >= maturities[-1]:
             return self.curve.rates[-1]  # Flat extrapolation
 
-        # Linear interpolation
-        for i in range(len(self.curve.maturities) - 1):
-            if self.curve.maturities[i] <= maturity <= self.curve.maturities[i + 1]:
-                return MathUtils.linear_interpolation(
-                    maturity,
-                    self.curve.maturities[i], self.curve.rates[i],
-                    self.curve.maturities[i + 1], self.curve.rates[i + 1]
-                )
+        # Binary search for the bracketing pillars (exact Decimal linear interpolation)
+        i = bisect_left(maturities, maturity)
+        if maturities[i] == maturity:
+            return self.curve.rates[i]
+
+        return MathUtils.linear_interpolation(
+            maturity,
+            maturities[i - 1], self.curve.rates[i - 1],
+            maturities[i], self.curve.rates[i]
+        )
+
+    def rates(self, maturities) -> np.ndarray:
+        """Float64 spot rates for an array of maturities"""
+        return self._interpolator.rates(maturities)
 
-        return self.curve.rates[0]  # Fallback
+    def discount_factors(self, maturities) -> np.ndarray:
+        """Float64 discount factors (1 + r)^-t for an array of maturities"""
+        return self._interpolator.discount_factors(maturities)
 
     def get_discount_factor(self, maturity: Decimal) -> Decimal:
         """Calculate discount factor for given maturity"""
@@ -119,7 +135,7 @@ class SpotCurve:
             curve_type="spot"
         )
 
-        return SpotCurve(new_curve)
+        return SpotCurve(new_curve, self.interpolation)
 
 
 class ParCurve:
@@ -0,0 +1,244 @@
+"""
+Curve Interpolation Module
+Pre-built zero curves with vectorized lookup for EquiNova pricing
+
+Pillars are sorted and the interpolation coefficients are solved once at
+construction; queries locate their segment with a binary search
+(np.searchsorted) and evaluate a closed form, so discounting any number of
+cash flows is a handful of array operations regardless of curve size.
+
+Schemes:
+    linear           linear in zero rates
+    cubic            natural cubic spline in zero rates
+    monotone_convex  Hagan-West monotone convex on -ln(DF); positive,
+                     continuous forwards for sensible inputs
+    log_linear       linear in -ln(DF), i.e. piecewise flat forwards
+
+Zero rates are flat beyond the last pillar, as in the existing curves. Before
+the first pillar linear and cubic stay flat; the -ln(DF) schemes interpolate
+from DF(0) = 1 (flat for log_linear, forward-smooth for monotone_convex).
+"""
+
+from bisect import bisect_right
+from typing import Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+INTERPOLATION_METHODS = ("linear", "cubic", "monotone_convex", "log_linear")
+COMPOUNDING = ("continuous", "annual")
+
+
+class CurveInterpolator:
+    """
+    Zero curve over (maturity, rate) pillars.
+
+    Args:
+        maturities: pillar maturities in years (any order, must be distinct and > 0)
+        rates: zero rates at the pillars
+        method: one of INTERPOLATION_METHODS
+        compounding: how `rates` turn into discount factors, "continuous"
+            exp(-r t) or "annual" (1 + r)^-t
+    """
+
+    def __init__(self, maturities: ArrayLike, rates: ArrayLike, method: str = "linear",
+                 compounding: str = "continuous"):
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(f"Unknown interpolation method '{method}'. Use one of {INTERPOLATION_METHODS}")
+        if compounding not in COMPOUNDING:
+            raise ValueError(f"Unknown compounding '{compounding}'. Use one of {COMPOUNDING}")
+
+        t = np.asarray(maturities, dtype=np.float64).ravel()
+        r = np.asarray(rates, dtype=np.float64).ravel()
+        if t.size == 0 or t.size != r.size:
+            raise ValueError("Maturities and rates must be non-empty and of equal length")
+        order = np.argsort(t, kind="stable")
+        t, r = t[order], r[order]
+        if t[0] <= 0 or np.any(np.diff(t) <= 0):
+            raise ValueError("Maturities must be positive and distinct")
+
+        self.method = method
+        self.compounding = compounding
+        self.maturities = t
+        self.zero_rates = r
+        self.maturities.flags.writeable = False
+        self.zero_rates.flags.writeable = False
+
+        if method == "linear":
+            # plain floats for rate(), where numpy's per-call overhead would dominate
+            self._pillars = (t.tolist(), r.tolist())
+        elif method == "cubic":
+            self._fit_cubic()
+        elif method in ("monotone_convex", "log_linear"):
+            # both work on z(t) = -ln DF(t), anchored at z(0) = 0
+            self._knots = np.concatenate(([0.0], t))
+            self._z = np.concatenate(([0.0], self._log_discount(r, t)))
+            self._fwd = np.diff(self._z) / np.diff(self._knots)  # discrete forwards
+            if method == "monotone_convex":
+                self._fit_monotone_convex()
+
+    def __repr__(self) -> str:
+        return (f"CurveInterpolator(method='{self.method}', compounding='{self.compounding}', "
+                f"pillars={self.maturities.size})")
+
+    # ---------------- rate <-> log discount ----------------
+
+    def _log_discount(self, r: np.ndarray, t: np.ndarray) -> np.ndarray:
+        return r * t if self.compounding == "continuous" else t * np.log1p(r)
+
+    def _rate_from_log_discount(self, z: np.ndarray, t: np.ndarray) -> np.ndarray:
+        return z / t if self.compounding == "continuous" else np.expm1(z / t)
+
+    # ---------------- fitting ----------------
+
+    def _fit_cubic(self):
+        """Natural cubic spline: solve the tridiagonal system for the knot second derivatives"""
+        t, r = self.maturities, self.zero_rates
+        n = t.size
+        m = np.zeros(n)
+        if n > 2:
+            h = np.diff(t)
+            A = np.zeros((n - 2, n - 2))
+            idx = np.arange(n - 2)
+            A[idx, idx] = 2.0 * (h[:-1] + h[1:])
+            A[idx[1:], idx[:-1]] = h[1:-1]
+            A[idx[:-1], idx[1:]] = h[1:-1]
+            rhs = 6.0 * (np.diff(r[1:]) / h[1:] - np.diff(r[:-1]) / h[:-1])
+            m[1:-1] = np.linalg.solve(A, rhs)
+        self._m = m
+
+    def _fit_monotone_convex(self):
+        """Hagan & West (2006): instantaneous forwards at the knots, then g-function regions per segment"""
+        tk, fd = self._knots, self._fwd
+        n = fd.size
+        f = np.empty(n + 1)
+        if n == 1:
+            f[:] = fd[0]
+        else:
+            span = tk[2:] - tk[:-2]
+            f[1:-1] = (tk[1:-1] - tk[:-2]) / span * fd[1:] + (tk[2:] - tk[1:-1]) / span * fd[:-1]
+            f[0] = fd[0] - 0.5 * (f[1] - fd[0])
+            f[-1] = fd[-1] - 0.5 * (f[-2] - fd[-1])
+
+        g0 = f[:-1] - fd
+        g1 = f[1:] - fd
+        region = np.zeros(n, dtype=np.int8)  # 0: g == 0 on the segment
+        eta = np.zeros(n)
+        A = np.zeros(n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            same_sign = ((g0 >= 0) & (g1 >= 0)) | ((g0 <= 0) & (g1 <= 0))
+            r1 = ((g0 < 0) & (g1 >= -0.5 * g0) & (g1 <= -2.0 * g0)) | \
+                 ((g0 > 0) & (g1 <= -0.5 * g0) & (g1 >= -2.0 * g0))
+            r2 = ((g0 < 0) & (g1 > -2.0 * g0)) | ((g0 > 0) & (g1 < -2.0 * g0))
+            r3 = ((g0 > 0) & (g1 < 0) & (g1 > -0.5 * g0)) | ((g0 < 0) & (g1 > 0) & (g1 < -0.5 * g0))
+            r4 = same_sign & ~((g0 == 0) & (g1 == 0))
+            region[r1] = 1
+            region[r2] = 2
+            eta[r2] = ((g1 + 2.0 * g0) / (g1 - g0))[r2]
+            region[r3] = 3
+            eta[r3] = (3.0 * g1 / (g1 - g0))[r3]
+            region[r4] = 4
+            eta[r4] = (g1 / (g1 + g0))[r4]
+            A[r4] = (-g0 * g1 / (g0 + g1))[r4]
+        self._g0, self._g1, self._region, self._eta, self._A = g0, g1, region, eta, A
+
+    # ---------------- evaluation ----------------
+
+    def _segment(self, knots: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """Index i of the segment [knots[i], knots[i+1]] holding t (binary search)"""
+        return np.clip(np.searchsorted(knots, t, side="right") - 1, 0, knots.size - 2)
+
+    def _monotone_convex_integral(self, i: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """G(x) = integral over [0, x] of the segment's g-function"""
+        g0, g1, eta, A = self._g0[i], self._g1[i], self._eta[i], self._A[i]
+        reg = self._region[i]
+        G = np.zeros_like(x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = reg == 1
+            G[m] = (g0 * (x - 2 * x ** 2 + x ** 3) + g1 * (x ** 3 - x ** 2))[m]
+
+            m = reg == 2
+            tail = np.maximum(x - eta, 0.0)
+            G[m] = (g0 * x + (g1 - g0) * tail ** 3 / (3.0 * (1.0 - eta) ** 2))[m]
+
+            m = reg == 3
+            head = np.maximum(eta - x, 0.0)
+            G[m] = (g1 * x + (g0 - g1) * (eta ** 3 - head ** 3) / (3.0 * eta ** 2))[m]
+
+            m = reg == 4
+            tail = np.maximum(x - eta, 0.0)
+            left = np.where(eta > 0, (g0 - A) * (eta ** 3 - head ** 3) / (3.0 * eta ** 2), 0.0)
+            right = np.where(eta < 1, (g1 - A) * tail ** 3 / (3.0 * (1.0 - eta) ** 2), 0.0)
+            G[m] = (A * x + left + right)[m]
+        return G
+
+    def rates(self, maturities: ArrayLike) -> np.ndarray:
+        """Zero rates at `maturities` (any shape)"""
+        q = np.asarray(maturities, dtype=np.float64)
+        shape = q.shape
+        q = q.ravel()
+        t, r = self.maturities, self.zero_rates
+        if t.size == 1:
+            return np.full(shape, r[0])
+
+        # flat beyond the last pillar; the -ln(DF) schemes have their own knot at 0
+        tq = np.clip(q, t[0] if self.method in ("linear", "cubic") else 0.0, t[-1])
+
+        if self.method == "linear":
+            out = np.interp(tq, t, r)
+        elif self.method == "cubic":
+            i = self._segment(t, tq)
+            h = t[i + 1] - t[i]
+            a = (t[i + 1] - tq) / h
+            b = 1.0 - a
+            m = self._m
+            out = a * r[i] + b * r[i + 1] + ((a ** 3 - a) * m[i] + (b ** 3 - b) * m[i + 1]) * h * h / 6.0
+        else:
+            i = self._segment(self._knots, tq)
+            h = self._knots[i + 1] - self._knots[i]
+            x = (tq - self._knots[i]) / h
+            z = self._z[i] + h * x * self._fwd[i]
+            if self.method == "monotone_convex":
+                z = z + h * self._monotone_convex_integral(i, x)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out = np.where(tq > 0, self._rate_from_log_discount(z, tq), r[0])
+        return out.reshape(shape)
+
+    def discount_factors(self, maturities: ArrayLike) -> np.ndarray:
+        """Discount factors at `maturities` under the curve's compounding"""
+        q = np.asarray(maturities, dtype=np.float64)
+        return np.exp(-self._log_discount(self.rates(q), q))
+
+    def forward_rates(self, start: ArrayLike, end: ArrayLike) -> np.ndarray:
+        """Forward rates between `start` and `end`, in the curve's compounding"""
+        t1 = np.asarray(start, dtype=np.float64)
+        t2 = np.asarray(end, dtype=np.float64)
+        if np.any(t2 <= t1):
+            raise ValueError("End maturity must be greater than start maturity")
+        z1 = self._log_discount(self.rates(t1), t1)
+        z2 = self._log_discount(self.rates(t2), t2)
+        return self._rate_from_log_discount(z2 - z1, t2 - t1)
+
+    def rate(self, maturity: float) -> float:
+        """Scalar rates(); linear curves are evaluated without numpy, as np.interp does"""
+        if self.method != "linear":
+            return float(self.rates(maturity))
+        t, r = self._pillars
+        x = float(maturity)
+        if len(t) == 1:
+            return r[0]
+        if x != x:
+            return x
+        if x >= t[-1]:
+            return r[-1]
+        if x <= t[0]:
+            return r[0]
+        j = bisect_right(t, x) - 1
+        return (r[j + 1] - r[j]) / (t[j + 1] - t[j]) * (x - t[j]) + r[j]
+
+    def shifted(self, shift: ArrayLike) -> "CurveInterpolator":
+        """Same scheme over pillars moved by `shift` (scalar or per pillar)"""
+        return CurveInterpolator(self.maturities, self.zero_rates + np.asarray(shift, dtype=np.float64),
+                                 self.method, self.compounding)
+
@@ -0,0 +1,238 @@
+"""
+Monte Carlo Runner Module
+Chunked, multi-process execution for Monte Carlo simulations in EquiNova
+
+Simulations are split into fixed-size chunks, each with its own RNG stream
+spawned from one SeedSequence, so results are reproducible for a given seed
+and chunk size no matter how many workers run them. Workers send back
+mergeable aggregates (moments plus a fixed-bin histogram) rather than paths,
+so memory stays constant in the number of paths.
+"""
+
+import os
+import math
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# sim_fn(rng, n, *args) -> 1-D array of n per-path values; must be a module-level
+# function (picklable) when workers > 1
+SimFn = Callable[..., np.ndarray]
+
+
+@dataclass
+class ChunkStats:
+    """Mergeable aggregate of simulated values"""
+    lo: float
+    hi: float
+    bins: int
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    # bins + 2 slots: [underflow, bins..., overflow]
+    counts: np.ndarray = None
+    sums: np.ndarray = None
+    values: Optional[np.ndarray] = None  # raw values, only when requested
+
+    def __post_init__(self):
+        if self.counts is None:
+            self.counts = np.zeros(self.bins + 2, dtype=np.int64)
+            self.sums = np.zeros(self.bins + 2, dtype=np.float64)
+
+    @staticmethod
+    def _from_values(x: np.ndarray, lo: float, hi: float, bins: int, keep_values: bool) -> "ChunkStats":
+        s = ChunkStats(lo, hi, bins, n=x.size, mean=float(x.mean()),
+                       m2=float(((x - x.mean()) ** 2).sum()), min=float(x.min()), max=float(x.max()))
+        idx = np.clip(np.floor((x - lo) / (hi - lo) * bins).astype(np.int64) + 1, 0, bins + 1)
+        idx[x < lo] = 0
+        idx[x >= hi] = bins + 1
+        s.counts = np.bincount(idx, minlength=bins + 2)
+        s.sums = np.bincount(idx, weights=x, minlength=bins + 2)
+        if keep_values:
+            s.values = x
+        return s
+
+    def merge(self, other: "ChunkStats"):
+        """Chan et al. parallel update of mean/M2, plus histogram sums"""
+        if not other.n:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.counts += other.counts
+        self.sums += other.sums
+
+
+@dataclass
+class MCResult:
+    """Merged result of a chunked run"""
+    stats: ChunkStats
+    chunks: int
+    workers: int
+    seed_entropy: int
+    values: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def n(self) -> int:
+        return self.stats.n
+
+    @property
+    def mean(self) -> float:
+        return self.stats.mean
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.stats.m2 / (self.stats.n - 1)) if self.stats.n > 1 else 0.0
+
+    @property
+    def std_error(self) -> float:
+        return self.std / math.sqrt(self.stats.n) if self.stats.n else 0.0
+
+    def _bin_edges(self, i: int) -> Tuple[float, float]:
+        s = self.stats
+        if i == 0:
+            return s.min, min(s.lo, s.max)
+        if i == s.bins + 1:
+            return max(s.hi, s.min), s.max
+        width = (s.hi - s.lo) / s.bins
+        return s.lo + (i - 1) * width, s.lo + i * width
+
+    def quantile(self, q: float) -> float:
+        """Exact if values were kept, else interpolated within one histogram bin"""
+        if self.values is not None:
+            return float(np.quantile(self.values, q))
+        s = self.stats
+        target = q * s.n
+        cum = np.cumsum(s.counts)
+        i = int(np.searchsorted(cum, target, side="left"))
+        i = min(i, s.bins + 1)
+        below = cum[i - 1] if i > 0 else 0
+        a, b = self._bin_edges(i)
+        frac = (target - below) / s.counts[i] if s.counts[i] else 0.0
+        return float(min(max(a + frac * (b - a), s.min), s.max))
+
+    def tail_mean(self, q: float) -> float:
+        """Mean of the values at or below the q-quantile (lower-tail CVaR)"""
+        if self.values is not None:
+            v = self.values
+            return float(v[v <= np.quantile(v, q)].mean())
+        s = self.stats
+        target = max(q * s.n, 1.0)
+        cum = np.cumsum(s.counts)
+        i = int(min(np.searchsorted(cum, target, side="left"), s.bins + 1))
+        full = cum[i - 1] if i > 0 else 0
+        partial = target - full
+        total = s.sums[:i].sum() + (s.sums[i] / s.counts[i] * partial if s.counts[i] else 0.0)
+        return float(total / target)
+
+    def percentiles(self, pct=(1, 5, 25, 50, 75, 95, 99)) -> dict:
+        return {p: self.quantile(p / 100) for p in pct}
+
+
+# ---------------- worker side ----------------
+
+_worker_task: Optional[Tuple[SimFn, tuple]] = None
+
+
+def _init_worker(sim_fn: SimFn, args: tuple):
+    # the simulation context is shipped once per worker, not once per chunk
+    global _worker_task
+    _worker_task = (sim_fn, args)
+
+
+def _run_chunk(seed: np.random.SeedSequence, n: int, lo: float, hi: float, bins: int,
+               keep_values: bool) -> ChunkStats:
+    sim_fn, args = _worker_task
+    x = np.asarray(sim_fn(np.random.default_rng(seed), n, *args), dtype=np.float64).ravel()
+    return ChunkStats._from_values(x, lo, hi, bins, keep_values)
+
+
+def default_workers() -> int:
+    configured = int(os.getenv("EQUINOVA_MC_WORKERS", "0"))
+    if configured:
+        return configured
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_chunked(sim_fn: SimFn, n_paths: int, args: tuple = (), seed: Optional[int] = None,
+                workers: Optional[int] = 1, chunk_size: int = 20000, bins: int = 4096,
+                value_range: Optional[Tuple[float, float]] = None,
+                keep_values: bool = False) -> MCResult:
+    """
+    Run `sim_fn` over `n_paths` paths in chunks of `chunk_size`.
+
+    Args:
+        sim_fn: sim_fn(rng, n, *args) -> n per-path values
+        seed: root seed; chunk k always gets the k-th spawned stream
+        workers: processes to use (None = all cores / EQUINOVA_MC_WORKERS, 1 = in-process)
+        value_range: histogram range; if omitted the first chunk is run in-process
+            as a pilot and the range is set to its spread widened on both sides
+        keep_values: also return every value (memory grows with n_paths)
+
+    Returns:
+        MCResult with moments, quantile()/tail_mean() and optionally the values
+    """
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive")
+    root = np.random.SeedSequence(seed)
+    sizes = [min(chunk_size, n_paths - s) for s in range(0, n_paths, chunk_size)]
+    seeds = root.spawn(len(sizes))
+    workers = default_workers() if workers is None else max(1, int(workers))
+    workers = min(workers, len(sizes))
+
+    _init_worker(sim_fn, args)
+    first = None
+    if value_range is None:
+        pilot = np.asarray(sim_fn(np.random.default_rng(seeds[0]), sizes[0], *args), dtype=np.float64).ravel()
+        span = float(pilot.max() - pilot.min()) or max(abs(float(pilot.mean())), 1.0)
+        lo, hi = float(pilot.min()) - span, float(pilot.max()) + span
+        first = ChunkStats._from_values(pilot, lo, hi, bins, keep_values)
+    else:
+        lo, hi = value_range
+
+    total = ChunkStats(lo, hi, bins)
+    kept = {}
+
+    def absorb(k: int, stats: ChunkStats):
+        total.merge(stats)
+        if keep_values:
+            kept[k] = stats.values
+
+    if first is not None:
+        absorb(0, first)
+    pending = [(k, seeds[k], sizes[k]) for k in range(1 if first is not None else 0, len(sizes))]
+
+    if workers == 1 or len(pending) <= 1:
+        for k, ss, n in pending:
+            absorb(k, _run_chunk(ss, n, lo, hi, bins, keep_values))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(sim_fn, args)) as pool:
+            # bounded number of chunks in flight so memory does not grow with n_paths
+            in_flight = {}
+            for k, ss, n in pending:
+                in_flight[pool.submit(_run_chunk, ss, n, lo, hi, bins, keep_values)] = k
+                if len(in_flight) >= 2 * workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        absorb(in_flight.pop(f), f.result())
+            for f, k in in_flight.items():
+                absorb(k, f.result())
+
+    values = np.concatenate([kept[k] for k in sorted(kept)]) if keep_values else None
+    logger.debug(f"MC run: {total.n} paths, {len(sizes)} chunks, {workers} workers")
+    return MCResult(stats=total, chunks=len(sizes), workers=workers,
+                    seed_entropy=int(root.entropy), values=values)
@@ -6,6 +6,10 @@ Technical Indicators Module for EquiNova
 This module contains 10 essential technical analysis indicators commonly used in financial markets.
 Each indicator is implemented with proper error handling and documentation.
 
+Streaming updaters (StreamingSMA ... StreamingADX, IndicatorStream) advance the
+same indicators one bar at a time for one or many symbols, and
+calculate_indicators_batch computes them for a whole (bars, symbols) matrix.
+
 Author: EquiNova Corporation
 Version: 1.0.0
 """
@@ -435,6 +439,570 @@ def calculate_all_indicators(df: pd.DataFrame,
         return df
 
 
+# =============================================================================
+# Streaming indicators
+# =============================================================================
+#
+# The updaters below carry the state of the pandas window kernels used by
+# TechnicalIndicators (Kahan-compensated rolling sums, Welford rolling
+# variance, the ewm recursion) and advance it one bar at a time, so the value
+# after each update matches the batch result for that bar exactly. Every
+# updater accepts a scalar or a 1-D array with one entry per symbol; all
+# symbols then advance together in one set of array operations. The kernels
+# follow pandas 2.x, the range pyproject pins.
+
+
+def _as_float(x) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+def _out(x: np.ndarray):
+    # 0-d arrays come back as numpy scalars
+    return x[()] if x.ndim == 0 else x
+
+
+class _Window:
+    """Ring buffer of the last `size` values (NaN until filled)"""
+
+    def __init__(self, size: int, shape: tuple):
+        self.size = size
+        self.buf = np.full((size,) + shape, np.nan)
+        self.pos = 0
+        self.count = 0
+
+    def push(self, x: np.ndarray) -> np.ndarray:
+        """Store x and return the value that fell out of the window"""
+        evicted = self.buf[self.pos].copy()
+        self.buf[self.pos] = x
+        self.pos = (self.pos + 1) % self.size
+        self.count += 1
+        return evicted
+
+    def rows(self) -> np.ndarray:
+        """Window values oldest first, one contiguous row per symbol: shape (..., size)"""
+        ordered = np.concatenate((self.buf[self.pos:], self.buf[:self.pos]))
+        return np.ascontiguousarray(np.moveaxis(ordered, 0, -1))
+
+
+class _RollingMean:
+    """pandas roll_mean, one observation at a time"""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._values = None
+
+    def _init(self, shape: tuple):
+        self._values = _Window(self.window, shape)
+        self.nobs = np.zeros(shape, dtype=np.int64)
+        self.neg_ct = np.zeros(shape, dtype=np.int64)
+        self.same_ct = np.zeros(shape, dtype=np.int64)
+        self.sum_x = np.zeros(shape)
+        self.comp_add = np.zeros(shape)
+        self.comp_remove = np.zeros(shape)
+        self.prev = np.full(shape, np.nan)
+
+    def update(self, val: np.ndarray) -> np.ndarray:
+        if self._values is None:
+            self._init(val.shape)
+        old = self._values.push(val)
+
+        # remove the value leaving the window
+        obs = old == old
+        y = np.where(obs, -old, 0.0) - self.comp_remove
+        t = self.sum_x + y
+        self.comp_remove = np.where(obs, t - self.sum_x - y, self.comp_remove)
+        self.sum_x = np.where(obs, t, self.sum_x)
+        self.nobs -= obs
+        self.neg_ct -= obs & np.signbit(old)
+
+        # add the new one
+        obs = val == val
+        y = np.where(obs, val, 0.0) - self.comp_add
+        t = self.sum_x + y
+        self.comp_add = np.where(obs, t - self.sum_x - y, self.comp_add)
+        self.sum_x = np.where(obs, t, self.sum_x)
+        self.nobs += obs
+        self.neg_ct += obs & np.signbit(val)
+        self.same_ct = np.where(obs, np.where(val == self.prev, self.same_ct + 1, 1), self.same_ct)
+        self.prev = np.where(obs, val, self.prev)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = self.sum_x / self.nobs
+        result = np.select(
+            [self.same_ct >= self.nobs, (self.neg_ct == 0) & (result < 0), (self.neg_ct == self.nobs) & (result > 0)],
+            [self.prev, 0.0, 0.0], result)
+        return np.where((self.nobs >= self.min_periods) & (self.nobs > 0), result, np.nan)
+
+
+class _RollingStd:
+    """pandas roll_var (ddof=1) with the square root rolling std applies"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = None
+
+    def _init(self, shape: tuple):
+        self._values = _Window(self.window, shape)
+        self.nobs = np.zeros(shape)
+        self.same_ct = np.zeros(shape, dtype=np.int64)
+        self.mean_x = np.zeros(shape)
+        self.ssqdm_x = np.zeros(shape)
+        self.comp_add = np.zeros(shape)
+        self.comp_remove = np.zeros(shape)
+        self.prev = np.full(shape, np.nan)
+
+    def update(self, val: np.ndarray) -> np.ndarray:
+        if self._values is None:
+            self._init(val.shape)
+        old = self._values.push(val)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # remove
+            obs = old == old
+            nobs = self.nobs - obs
+            prev_mean = self.mean_x - self.comp_remove
+            y = old - self.comp_remove
+            t = y - self.mean_x
+            mean_x = self.mean_x - t / nobs
+            ssqdm_x = self.ssqdm_x - (old - prev_mean) * (old - mean_x)
+            live = obs & (nobs > 0)
+            self.comp_remove = np.where(live, t + self.mean_x - y, self.comp_remove)
+            self.mean_x = np.where(live, mean_x, np.where(obs, 0.0, self.mean_x))
+            self.ssqdm_x = np.where(live, ssqdm_x, np.where(obs, 0.0, self.ssqdm_x))
+            self.nobs = nobs
+
+            # add
+            obs = val == val
+            self.nobs = self.nobs + obs
+            self.same_ct = np.where(obs, np.where(val == self.prev, self.same_ct + 1, 1), self.same_ct)
+            self.prev = np.where(obs, val, self.prev)
+            prev_mean = self.mean_x - self.comp_add
+            y = val - self.comp_add
+            t = y - self.mean_x
+            comp = t + self.mean_x - y
+            mean_x = np.where(self.nobs > 0, self.mean_x + t / self.nobs, 0.0)
+            ssqdm_x = self.ssqdm_x + (val - prev_mean) * (val - mean_x)
+            self.comp_add = np.where(obs, comp, self.comp_add)
+            self.mean_x = np.where(obs, mean_x, self.mean_x)
+            self.ssqdm_x = np.where(obs, ssqdm_x, self.ssqdm_x)
+
+            # a window of identical values has zero variance
+            flat = (self.nobs == 1) | (self.same_ct >= self.nobs)
+            var = np.where(flat, 0.0, self.ssqdm_x / (self.nobs - 1))
+            var = np.where((self.nobs >= self.window) & (self.nobs > 1), var, np.nan)
+            std = np.sqrt(var)
+        return np.where(var < 0, 0.0, std)
+
+
+class _RollingExtreme:
+    """
+    Rolling max (or min) over a full window, as pandas roll_max/roll_min.
+
+    Bars are split into blocks of `window` (van Herk/Gil-Werman): a window
+    ending mid-block is the running extreme of the current block joined with a
+    suffix extreme of the previous one, and those suffixes are computed once
+    per block. An update is therefore amortised O(1) per symbol with a fixed
+    number of array operations. NaNs are skipped by the extremes; the result
+    is NaN until `window` bars have passed since the last one.
+    """
+
+    def __init__(self, window: int, highest: bool):
+        self.window = window
+        self._pick = np.fmax if highest else np.fmin
+        self._block = None
+
+    def update(self, val: np.ndarray) -> np.ndarray:
+        w = self.window
+        if self._block is None:
+            self._block = np.full((w,) + val.shape, np.nan)
+            self._suffix = np.full((w,) + val.shape, np.nan)
+            self._last_nan = np.full(val.shape, -w, dtype=np.int64)
+            self._bar = 0
+        bar = self._bar
+        k = bar % w
+        if k == 0:
+            # the finished block's suffix extremes cover the older part of the next windows
+            self._suffix = self._pick.accumulate(self._block[::-1], axis=0)[::-1]
+            self._running = val.copy()
+        else:
+            self._running = self._pick(self._running, val)
+        self._block[k] = val
+        self._last_nan = np.where(val == val, self._last_nan, bar)
+        self._bar += 1
+
+        result = self._running if k == w - 1 else self._pick(self._running, self._suffix[k + 1])
+        full = (bar + 1 >= w) & (bar - self._last_nan >= w)
+        return np.where(full, result, np.nan)
+
+
+class _EWMean:
+    """pandas ewm(span=...).mean() recursion, one observation at a time"""
+
+    def __init__(self, span: float, adjust: bool = True):
+        com = (span - 1) / 2.0
+        alpha = 1. / (1. + com)
+        self.old_wt_factor = 1. - alpha
+        self.new_wt = 1. if adjust else alpha
+        self.adjust = adjust
+        self.weighted = None
+
+    def update(self, cur: np.ndarray) -> np.ndarray:
+        obs = cur == cur
+        if self.weighted is None:
+            self.weighted = cur.copy()
+            self.nobs = obs.astype(np.int64)
+            self.old_wt = np.ones(cur.shape)
+            return np.where(self.nobs >= 1, self.weighted, np.nan)
+
+        self.nobs = self.nobs + obs
+        has = self.weighted == self.weighted
+        self.old_wt = np.where(has, self.old_wt * self.old_wt_factor, self.old_wt)
+        blend = (self.old_wt * self.weighted + self.new_wt * cur) / (self.old_wt + self.new_wt)
+        step = has & obs
+        self.weighted = np.where(step & (self.weighted != cur), blend,
+                                 np.where(~has & obs, cur, self.weighted))
+        self.old_wt = np.where(step, self.old_wt + self.new_wt if self.adjust else 1., self.old_wt)
+        return np.where(self.nobs >= 1, self.weighted, np.nan)
+
+
+class _TrueRange:
+    """True range; the first bar has no previous close and uses high - low"""
+
+    def __init__(self):
+        self.prev_close = None
+
+    def update(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        tr = high - low
+        if self.prev_close is not None:
+            tr = np.fmax(np.fmax(tr, np.abs(high - self.prev_close)), np.abs(low - self.prev_close))
+        self.prev_close = close
+        return tr
+
+
+class StreamingSMA:
+    """Tick-by-tick TechnicalIndicators.sma"""
+
+    def __init__(self, period: int = 20):
+        self._mean = _RollingMean(period)
+
+    def update(self, price):
+        return _out(self._mean.update(_as_float(price)))
+
+
+class StreamingEMA:
+    """Tick-by-tick TechnicalIndicators.ema"""
+
+    def __init__(self, period: int = 20):
+        self._ema = _EWMean(period, adjust=False)
+
+    def update(self, price):
+        return _out(self._ema.update(_as_float(price)))
+
+
+class StreamingRSI:
+    """Tick-by-tick TechnicalIndicators.rsi"""
+
+    def __init__(self, period: int = 14):
+        self._gain = _RollingMean(period)
+        self._loss = _RollingMean(period)
+        self._prev = None
+
+    def update(self, price):
+        price = _as_float(price)
+        delta = price - self._prev if self._prev is not None else np.full(price.shape, np.nan)
+        self._prev = price
+        gain = self._gain.update(np.where(delta > 0, delta, 0.0))
+        loss = self._loss.update(-np.where(delta < 0, delta, 0.0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _out(100 - (100 / (1 + gain / loss)))
+
+
+class StreamingMACD:
+    """Tick-by-tick TechnicalIndicators.macd; update() returns (MACD line, Signal line, Histogram)"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = _EWMean(fast)
+        self._slow = _EWMean(slow)
+        self._signal = _EWMean(signal)
+
+    def update(self, price):
+        price = _as_float(price)
+        macd_line = self._fast.update(price) - self._slow.update(price)
+        signal_line = self._signal.update(macd_line)
+        return _out(macd_line), _out(signal_line), _out(macd_line - signal_line)
+
+
+class StreamingBollingerBands:
+    """Tick-by-tick TechnicalIndicators.bollinger_bands; update() returns (Upper, Middle, Lower)"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2):
+        self.std_dev = std_dev
+        self._mean = _RollingMean(period)
+        self._std = _RollingStd(period)
+
+    def update(self, price):
+        price = _as_float(price)
+        middle = self._mean.update(price)
+        std = self._std.update(price)
+        return _out(middle + (std * self.std_dev)), _out(middle), _out(middle - (std * self.std_dev))
+
+
+class StreamingStochastic:
+    """Tick-by-tick TechnicalIndicators.stochastic_oscillator; update() returns (%K, %D)"""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self._low = _RollingExtreme(k_period, highest=False)
+        self._high = _RollingExtreme(k_period, highest=True)
+        self._d = _RollingMean(d_period)
+
+    def update(self, high, low, close):
+        lowest_low = self._low.update(_as_float(low))
+        highest_high = self._high.update(_as_float(high))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_percent = 100 * ((_as_float(close) - lowest_low) / (highest_high - lowest_low))
+        return _out(k_percent), _out(self._d.update(k_percent))
+
+
+class StreamingWilliamsR:
+    """Tick-by-tick TechnicalIndicators.williams_r"""
+
+    def __init__(self, period: int = 14):
+        self._low = _RollingExtreme(period, highest=False)
+        self._high = _RollingExtreme(period, highest=True)
+
+    def update(self, high, low, close):
+        lowest_low = self._low.update(_as_float(low))
+        highest_high = self._high.update(_as_float(high))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _out(-100 * ((highest_high - _as_float(close)) / (highest_high - lowest_low)))
+
+
+class StreamingATR:
+    """Tick-by-tick TechnicalIndicators.atr"""
+
+    def __init__(self, period: int = 14):
+        self._tr = _TrueRange()
+        self._mean = _RollingMean(period)
+
+    def update(self, high, low, close):
+        return _out(self._mean.update(self._tr.update(_as_float(high), _as_float(low), _as_float(close))))
+
+
+class StreamingCCI:
+    """
+    Tick-by-tick TechnicalIndicators.cci.
+
+    The mean deviation has no running form, so each update costs O(period)
+    over the buffered window; still independent of the history length.
+    """
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self._mean = _RollingMean(period)
+        self._window = None
+
+    def update(self, high, low, close):
+        typical_price = (_as_float(high) + _as_float(low) + _as_float(close)) / 3
+        if self._window is None:
+            self._window = _Window(self.period, typical_price.shape)
+        self._window.push(typical_price)
+        sma_tp = self._mean.update(typical_price)
+        if self._window.count < self.period:
+            return _out(np.full(typical_price.shape, np.nan))
+        rows = self._window.rows()
+        centre = rows.sum(axis=-1) / self.period
+        mean_deviation = np.abs(rows - centre[..., None]).sum(axis=-1) / self.period
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _out((typical_price - sma_tp) / (0.015 * mean_deviation))
+
+
+class StreamingADX:
+    """Tick-by-tick TechnicalIndicators.adx; update() returns (ADX, +DI, -DI)"""
+
+    def __init__(self, period: int = 14):
+        self._tr = _TrueRange()
+        self._atr = _EWMean(period)
+        self._plus = _EWMean(period)
+        self._minus = _EWMean(period)
+        self._adx = _EWMean(period)
+        self._prev_high = None
+        self._prev_low = None
+
+    def update(self, high, low, close):
+        high, low, close = _as_float(high), _as_float(low), _as_float(close)
+        tr = self._tr.update(high, low, close)
+        if self._prev_high is None:
+            up_move = down_move = np.full(high.shape, np.nan)
+        else:
+            up_move = high - self._prev_high
+            down_move = self._prev_low - low
+        self._prev_high, self._prev_low = high, low
+
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+        atr = self._atr.update(tr)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = 100 * (self._plus.update(plus_dm) / atr)
+            minus_di = 100 * (self._minus.update(minus_dm) / atr)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        return _out(self._adx.update(dx)), _out(plus_di), _out(minus_di)
+
+
+class IndicatorStream:
+    """
+    All indicators of calculate_all_indicators, updated one bar at a time.
+
+    Feed close prices (and high/low for the OHLC indicators) as scalars for
+    one symbol or as arrays with one entry per symbol; update() returns the
+    latest value of every indicator under the column names used by
+    calculate_all_indicators.
+    """
+
+    def __init__(self, ohlc: bool = True):
+        self.ohlc = ohlc
+        self.sma = StreamingSMA(20)
+        self.ema = StreamingEMA(20)
+        self.rsi = StreamingRSI(14)
+        self.macd = StreamingMACD()
+        self.bollinger = StreamingBollingerBands()
+        if ohlc:
+            self.stochastic = StreamingStochastic()
+            self.williams_r = StreamingWilliamsR()
+            self.atr = StreamingATR()
+            self.cci = StreamingCCI()
+            self.adx = StreamingADX()
+
+    @classmethod
+    def from_history(cls, close, high=None, low=None) -> 'IndicatorStream':
+        """Replay history (bars along the first axis) so the stream continues where it ends"""
+        stream = cls(ohlc=high is not None and low is not None)
+        for i in range(len(close)):
+            stream.update(close[i], high[i] if stream.ohlc else None, low[i] if stream.ohlc else None)
+        return stream
+
+    def update(self, close, high=None, low=None) -> dict:
+        """
+        Advance every indicator by one bar.
+        
+        Args:
+            close: Closing price(s) of the new bar
+            high: High price(s), required when the stream tracks OHLC indicators
+            low: Low price(s), required when the stream tracks OHLC indicators
+            
+        Returns:
+            dict: Indicator name -> latest value(s)
+        """
+        values = {
+            'SMA_20': self.sma.update(close),
+            'EMA_20': self.ema.update(close),
+            'RSI_14': self.rsi.update(close),
+        }
+        values['MACD'], values['MACD_Signal'], values['MACD_Histogram'] = self.macd.update(close)
+        values['BB_Upper'], values['BB_Middle'], values['BB_Lower'] = self.bollinger.update(close)
+
+        if self.ohlc:
+            if high is None or low is None:
+                raise ValueError("high and low are required for OHLC indicators")
+            values['Stoch_K'], values['Stoch_D'] = self.stochastic.update(high, low, close)
+            values['Williams_R'] = self.williams_r.update(high, low, close)
+            values['ATR'] = self.atr.update(high, low, close)
+            values['CCI'] = self.cci.update(high, low, close)
+            values['ADX'], values['Plus_DI'], values['Minus_DI'] = self.adx.update(high, low, close)
+        return values
+
+
+def calculate_indicators_batch(close: np.ndarray,
+                               high: Optional[np.ndarray] = None,
+                               low: Optional[np.ndarray] = None) -> dict:
+    """
+    Calculate all indicators for many symbols at once.
+    
+    Each indicator is one column-wise pandas window pass over the whole
+    (bars, symbols) matrix; per-column results are identical to the
+    single-series TechnicalIndicators methods.
+    
+    Args:
+        close: Closing prices, shape (bars, symbols)
+        high: High prices, same shape (optional)
+        low: Low prices, same shape (optional)
+        
+    Returns:
+        dict: Column name of calculate_all_indicators -> (bars, symbols) array
+    """
+    close_df = pd.DataFrame(_as_float(close), copy=False)
+    if close_df.ndim != 2:
+        raise ValueError("close must be a 2-D (bars, symbols) array")
+
+    def ewm_mean(frame: pd.DataFrame, span: int, adjust: bool = True) -> pd.DataFrame:
+        return frame.ewm(span=span, adjust=adjust).mean()
+
+    out = {
+        'SMA_20': close_df.rolling(window=20, min_periods=20).mean(),
+        'EMA_20': ewm_mean(close_df, 20, adjust=False),
+    }
+
+    delta = close_df.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    out['RSI_14'] = 100 - (100 / (1 + gain / loss))
+
+    macd_line = ewm_mean(close_df, 12) - ewm_mean(close_df, 26)
+    signal_line = ewm_mean(macd_line, 9)
+    out['MACD'], out['MACD_Signal'], out['MACD_Histogram'] = macd_line, signal_line, macd_line - signal_line
+
+    middle = close_df.rolling(window=20).mean()
+    std = close_df.rolling(window=20).std()
+    out['BB_Upper'], out['BB_Middle'], out['BB_Lower'] = middle + (std * 2), middle, middle - (std * 2)
+
+    if high is not None and low is not None:
+        c = close_df.to_numpy()
+        high_df = pd.DataFrame(_as_float(high), copy=False)
+        low_df = pd.DataFrame(_as_float(low), copy=False)
+        h, l = high_df.to_numpy(), low_df.to_numpy()
+
+        lowest_low = low_df.rolling(window=14).min().to_numpy()
+        highest_high = high_df.rolling(window=14).max().to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stoch_k = 100 * ((c - lowest_low) / (highest_high - lowest_low))
+            out['Stoch_K'] = stoch_k
+            out['Stoch_D'] = pd.DataFrame(stoch_k, copy=False).rolling(window=3).mean()
+            out['Williams_R'] = -100 * ((highest_high - c) / (highest_high - lowest_low))
+
+        prev_close = np.vstack((np.full((1, c.shape[1]), np.nan), c[:-1]))
+        tr = np.fmax(np.fmax(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
+        tr_df = pd.DataFrame(tr, copy=False)
+        out['ATR'] = tr_df.rolling(window=14).mean()
+
+        # CCI: rolling mean deviation over contiguous windows, a block of bars at a time
+        typical_price = (h + l + c) / 3
+        sma_tp = pd.DataFrame(typical_price, copy=False).rolling(window=20).mean().to_numpy()
+        mean_deviation = np.full(typical_price.shape, np.nan)
+        if len(typical_price) >= 20:
+            windows = np.lib.stride_tricks.sliding_window_view(typical_price, 20, axis=0)
+            step = max(1, 4_000_000 // max(1, windows[0].size))
+            for s in range(0, len(windows), step):
+                rows = np.ascontiguousarray(windows[s:s + step])
+                centre = rows.sum(axis=-1) / 20
+                mean_deviation[19 + s:19 + s + len(rows)] = np.abs(rows - centre[..., None]).sum(axis=-1) / 20
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['CCI'] = (typical_price - sma_tp) / (0.015 * mean_deviation)
+
+        up_move = np.vstack((np.full((1, h.shape[1]), np.nan), h[1:] - h[:-1]))
+        down_move = np.vstack((np.full((1, l.shape[1]), np.nan), l[:-1] - l[1:]))
+        plus_dm = pd.DataFrame(np.where((up_move > down_move) & (up_move > 0), up_move, 0.0), copy=False)
+        minus_dm = pd.DataFrame(np.where((down_move > up_move) & (down_move > 0), down_move, 0.0), copy=False)
+        atr = ewm_mean(tr_df, 14)
+        plus_di = 100 * (ewm_mean(plus_dm, 14) / atr)
+        minus_di = 100 * (ewm_mean(minus_dm, 14) / atr)
+        dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di)
+        out['ADX'], out['Plus_DI'], out['Minus_DI'] = ewm_mean(dx, 14), plus_di, minus_di
+
+    return {name: values.to_numpy() if isinstance(values, pd.DataFrame) else values
+            for name, values in out.items()}
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Create sample data for testing
@@ -7,7 +7,6 @@ import threading
 import time
 import requests
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
 
 # Import new logging system
@@ -18,6 +17,7 @@ from equinova_terminal.utils.Logging.logger import (
 # Try to import yfinance, fallback if not available
 try:
     import yfinance as yf
+    from equinova_terminal.utils.quote_hub import get_quote_hub
 
     YFINANCE_AVAILABLE = True
     info("yfinance library loaded successfully")
@@ -120,97 +120,46 @@ class DashboardTab(BaseTab):
 
     @monitor_performance
     def get_stock_data_optimized(self, symbols: List[str], timeout: int = 10) -> Dict[str, Dict[str, Any]]:
-        """Optimized stock data fetch using yfinance history method and concurrent processing"""
+        """Stock data from the shared quote hub: one bulk fetch, coalesced with other tabs"""
         if not YFINANCE_AVAILABLE:
             debug("yfinance not available, using fallback data")
             return self.get_fallback_stock_data(symbols)
 
         result = {}
+        try:
+            with logger.operation("bulk_stock_fetch"):
+                info(f"Fetching stock data for {len(symbols)} symbols")
+                quotes = get_quote_hub().get_quotes(symbols)
+
+                successful_fetches = 0
+                failed_fetches = 0
+                for symbol in symbols:
+                    q = quotes.get(symbol)
+                    if q is None or q.price is None:
+                        warning(f"Insufficient data for {symbol}, using fallback")
+                        result[symbol] = self.get_fallback_stock_data([symbol])[symbol]
+                        failed_fetches += 1
+                        continue
 
-        def fetch_single_stock(symbol: str) -> tuple[str, Dict[str, Any]]:
-            """Fetch data for a single stock symbol"""
-            try:
-                # Use Ticker.history() instead of yf.download() for better performance
-                ticker = yf.Ticker(symbol)
-
-                # Get 5 days of data to ensure we have enough for comparison
-                hist = ticker.history(period="5d", interval="1d", timeout=timeout)
-
-                if hist.empty or len(hist) < 2:
-                    warning(f"Insufficient data for {symbol}, using fallback")
-                    return symbol, self.get_fallback_stock_data([symbol])[symbol]
-
-                # Get the most recent data
-                current_data = hist.iloc[-1]
-                prev_data = hist.iloc[-2]
-
-                current_price = self.safe_float_conversion(current_data['Close'])
-                prev_price = self.safe_float_conversion(prev_data['Close'])
-                volume = self.safe_int_conversion(current_data['Volume'])
-                high = self.safe_float_conversion(current_data['High'])
-                low = self.safe_float_conversion(current_data['Low'])
-                open_price = self.safe_float_conversion(current_data['Open'])
-
-                change_val = current_price - prev_price
-                change_pct = (change_val / prev_price) * 100 if prev_price != 0 else 0
-
-                stock_data = {
-                    "price": round(current_price, 2),
-                    "change_pct": round(change_pct, 2),
-                    "change_val": round(change_val, 2),
-                    "volume": volume,
-                    "high": round(high, 2),
-                    "low": round(low, 2),
-                    "open": round(open_price, 2)
-                }
-
-                debug(f"Successfully fetched data for {symbol}",
-                      context={'price': current_price, 'change_pct': change_pct})
-
-                return symbol, stock_data
-
-            except Exception as e:
-                warning(f"Error fetching data for {symbol}", context={'error': str(e)})
-                return symbol, self.get_fallback_stock_data([symbol])[symbol]
+                    result[symbol] = {
+                        "price": round(q.price, 2),
+                        "change_pct": round(q.change_pct, 2),
+                        "change_val": round(q.change, 2),
+                        "volume": q.volume,
+                        "high": round(q.high, 2),
+                        "low": round(q.low, 2),
+                        "open": round(q.open, 2)
+                    }
+                    successful_fetches += 1
 
-        # Use ThreadPoolExecutor for concurrent fetching
-        try:
-            with logger.operation("concurrent_stock_fetch"):
-                info(f"Fetching stock data for {len(symbols)} symbols concurrently")
-
-                with ThreadPoolExecutor(max_workers=min(10, len(symbols))) as executor:
-                    # Submit all tasks
-                    future_to_symbol = {executor.submit(fetch_single_stock, symbol): symbol
-                                        for symbol in symbols}
-
-                    # Collect results as they complete
-                    successful_fetches = 0
-                    failed_fetches = 0
-
-                    for future in as_completed(future_to_symbol, timeout=timeout + 5):
-                        try:
-                            symbol, data = future.result(timeout=5)
-                            result[symbol] = data
-                            successful_fetches += 1
-                        except Exception as e:
-                            symbol = future_to_symbol[future]
-                            error(f"Failed to get data for {symbol}", context={'error': str(e)})
-                            result[symbol] = self.get_fallback_stock_data([symbol])[symbol]
-                            failed_fetches += 1
-
-                info("Concurrent stock fetch completed",
+                info("Bulk stock fetch completed",
                      context={'successful': successful_fetches, 'failed': failed_fetches,
-                              'success_rate': f"{(successful_fetches / (successful_fetches + failed_fetches) * 100):.1f}%"})
+                              'success_rate': f"{(successful_fetches / max(1, len(symbols)) * 100):.1f}%"})
 
         except Exception as e:
-            error("Error in concurrent stock data fetch", context={'error': str(e)}, exc_info=True)
+            error("Error in bulk stock data fetch", context={'error': str(e)}, exc_info=True)
             return self.get_fallback_stock_data(symbols)
 
-        # Ensure all symbols have data
-        for symbol in symbols:
-            if symbol not in result:
-                result[symbol] = self.get_fallback_stock_data([symbol])[symbol]
-
         return result
 
     def get_fallback_stock_data(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
@@ -255,7 +204,7 @@ class DashboardTab(BaseTab):
 
     @monitor_performance
     def get_indices_data_optimized(self, timeout: int = 10) -> Dict[str, Dict[str, float]]:
-        """Optimized index data fetch with better error handling"""
+        """Index data from the shared quote hub, with per-index fallback"""
         if not YFINANCE_AVAILABLE:
             debug("yfinance not available, using fallback indices data")
             return self.get_fallback_indices_data()
@@ -264,62 +213,34 @@ class DashboardTab(BaseTab):
         names = ["S&P 500", "DOW JONES", "NASDAQ", "FTSE 100", "DAX", "NIKKEI 225"]
         result = {}
 
-        def fetch_single_index(symbol: str, name: str) -> tuple[str, Dict[str, float]]:
-            """Fetch data for a single index"""
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="5d", interval="1d", timeout=timeout)
-
-                if hist.empty or len(hist) < 2:
-                    warning(f"Insufficient data for index {name}", context={'symbol': symbol})
-                    fallback = self.get_fallback_indices_data()
-                    return name, fallback[name]
-
-                current_value = self.safe_float_conversion(hist['Close'].iloc[-1])
-                prev_value = self.safe_float_conversion(hist['Close'].iloc[-2])
-                change_pct = ((current_value - prev_value) / prev_value) * 100 if prev_value != 0 else 0
-
-                debug(f"Successfully fetched index data for {name}",
-                      context={'value': current_value, 'change': change_pct})
-
-                return name, {
-                    "value": round(current_value, 2),
-                    "change": round(change_pct, 2)
-                }
-
-            except Exception as e:
-                error(f"Error fetching index {name}", context={'symbol': symbol, 'error': str(e)})
-                fallback = self.get_fallback_indices_data()
-                return name, fallback[name]
-
         try:
-            with logger.operation("concurrent_indices_fetch"):
-                info(f"Fetching indices data concurrently")
-
-                with ThreadPoolExecutor(max_workers=6) as executor:
-                    future_to_name = {executor.submit(fetch_single_index, symbol, name): name
-                                      for symbol, name in zip(symbols, names)}
-
-                    successful_fetches = 0
-                    failed_fetches = 0
-
-                    for future in as_completed(future_to_name, timeout=timeout + 5):
-                        try:
-                            name, data = future.result(timeout=5)
-                            result[name] = data
-                            successful_fetches += 1
-                        except Exception as e:
-                            name = future_to_name[future]
-                            error(f"Failed to get index data for {name}", context={'error': str(e)})
-                            fallback = self.get_fallback_indices_data()
-                            result[name] = fallback[name]
-                            failed_fetches += 1
+            with logger.operation("bulk_indices_fetch"):
+                info(f"Fetching indices data")
+                quotes = get_quote_hub().get_quotes(symbols, fields=("price", "change_pct"))
+
+                successful_fetches = 0
+                failed_fetches = 0
+                fallback = None
+                for symbol, name in zip(symbols, names):
+                    q = quotes.get(symbol)
+                    if q is None or q.price is None:
+                        warning(f"Insufficient data for index {name}", context={'symbol': symbol})
+                        fallback = fallback or self.get_fallback_indices_data()
+                        result[name] = fallback[name]
+                        failed_fetches += 1
+                        continue
+
+                    result[name] = {
+                        "value": round(q.price, 2),
+                        "change": round(q.change_pct, 2)
+                    }
+                    successful_fetches += 1
 
                 info("Indices data fetch completed",
                      context={'successful': successful_fetches, 'failed': failed_fetches})
 
         except Exception as e:
-            error("Error in concurrent index data fetch", context={'error': str(e)}, exc_info=True)
+            error("Error in index data fetch", context={'error': str(e)}, exc_info=True)
             return self.get_fallback_indices_data()
 
         return result
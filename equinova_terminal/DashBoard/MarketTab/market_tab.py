@@ -17,6 +17,7 @@ from equinova_terminal.utils.Logging.logger import (
 # Try to import yfinance with proper error handling
 try:
     import yfinance as yf
+    from equinova_terminal.utils.quote_hub import get_quote_hub, SESSION_FIELDS, TREND_FIELDS
 
     YFINANCE_AVAILABLE = True
     info("yfinance library loaded successfully", module="MarketTab")
@@ -220,94 +221,43 @@ class MarketTab(BaseTab):
         return result
 
     def get_real_stock_data_batch(self, symbols: List[str], timeout: int = 10) -> Dict[str, Dict[str, Any]]:
-        """Get real stock data using yfinance - OPTIMIZED to reduce API calls"""
+        """Get real stock data from the shared quote hub (bulk, coalesced, cached)"""
         if not YFINANCE_AVAILABLE:
             return self.get_fallback_regional_data(symbols)
 
         try:
-            # Use yfinance batch download for efficiency - ONE API CALL for all symbols
-            symbols_str = " ".join(symbols)
-
-            try:
-                # Single batch request instead of individual requests
-                data = yf.download(symbols_str, period="30d", interval="1d",
-                                   group_by='ticker', auto_adjust=True,
-                                   prepost=True, threads=True, timeout=timeout)
-
-                result = {}
-                successful_fetches = 0
-
-                for symbol in symbols:
-                    try:
-                        if len(symbols) == 1:
-                            symbol_data = data
-                        else:
-                            symbol_data = data[symbol] if symbol in data.columns.get_level_values(0) else None
-
-                        if symbol_data is None or symbol_data.empty:
-                            # Use fallback for this symbol
-                            fallback = self.get_fallback_regional_data([symbol])
-                            result[symbol] = fallback[symbol]
-                            continue
-
-                        # Extract latest price data
-                        current_price = float(symbol_data['Close'].iloc[-1])
-                        volume = int(symbol_data['Volume'].iloc[-1]) if 'Volume' in symbol_data.columns else 0
-                        high = float(symbol_data['High'].iloc[-1])
-                        low = float(symbol_data['Low'].iloc[-1])
-
-                        # Calculate changes
-                        prev_price = float(symbol_data['Close'].iloc[-2]) if len(symbol_data) >= 2 else current_price
-                        change_val = current_price - prev_price
-                        change_pct_1d = (change_val / prev_price) * 100 if prev_price != 0 else 0
-
-                        # Calculate 7D and 30D changes
-                        change_pct_7d = 0.0
-                        if len(symbol_data) >= 7:
-                            price_7d_ago = float(symbol_data['Close'].iloc[-7])
-                            change_pct_7d = ((
-                                                         current_price - price_7d_ago) / price_7d_ago) * 100 if price_7d_ago != 0 else 0
-
-                        change_pct_30d = 0.0
-                        if len(symbol_data) >= 30:
-                            price_30d_ago = float(symbol_data['Close'].iloc[-30])
-                            change_pct_30d = ((
-                                                          current_price - price_30d_ago) / price_30d_ago) * 100 if price_30d_ago != 0 else 0
-                        elif len(symbol_data) > 1:
-                            price_start = float(symbol_data['Close'].iloc[0])
-                            change_pct_30d = ((
-                                                          current_price - price_start) / price_start) * 100 if price_start != 0 else 0
-
-                        result[symbol] = {
-                            "price": round(max(0, current_price), 2),
-                            "change_1d": round(change_val, 2),
-                            "change_percent_1d": round(change_pct_1d, 2),
-                            "change_percent_7d": round(change_pct_7d, 2),
-                            "change_percent_30d": round(change_pct_30d, 2),
-                            "volume": max(0, volume),
-                            "high": round(max(current_price, high), 2),
-                            "low": round(min(current_price, low), 2)
-                        }
-                        successful_fetches += 1
-
-                    except Exception:
-                        # Use fallback for failed symbols
-                        fallback = self.get_fallback_regional_data([symbol])
-                        result[symbol] = fallback[symbol]
+            quotes = get_quote_hub().get_quotes(symbols, fields=SESSION_FIELDS + TREND_FIELDS)
+        except Exception:
+            # If the hub fetch fails, use fallback for all symbols
+            error("Error in stock data fetch", module="MarketTab")
+            return self.get_fallback_regional_data(symbols)
 
-                if successful_fetches > 0:
-                    info(f"Successfully fetched real data for {successful_fetches}/{len(symbols)} symbols",
-                         module="MarketTab")
+        result = {}
+        successful_fetches = 0
+        for symbol in symbols:
+            q = quotes.get(symbol)
+            if q is None or q.price is None:
+                # Use fallback for this symbol
+                result[symbol] = self.get_fallback_regional_data([symbol])[symbol]
+                continue
 
-                return result
+            result[symbol] = {
+                "price": round(max(0, q.price), 2),
+                "change_1d": round(q.change, 2),
+                "change_percent_1d": round(q.change_pct, 2),
+                "change_percent_7d": round(q.change_pct_7d or 0.0, 2),
+                "change_percent_30d": round(q.change_pct_30d or 0.0, 2),
+                "volume": max(0, q.volume),
+                "high": round(max(q.price, q.high), 2),
+                "low": round(min(q.price, q.low), 2)
+            }
+            successful_fetches += 1
 
-            except Exception:
-                # If batch download fails, use fallback for all symbols
-                return self.get_fallback_regional_data(symbols)
+        if successful_fetches > 0:
+            info(f"Successfully fetched real data for {successful_fetches}/{len(symbols)} symbols",
+                 module="MarketTab")
 
-        except Exception as e:
-            error("Error in stock data fetch", module="MarketTab")
-            return self.get_fallback_regional_data(symbols)
+        return result
 
     def should_update_real_data(self) -> bool:
         """Check if real data should be updated (10-minute interval)"""
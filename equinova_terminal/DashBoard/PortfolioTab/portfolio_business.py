@@ -12,8 +12,7 @@ import io
 from collections import defaultdict, deque
 from tkinter import filedialog
 import tkinter as tk
-import yfinance as yf
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from equinova_terminal.utils.quote_hub import get_quote_hub
 import requests
 from functools import lru_cache
 from pathlib import Path
@@ -140,105 +139,41 @@ class PortfolioBusinessLogic:
 
     @monitor_performance
     def _fetch_prices_batch(self, symbols):
-        """Fetch prices for a batch of symbols - optimized"""
-        max_workers = min(10, len(symbols))  # Adaptive worker count
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit fetch tasks
-            future_to_symbol = {
-                executor.submit(self._fetch_single_price, symbol): symbol
-                for symbol in symbols
-            }
-
-            # Collect results with timeout
-            for future in as_completed(future_to_symbol, timeout=60):
-                symbol = future_to_symbol[future]
-                try:
-                    price = future.result(timeout=30)
-                    if price is not None:
-                        self.price_cache[symbol] = price
-                        self.last_price_update[symbol] = datetime.datetime.now()
-                        self.price_fetch_errors.pop(symbol, None)  # Clear any previous errors
-                        logger.debug(f"Price updated: {symbol} = ${price:.2f}")
-                    else:
-                        self.price_fetch_errors[symbol] = "No price data available"
-                        logger.warning(f"No price data available for {symbol}")
-
-                except Exception as e:
-                    self.price_fetch_errors[symbol] = str(e)
-                    logger.error(f"Error fetching price for {symbol}: {e}")
-
-                # Small delay to avoid overwhelming the API
-                time.sleep(0.1)
-
-    def _fetch_single_price(self, symbol):
-        """Fetch price and daily change data for a single symbol using yfinance - optimized"""
-        try:
-            # Create ticker object
-            ticker = yf.Ticker(symbol)
-
-            # Get current data with timeout
-            info = ticker.info
-
-            # Try different price fields in order of preference
-            price_fields = [
-                'regularMarketPrice',
-                'currentPrice',
-                'previousClose',
-                'regularMarketPreviousClose'
-            ]
-
-            current_price = None
-            previous_close = None
-
-            # Get current price
-            for field in price_fields:
-                if field in info and info[field] is not None:
-                    current_price = float(info[field])
-                    if current_price > 0:  # Valid price
-                        break
-
-            # Get previous close
-            prev_close_fields = ['regularMarketPreviousClose', 'previousClose']
-            for field in prev_close_fields:
-                if field in info and info[field] is not None:
-                    previous_close = float(info[field])
-                    if previous_close > 0:
-                        break
-
-            # If we couldn't get from info, try historical data
-            if current_price is None or previous_close is None:
-                hist = ticker.history(period="2d", interval="1d")
-                if not hist.empty and len(hist) >= 2:
-                    if current_price is None:
-                        current_price = float(hist['Close'].iloc[-1])
-                    if previous_close is None:
-                        previous_close = float(hist['Close'].iloc[-2])
-                elif not hist.empty:
-                    if current_price is None:
-                        current_price = float(hist['Close'].iloc[-1])
-                    if previous_close is None:
-                        previous_close = current_price  # Use same price as fallback
-
-            # Calculate daily change
-            if current_price is not None and previous_close is not None and previous_close > 0:
-                daily_change = current_price - previous_close
-                daily_change_pct = (daily_change / previous_close) * 100
-
-                # Store in caches
-                self.previous_close_cache[symbol] = previous_close
-                self.daily_change_cache[symbol] = {
-                    'change': daily_change,
-                    'change_pct': daily_change_pct
-                }
-
-                return current_price
-
-            return current_price
-
-        except Exception as e:
-            logger.error(f"Error fetching price for {symbol}: {e}")
-            return None
+        """
+        Refresh last price and previous close for all symbols in bulk through
+        the shared quote hub. Only values that changed are written back; returns
+        the symbols whose cached figures moved.
+        """
+        hub = get_quote_hub()
+        quotes = hub.get_quotes(symbols, fields=("price", "previous_close", "change", "change_pct"))
+        now = datetime.datetime.now()
+        changed = set()
+
+        for symbol in symbols:
+            quote = quotes.get(symbol)
+            if quote is None or not quote.price or quote.price <= 0:
+                self.price_fetch_errors[symbol] = hub.errors.get(symbol, "No price data available")
+                logger.warning(f"No price data available for {symbol}")
+                continue
+
+            self.last_price_update[symbol] = now
+            self.price_fetch_errors.pop(symbol, None)  # Clear any previous errors
+
+            if self.price_cache.get(symbol) != quote.price:
+                self.price_cache[symbol] = quote.price
+                changed.add(symbol)
+                logger.debug(f"Price updated: {symbol} = ${quote.price:.2f}")
+
+            if quote.previous_close and quote.previous_close > 0:
+                daily = {'change': quote.change, 'change_pct': quote.change_pct}
+                if self.daily_change_cache.get(symbol) != daily:
+                    self.previous_close_cache[symbol] = quote.previous_close
+                    self.daily_change_cache[symbol] = daily
+                    changed.add(symbol)
+
+        if changed:
+            self._clear_portfolio_cache()
+        return changed
 
     @lru_cache(maxsize=128)
     def get_daily_change(self, symbol):
@@ -855,15 +790,8 @@ class PortfolioBusinessLogic:
         """Fetch price for a single symbol and update cache - optimized"""
         try:
             with operation("fetch_single_price", context={'symbol': symbol}):
-                price = self._fetch_single_price(symbol)
-                if price is not None:
-                    self.price_cache[symbol] = price
-                    self.last_price_update[symbol] = datetime.datetime.now()
-                    logger.debug(f"Updated price for {symbol}: ${price:.2f}")
-
-                    # Clear cache for affected calculations
-                    self._clear_portfolio_cache()
-                else:
+                self._fetch_prices_batch([symbol])
+                if symbol in self.price_fetch_errors:
                     logger.warning(f"Could not fetch price for {symbol}")
         except Exception as e:
             logger.error(f"Error fetching price for {symbol}: {e}")
@@ -919,13 +847,10 @@ class PortfolioBusinessLogic:
                 logger.info(f"Refreshing prices for {len(all_symbols)} symbols...",
                             context={'symbols_count': len(all_symbols)})
 
-                # Fetch updated prices
-                self._fetch_prices_batch(list(all_symbols))
-
-                # Clear cache for affected calculations
-                self._clear_portfolio_cache()
+                # Fetch updated prices; affected calculation caches are cleared on change
+                changed = self._fetch_prices_batch(list(all_symbols))
 
-                logger.info("Price refresh completed")
+                logger.info("Price refresh completed", context={'changed': len(changed)})
                 return True
 
         except Exception as e:
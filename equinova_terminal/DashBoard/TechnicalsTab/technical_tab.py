@@ -481,6 +481,196 @@ class MachineLearningProcessor:
 
 # ============================= BACKTESTING ENGINE =============================
 
+# exit reasons in TradeLog.exit_type
+EXIT_OPEN, EXIT_SELL, EXIT_STOP_LOSS, EXIT_TAKE_PROFIT = 0, 1, 2, 3
+_EXIT_NAMES = {EXIT_SELL: 'SELL', EXIT_STOP_LOSS: 'STOP_LOSS', EXIT_TAKE_PROFIT: 'TAKE_PROFIT'}
+
+
+@dataclass
+class TradeLog:
+    """Columnar round-trip log: one entry per trade, bars are positions in the price array"""
+    entry_bar: np.ndarray
+    exit_bar: np.ndarray        # -1 while the position is still open
+    entry_price: np.ndarray     # after commission and slippage
+    exit_price: np.ndarray      # NaN while open
+    shares: np.ndarray
+    exit_type: np.ndarray       # EXIT_* codes
+
+    def __len__(self) -> int:
+        return len(self.entry_bar)
+
+    @property
+    def closed(self) -> np.ndarray:
+        return self.exit_type != EXIT_OPEN
+
+    @property
+    def returns(self) -> np.ndarray:
+        """Per-trade return of closed trades"""
+        closed = self.closed
+        return (self.exit_price[closed] - self.entry_price[closed]) / self.entry_price[closed]
+
+    def to_frame(self, index: pd.Index) -> pd.DataFrame:
+        """Row-per-fill view (BUY / SELL / STOP_LOSS / TAKE_PROFIT) used by the charts"""
+        columns = ['timestamp', 'type', 'price', 'shares', 'value', 'return']
+        if not len(self):
+            return pd.DataFrame(columns=columns)
+        closed = self.closed
+        buys = pd.DataFrame({
+            'timestamp': index[self.entry_bar],
+            'type': 'BUY',
+            'price': self.entry_price,
+            'shares': self.shares,
+            'value': self.shares * self.entry_price,
+            'return': np.nan,
+            '_bar': self.entry_bar,
+            '_order': 0,
+        })
+        sells = pd.DataFrame({
+            'timestamp': index[self.exit_bar[closed]],
+            'type': [_EXIT_NAMES[t] for t in self.exit_type[closed]],
+            'price': self.exit_price[closed],
+            'shares': self.shares[closed],
+            'value': self.shares[closed] * self.exit_price[closed],
+            'return': self.returns,
+            '_bar': self.exit_bar[closed],
+            '_order': 1,
+        })
+        fills = pd.concat([buys, sells], ignore_index=True)
+        # a stop can fire on the entry bar, so order by bar then buy-before-exit
+        fills = fills.sort_values(['_bar', '_order'], kind='stable')
+        return fills[columns].reset_index(drop=True)
+
+
+@dataclass
+class BacktestResult:
+    """Equity curve and trades of one array backtest"""
+    portfolio_values: np.ndarray
+    trades: TradeLog
+
+
+def _next_true(flags: np.ndarray) -> np.ndarray:
+    """nxt[i] = smallest j >= i with flags[j], len(flags) if none"""
+    n = len(flags)
+    idx = np.where(flags, np.arange(n), n)
+    return np.minimum.accumulate(idx[::-1])[::-1]
+
+
+def _first_crossing(close: np.ndarray, start: int, stop: int, lower: float, upper: float) -> int:
+    """First bar in [start, stop) with close <= lower or close >= upper, else stop"""
+    width = 64
+    j = start
+    while j < stop:
+        end = min(stop, j + width)
+        segment = close[j:end]
+        hit = (segment <= lower) | (segment >= upper)
+        k = int(hit.argmax())
+        if hit[k]:
+            return j + k
+        j = end
+        width *= 2  # scan cost stays proportional to the holding period
+    return stop
+
+
+def vectorized_backtest(close: np.ndarray,
+                        buy: np.ndarray,
+                        sell: np.ndarray,
+                        initial_capital: float = 10000,
+                        position_size: float = 0.95,
+                        commission: float = 0.001,
+                        slippage: float = 0.0005,
+                        stop_loss: Optional[float] = None,
+                        take_profit: Optional[float] = None) -> BacktestResult:
+    """
+    Long-only position state machine on aligned arrays.
+
+    Same rules as the bar loop it replaces: a buy opens a position when flat,
+    a sell closes it on a later bar, and stop-loss / take-profit are checked
+    on the close against the cost-adjusted entry (a sell on the same bar wins).
+    Python work is per trade, not per bar: the next signal is read from
+    precomputed "next true" indices and stop levels are found with array scans.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    buy = np.asarray(buy, dtype=bool)
+    sell = np.asarray(sell, dtype=bool)
+    next_buy = _next_true(buy)
+    next_sell = _next_true(sell)
+
+    buy_cost = 1 + commission + slippage
+    sell_cost = 1 - commission - slippage
+    lower_mult = (1 - stop_loss) if stop_loss else -np.inf
+    upper_mult = (1 + take_profit) if take_profit else np.inf
+
+    entry_bars, exit_bars, entry_prices, exit_prices, share_counts, exit_types = [], [], [], [], [], []
+    # cash and shares held from each fill bar onward
+    event_bars, event_cash, event_shares = [0], [float(initial_capital)], [0.0]
+
+    cash = float(initial_capital)
+    i = int(next_buy[0]) if n else 0
+    while i < n:
+        entry = close[i] * buy_cost
+        shares = (cash * position_size) / entry
+        cash -= shares * entry
+        event_bars.append(i)
+        event_cash.append(cash)
+        event_shares.append(shares)
+
+        sell_bar = int(next_sell[i + 1]) if i + 1 < n else n
+        cross_bar = _first_crossing(close, i, min(sell_bar + 1, n), entry * lower_mult, entry * upper_mult)
+        if sell_bar < n and sell_bar <= cross_bar:
+            exit_bar, kind = sell_bar, EXIT_SELL
+        elif cross_bar < n:
+            exit_bar = cross_bar
+            kind = EXIT_STOP_LOSS if close[cross_bar] <= entry * lower_mult else EXIT_TAKE_PROFIT
+        else:
+            exit_bar, kind = -1, EXIT_OPEN
+
+        entry_bars.append(i)
+        entry_prices.append(entry)
+        share_counts.append(shares)
+        exit_types.append(kind)
+        exit_bars.append(exit_bar)
+        if kind == EXIT_OPEN:
+            exit_prices.append(np.nan)
+            break
+
+        exit_price = close[exit_bar] * sell_cost
+        exit_prices.append(exit_price)
+        cash += shares * exit_price
+        if exit_bar == i:
+            # stopped out on the entry bar: only the end-of-bar state matters
+            event_cash[-1], event_shares[-1] = cash, 0.0
+        else:
+            event_bars.append(exit_bar)
+            event_cash.append(cash)
+            event_shares.append(0.0)
+        i = int(next_buy[exit_bar + 1]) if exit_bar + 1 < n else n
+
+    # forward-fill the cash/shares state to every bar and mark to market
+    state = np.searchsorted(np.asarray(event_bars), np.arange(n), side='right') - 1
+    values = np.asarray(event_cash)[state] + np.asarray(event_shares)[state] * close
+
+    trades = TradeLog(
+        entry_bar=np.asarray(entry_bars, dtype=np.int64),
+        exit_bar=np.asarray(exit_bars, dtype=np.int64),
+        entry_price=np.asarray(entry_prices, dtype=np.float64),
+        exit_price=np.asarray(exit_prices, dtype=np.float64),
+        shares=np.asarray(share_counts, dtype=np.float64),
+        exit_type=np.asarray(exit_types, dtype=np.int8),
+    )
+    return BacktestResult(portfolio_values=values, trades=trades)
+
+
+def _signal_column(signals: pd.DataFrame, name: str, index: pd.Index) -> np.ndarray:
+    """Signal column aligned to the price index; missing bars and columns are False"""
+    if name not in signals.columns:
+        return np.zeros(len(index), dtype=bool)
+    column = signals[name]
+    if not column.index.equals(index):
+        column = column[~column.index.duplicated(keep='last')].reindex(index)
+    return column.fillna(False).to_numpy(dtype=bool)
+
+
 class AdvancedBacktestEngine:
     """Professional-grade backtesting engine"""
 
@@ -488,6 +678,7 @@ class AdvancedBacktestEngine:
         self.portfolio_value = []
         self.positions = []
         self.trades = []
+        self.trade_log: Optional[TradeLog] = None
         self.equity_curve = None
         self.metrics = None
 
@@ -502,179 +693,69 @@ class AdvancedBacktestEngine:
                     take_profit: Optional[float] = None) -> PortfolioMetrics:
         """Run comprehensive backtest with advanced features"""
 
-        # Initialize portfolio
-        cash = initial_capital
-        shares = 0
-        position = 0
-        entry_price = 0
-
-        portfolio_values = []
-        trade_log = []
-        daily_returns = []
-
-        for i, (timestamp, row) in enumerate(data.iterrows()):
-            current_price = row['Close']
-
-            # Check for signals
-            if timestamp in signals.index:
-                signal_row = signals.loc[timestamp]
-
-                # Buy signal
-                if signal_row.get('buy_signals', False) and position == 0:
-                    # Calculate position size with commission and slippage
-                    effective_price = current_price * (1 + commission + slippage)
-                    shares = (cash * position_size) / effective_price
-                    cash -= shares * effective_price
-                    position = 1
-                    entry_price = effective_price
-
-                    trade_log.append({
-                        'timestamp': timestamp,
-                        'type': 'BUY',
-                        'price': effective_price,
-                        'shares': shares,
-                        'value': shares * effective_price
-                    })
-
-                # Sell signal
-                elif signal_row.get('sell_signals', False) and position == 1:
-                    # Calculate exit with commission and slippage
-                    effective_price = current_price * (1 - commission - slippage)
-                    cash += shares * effective_price
-
-                    # Log trade
-                    trade_return = (effective_price - entry_price) / entry_price
-                    trade_log.append({
-                        'timestamp': timestamp,
-                        'type': 'SELL',
-                        'price': effective_price,
-                        'shares': shares,
-                        'value': shares * effective_price,
-                        'return': trade_return
-                    })
-
-                    shares = 0
-                    position = 0
-                    entry_price = 0
-
-            # Check stop loss and take profit
-            if position == 1:
-                if stop_loss and current_price <= entry_price * (1 - stop_loss):
-                    # Stop loss triggered
-                    effective_price = current_price * (1 - commission - slippage)
-                    cash += shares * effective_price
-                    trade_return = (effective_price - entry_price) / entry_price
-
-                    trade_log.append({
-                        'timestamp': timestamp,
-                        'type': 'STOP_LOSS',
-                        'price': effective_price,
-                        'shares': shares,
-                        'value': shares * effective_price,
-                        'return': trade_return
-                    })
-
-                    shares = 0
-                    position = 0
-                    entry_price = 0
-
-                elif take_profit and current_price >= entry_price * (1 + take_profit):
-                    # Take profit triggered
-                    effective_price = current_price * (1 - commission - slippage)
-                    cash += shares * effective_price
-                    trade_return = (effective_price - entry_price) / entry_price
-
-                    trade_log.append({
-                        'timestamp': timestamp,
-                        'type': 'TAKE_PROFIT',
-                        'price': effective_price,
-                        'shares': shares,
-                        'value': shares * effective_price,
-                        'return': trade_return
-                    })
-
-                    shares = 0
-                    position = 0
-                    entry_price = 0
-
-            # Calculate portfolio value
-            total_value = cash + (shares * current_price)
-            portfolio_values.append(total_value)
-
-            # Calculate daily return
-            if i > 0:
-                daily_return = (total_value - portfolio_values[i-1]) / portfolio_values[i-1]
-                daily_returns.append(daily_return)
+        result = vectorized_backtest(
+            data['Close'].to_numpy(dtype=np.float64),
+            _signal_column(signals, 'buy_signals', data.index),
+            _signal_column(signals, 'sell_signals', data.index),
+            initial_capital, position_size, commission, slippage, stop_loss, take_profit
+        )
 
         # Calculate metrics
-        self.equity_curve = pd.Series(portfolio_values, index=data.index)
-        self.trades = pd.DataFrame(trade_log)
-
-        return self._calculate_metrics(
-            portfolio_values,
-            daily_returns,
-            trade_log,
-            initial_capital
-        )
+        self.equity_curve = pd.Series(result.portfolio_values, index=data.index)
+        self.trade_log = result.trades
+        self.trades = result.trades.to_frame(data.index)
+
+        self.metrics = self._calculate_metrics(result.portfolio_values, result.trades, initial_capital)
+        return self.metrics
 
     def _calculate_metrics(self,
-                          portfolio_values: List[float],
-                          daily_returns: List[float],
-                          trade_log: List[Dict],
+                          portfolio_values: np.ndarray,
+                          trades: TradeLog,
                           initial_capital: float) -> PortfolioMetrics:
         """Calculate comprehensive performance metrics"""
 
-        if not portfolio_values:
+        if not len(portfolio_values):
             return self._empty_metrics()
 
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        daily_returns = np.diff(values) / values[:-1]
+
         # Basic metrics
-        total_return = (portfolio_values[-1] - initial_capital) / initial_capital
+        total_return = (values[-1] - initial_capital) / initial_capital
 
         # Annualized return (assuming 252 trading days)
-        n_days = len(portfolio_values)
+        n_days = len(values)
         annualized_return = (1 + total_return) ** (252 / n_days) - 1 if n_days > 0 else 0
 
         # Sharpe ratio
-        if daily_returns:
-            daily_returns_array = np.array(daily_returns)
-            sharpe_ratio = np.sqrt(252) * (np.mean(daily_returns_array) / np.std(daily_returns_array)) if np.std(daily_returns_array) > 0 else 0
-        else:
-            sharpe_ratio = 0
+        return_std = daily_returns.std() if len(daily_returns) else 0
+        sharpe_ratio = np.sqrt(252) * (daily_returns.mean() / return_std) if return_std > 0 else 0
 
         # Sortino ratio
-        downside_returns = [r for r in daily_returns if r < 0]
-        if downside_returns:
-            downside_std = np.std(downside_returns)
-            sortino_ratio = np.sqrt(252) * (np.mean(daily_returns_array) / downside_std) if downside_std > 0 else 0
+        downside_returns = daily_returns[daily_returns < 0]
+        if len(downside_returns):
+            downside_std = downside_returns.std()
+            sortino_ratio = np.sqrt(252) * (daily_returns.mean() / downside_std) if downside_std > 0 else 0
         else:
             sortino_ratio = sharpe_ratio
 
         # Maximum drawdown
-        equity_curve = pd.Series(portfolio_values)
-        rolling_max = equity_curve.expanding().max()
-        drawdown = (equity_curve - rolling_max) / rolling_max
-        max_drawdown = abs(drawdown.min())
+        rolling_max = np.maximum.accumulate(values)
+        max_drawdown = abs(((values - rolling_max) / rolling_max).min())
 
         # Trade statistics
-        trades_df = pd.DataFrame(trade_log)
-        if not trades_df.empty and 'return' in trades_df.columns:
-            trade_returns = trades_df[trades_df['type'].isin(['SELL', 'STOP_LOSS', 'TAKE_PROFIT'])]['return']
-
-            winning_trades = trade_returns[trade_returns > 0]
-            losing_trades = trade_returns[trade_returns < 0]
-
-            win_rate = len(winning_trades) / len(trade_returns) if len(trade_returns) > 0 else 0
-            avg_win = winning_trades.mean() if len(winning_trades) > 0 else 0
-            avg_loss = losing_trades.mean() if len(losing_trades) > 0 else 0
-
+        trade_returns = trades.returns
+        winning_trades = trade_returns[trade_returns > 0]
+        losing_trades = trade_returns[trade_returns < 0]
+        if len(trade_returns):
+            win_rate = len(winning_trades) / len(trade_returns)
+            avg_win = winning_trades.mean() if len(winning_trades) else 0
+            avg_loss = losing_trades.mean() if len(losing_trades) else 0
             profit_factor = abs(winning_trades.sum() / losing_trades.sum()) if losing_trades.sum() != 0 else float('inf')
-
-            best_trade = trade_returns.max() if len(trade_returns) > 0 else 0
-            worst_trade = trade_returns.min() if len(trade_returns) > 0 else 0
+            best_trade = trade_returns.max()
+            worst_trade = trade_returns.min()
         else:
             win_rate = avg_win = avg_loss = profit_factor = best_trade = worst_trade = 0
-            winning_trades = []
-            losing_trades = []
 
         # Recovery factor
         recovery_factor = total_return / max_drawdown if max_drawdown > 0 else 0
@@ -683,9 +764,9 @@ class AdvancedBacktestEngine:
         calmar_ratio = annualized_return / max_drawdown if max_drawdown > 0 else 0
 
         # VaR and CVaR
-        if daily_returns:
+        if len(daily_returns):
             var_95 = np.percentile(daily_returns, 5)
-            cvar_95 = np.mean([r for r in daily_returns if r <= var_95])
+            cvar_95 = daily_returns[daily_returns <= var_95].mean()
         else:
             var_95 = cvar_95 = 0
 
@@ -697,7 +778,7 @@ class AdvancedBacktestEngine:
             max_drawdown=max_drawdown * 100,
             win_rate=win_rate * 100,
             profit_factor=profit_factor,
-            total_trades=len(trade_returns) if 'trade_returns' in locals() else 0,
+            total_trades=len(trade_returns),
             winning_trades=len(winning_trades),
             losing_trades=len(losing_trades),
             avg_win=avg_win * 100,
@@ -917,36 +998,114 @@ class AdvancedPlottingEngine:
 
 # ============================= NODE PROCESSOR IMPLEMENTATION =============================
 
+# Nodes that read every output in global_state rather than their wired inputs,
+# by rank: each one implicitly depends on all nodes of a lower rank
+_OUTPUT_SCAN_RANK = {
+    NodeType.BACKTEST: 1,
+    NodeType.OPTIMIZATION: 1,
+    NodeType.PLOT: 2,
+}
+
+
+def _fingerprint(value: Any, h=None) -> str:
+    """Content hash of a node output"""
+    import hashlib
+    top = h is None
+    if top:
+        h = hashlib.blake2b(digest_size=16)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        h.update(repr((type(value).__name__, value.shape,
+                       list(value.columns) if isinstance(value, pd.DataFrame) else value.name,
+                       [str(t) for t in np.atleast_1d(value.dtypes)])).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        h.update(repr((value.dtype.str, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        h.update(b'{')
+        for k in sorted(value, key=repr):
+            h.update(repr(k).encode())
+            _fingerprint(value[k], h)
+        h.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        h.update(b'[')
+        for item in value:
+            _fingerprint(item, h)
+        h.update(b']')
+    elif hasattr(value, '__dict__'):
+        h.update(type(value).__name__.encode())
+        _fingerprint(vars(value), h)
+    else:
+        h.update(repr(value).encode())
+    return h.hexdigest() if top else ''
+
+
 class NodeProcessor:
     """Enhanced node processor with caching and parallel execution"""
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.nodes: Dict[str, NodeData] = {}
         self.execution_order: List[str] = []
-        self.cache: Dict[str, Any] = {}
+        self.cache: Dict[str, Tuple[str, Any, str]] = {}  # node_id -> (cache key, output, output fingerprint)
         self.performance_tracker: Dict[str, float] = {}
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._dependencies: Dict[str, List[str]] = {}
+        self._graph_signature: Optional[str] = None
 
     def add_node(self, node_data: NodeData):
         """Add a node to the processor"""
         self.nodes[node_data.node_id] = node_data
         logger.info(f"Added node {node_data.node_id} of type {node_data.node_type.value}")
 
+    def invalidate(self, node_id: Optional[str] = None):
+        """Force a node (or every node) to re-execute on the next run; dependents follow if its output changes"""
+        if node_id is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(node_id, None)
+
+    def clear_cache(self):
+        """Drop all cached outputs and the stored execution order"""
+        self.cache.clear()
+        self._graph_signature = None
+
+    def _node_dependencies(self) -> Dict[str, List[str]]:
+        """Upstream nodes of every node: wired inputs plus the implicit ones of output-scanning nodes"""
+        deps = {node_id: [] for node_id in self.nodes}
+        for target_node, connections in global_state.node_connections.items():
+            if target_node not in deps:
+                continue
+            for input_type, source_nodes in connections.items():
+                deps[target_node].extend(s for s in source_nodes if s in self.nodes and s not in deps[target_node])
+
+        for node_id, node in self.nodes.items():
+            rank = _OUTPUT_SCAN_RANK.get(node.node_type)
+            if rank is None:
+                continue
+            for other_id, other in self.nodes.items():
+                if (other_id not in deps[node_id] and
+                        _OUTPUT_SCAN_RANK.get(other.node_type, 0) < rank):
+                    deps[node_id].append(other_id)
+        return deps
+
     def calculate_execution_order(self):
         """Calculate optimal execution order using topological sort"""
-        from collections import defaultdict, deque
+        from collections import deque
 
-        # Build dependency graph
-        graph = defaultdict(list)
-        in_degree = defaultdict(int)
+        signature = repr((sorted((k, n.node_type.value) for k, n in self.nodes.items()),
+                          sorted((t, sorted((i, list(s)) for i, s in c.items()))
+                                 for t, c in global_state.node_connections.items())))
+        if signature == self._graph_signature:
+            return
 
-        for node_id in self.nodes:
-            in_degree[node_id] = 0
+        self._dependencies = self._node_dependencies()
 
-        for target_node, connections in global_state.node_connections.items():
-            for input_type, source_nodes in connections.items():
-                for source_node in source_nodes:
-                    graph[source_node].append(target_node)
-                    in_degree[target_node] += 1
+        # Build dependency graph
+        graph = {node_id: [] for node_id in self.nodes}
+        in_degree = {node_id: len(deps) for node_id, deps in self._dependencies.items()}
+        for node_id, deps in self._dependencies.items():
+            for source_node in deps:
+                graph[source_node].append(node_id)
 
         # Topological sort using Kahn's algorithm
         queue = deque([node for node in self.nodes if in_degree[node] == 0])
@@ -961,48 +1120,162 @@ class NodeProcessor:
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
 
+        if len(self.execution_order) < len(self.nodes):
+            logger.warning(f"Cycle in node graph, not executing: "
+                           f"{sorted(set(self.nodes) - set(self.execution_order))}")
+
+        self._graph_signature = signature
         logger.info(f"Execution order calculated: {self.execution_order}")
 
+    def _cache_key(self, node: NodeData, fingerprints: Dict[str, Optional[str]]) -> str:
+        """Hash of the node's type and parameters and the fingerprints of everything it reads"""
+        import hashlib
+        payload = json.dumps({
+            'type': node.node_type.value,
+            'parameters': node.parameters,
+            'inputs': {k: v for k, v in global_state.node_connections.get(node.node_id, {}).items()},
+            'upstream': [(d, fingerprints.get(d)) for d in self._dependencies.get(node.node_id, [])],
+        }, sort_keys=True, default=repr)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
     def execute_nodes(self, use_cache: bool = True):
-        """Execute all nodes with optional caching"""
+        """
+        Execute the graph incrementally.
+
+        A node re-runs only when its cache key (parameters plus upstream output
+        fingerprints) changed; if its new output hashes the same as before,
+        its dependents stay cached too. Nodes whose inputs are ready run
+        concurrently on a thread pool, except output-scanning nodes, which
+        run one at a time. Dependents of a failed node are skipped.
+        """
         import time
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
         logger.info("Starting node execution")
         self.calculate_execution_order()
-
-        for node_id in self.execution_order:
+        for node_id in list(self.cache):
             if node_id not in self.nodes:
-                continue
-
-            node = self.nodes[node_id]
-
-            # Check cache
-            if use_cache and node.cache_enabled and node_id in self.cache:
-                logger.info(f"Using cached result for node {node_id}")
-                global_state.node_outputs[node_id] = self.cache[node_id]
-                continue
-
-            try:
-                start_time = time.time()
-                logger.info(f"Executing node {node_id} ({node.node_type.value})")
+                del self.cache[node_id]
+
+        order = [n for n in self.execution_order if n in self.nodes]
+        deps = self._dependencies
+        remaining = {n: sum(1 for d in deps[n] if d in order) for n in order}
+        dependents: Dict[str, List[str]] = {n: [] for n in order}
+        for n in order:
+            for d in deps[n]:
+                if d in dependents:
+                    dependents[d].append(n)
+
+        fingerprints: Dict[str, Optional[str]] = {}
+        failed: set = set()
+        ready = [n for n in order if remaining[n] == 0]
+        running: Dict[Any, Tuple[str, str]] = {}
+        executed = cached = 0
+
+        def run(node: NodeData) -> float:
+            start_time = time.time()
+            global_state.node_outputs.pop(node.node_id, None)
+            self._execute_node(node)
+            return time.time() - start_time
 
-                self._execute_node(node)
+        def collect(future) -> Tuple[Optional[Exception], float]:
+            error = future.exception()
+            return error, 0.0 if error is not None else future.result()
 
-                execution_time = time.time() - start_time
+        def finish(node_id: str, key: str, error: Optional[Exception], execution_time: float):
+            nonlocal executed
+            node = self.nodes[node_id]
+            if error is not None:
+                logger.error(f"Error executing node {node_id}: {error}")
+                node.error_state = str(error)
+                self._update_node_status(node_id, f"✗ Error: {str(error)[:50]}")
+                self.cache.pop(node_id, None)
+                failed.add(node_id)
+            else:
                 node.execution_time = execution_time
                 node.last_execution = datetime.now()
+                node.error_state = None
                 self.performance_tracker[node_id] = execution_time
+                executed += 1
+
+                output = global_state.node_outputs.get(node_id)
+                fingerprints[node_id] = _fingerprint(output) if node_id in global_state.node_outputs else None
 
                 # Update cache
                 if node.cache_enabled and node_id in global_state.node_outputs:
-                    self.cache[node_id] = global_state.node_outputs[node_id]
+                    self.cache[node_id] = (key, output, fingerprints[node_id])
+                else:
+                    self.cache.pop(node_id, None)
 
                 logger.info(f"Node {node_id} executed in {execution_time:.3f}s")
-
-            except Exception as e:
-                logger.error(f"Error executing node {node_id}: {e}")
-                node.error_state = str(e)
-                self._update_node_status(node_id, f"✗ Error: {str(e)[:50]}")
+            release(node_id)
+
+        def restore_output_order():
+            # output-scanning nodes take the first match, so keep outputs in execution order
+            # whatever order the workers finished in
+            outputs = global_state.node_outputs
+            ordered = {n: outputs[n] for n in order if n in outputs}
+            ordered.update((k, v) for k, v in outputs.items() if k not in ordered)
+            outputs.clear()
+            outputs.update(ordered)
+
+        def release(node_id: str):
+            for n in dependents[node_id]:
+                remaining[n] -= 1
+                if remaining[n] == 0:
+                    ready.append(n)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="node-exec") as pool:
+            while ready or running:
+                while ready:
+                    node_id = ready.pop(0)
+                    node = self.nodes[node_id]
+
+                    wired = [s for sources in global_state.node_connections.get(node_id, {}).values()
+                             for s in sources]
+                    if any(s in failed for s in wired):
+                        node.error_state = "upstream node failed"
+                        self._update_node_status(node_id, "✗ Upstream error")
+                        global_state.node_outputs.pop(node_id, None)
+                        failed.add(node_id)
+                        release(node_id)
+                        continue
+
+                    key = self._cache_key(node, fingerprints)
+
+                    # Check cache
+                    entry = self.cache.get(node_id)
+                    if use_cache and node.cache_enabled and entry is not None and entry[0] == key:
+                        logger.info(f"Using cached result for node {node_id}")
+                        global_state.node_outputs[node_id] = entry[1]
+                        fingerprints[node_id] = entry[2]
+                        cached += 1
+                        release(node_id)
+                        continue
+
+                    logger.info(f"Executing node {node_id} ({node.node_type.value})")
+                    if node.node_type in _OUTPUT_SCAN_RANK or self.max_workers == 1:
+                        # output-scanning nodes read the whole output table: let in-flight nodes
+                        # land first, then run alone on this thread
+                        for future in list(running):
+                            finish(*running.pop(future), *collect(future))
+                        restore_output_order()
+                        try:
+                            error, execution_time = None, run(node)
+                        except Exception as e:
+                            error, execution_time = e, 0.0
+                        finish(node_id, key, error, execution_time)
+                        continue
+
+                    running[pool.submit(run, node)] = (node_id, key)
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(*running.pop(future), *collect(future))
+
+        restore_output_order()
+        logger.info(f"Node execution finished: {executed} executed, {cached} cached, {len(failed)} failed")
 
     def _execute_node(self, node: NodeData):
         """Execute a single node based on its type"""
@@ -1507,9 +1780,76 @@ class NodeProcessor:
 
     def _execute_optimization(self, node: NodeData):
         """Execute strategy optimization"""
-        # This would implement parameter optimization
-        # For brevity, showing placeholder
-        self._update_node_status(node.node_id, "✓ Optimization complete")
+        try:
+            # Get stock data
+            stock_data = None
+            for node_id, data in global_state.node_outputs.items():
+                if isinstance(data, pd.DataFrame) and 'Close' in data.columns and 'Open' in data.columns:
+                    stock_data = data
+                    break
+
+            if stock_data is None:
+                self._update_node_status(node.node_id, "✗ No stock data found")
+                return
+
+            params = node.parameters
+            self._update_node_status(node.node_id, "⏳ Optimizing...")
+            optimizer = StrategyOptimizer(workers=params.get('workers'))
+            result = optimizer.optimize(
+                stock_data,
+                strategy=params.get('strategy', 'sma_crossover'),
+                param_grid=params.get('param_grid'),
+                method=params.get('method', 'grid'),
+                n_iter=params.get('n_iter', 50),
+                objective=params.get('objective', 'sharpe_ratio'),
+                n_folds=params.get('folds', 4),
+                train_fraction=params.get('train_fraction', 0.7),
+                seed=params.get('seed'),
+                backtest_params={k: params[k] for k in ('initial_capital', 'position_size', 'commission',
+                                                        'slippage', 'stop_loss', 'take_profit')
+                                 if k in params}
+            )
+
+            # Store results
+            results = {
+                'optimization': result,
+                'table': result.table,
+                'walk_forward': result.walk_forward,
+                'best_params': result.best_params
+            }
+
+            global_state.node_outputs[node.node_id] = results
+            node.outputs['results'] = results
+
+            best = result.table.iloc[0]
+            best_text = ", ".join(f"{k}={v}" for k, v in result.best_params.items())
+            self._update_node_status(node.node_id, f"✓ {len(result.table)} combos, best {best_text}")
+
+            # Update detailed results display
+            if dpg.does_item_exist(f"{node.node_id}_results_text"):
+                top = result.table.head(5)
+                lines = [f"  {int(row['rank'])}. " + ", ".join(f"{k}={row[k]}" for k in result.best_params)
+                         + f"  IS {row['in_sample']:.2f} / OOS {row['out_of_sample']:.2f}"
+                         for row in top.to_dict('records')]
+                results_text = f"""⚙️ OPTIMIZATION RESULTS
+━━━━━━━━━━━━━━━━━━━━━
+🎯 {result.strategy} by {result.objective}
+  • Candidates: {len(result.table)}
+  • Fold runs: {result.evaluations}
+
+🏆 Best: {best_text}
+  • In-sample: {best['in_sample']:.2f}
+  • Out-of-sample: {best['out_of_sample']:.2f}
+  • OOS Return: {best['oos_return_pct']:.2f}%
+
+📋 Top 5:
+""" + "\n".join(lines)
+                dpg.set_value(f"{node.node_id}_results_text", results_text)
+
+        except Exception as e:
+            logger.error(f"Error in optimization: {e}")
+            self._update_node_status(node.node_id, f"✗ Optimization error")
+            raise
 
     def _execute_plot(self, node: NodeData):
         """Execute plotting node"""
@@ -2048,6 +2388,8 @@ class AdvancedNodeEditorTab(BaseTab):
             self.create_signal_node_content(node_id, dpg_node_id)
         elif node_type == NodeType.BACKTEST:
             self.create_backtest_node_content(node_id, dpg_node_id)
+        elif node_type == NodeType.OPTIMIZATION:
+            self.create_optimization_node_content(node_id, dpg_node_id)
         elif node_type == NodeType.PLOT:
             self.create_plot_node_content(node_id, dpg_node_id)
         else:
@@ -2191,6 +2533,57 @@ class AdvancedNodeEditorTab(BaseTab):
             'output_attr': output_attr
         })
 
+    def create_optimization_node_content(self, node_id: str, dpg_node_id: int):
+        """Create optimization node content"""
+        # Input
+        input_attr = dpg.add_node_attribute(label="📥 Stock Data",
+                                          attribute_type=dpg.mvNode_Attr_Input)
+        dpg.add_spacer(width=1, parent=input_attr)
+
+        # Settings
+        with dpg.node_attribute(label="Settings", attribute_type=dpg.mvNode_Attr_Static):
+            dpg.add_spacer(width=220)
+            dpg.add_combo(list(OPTIMIZER_STRATEGIES), default_value="sma_crossover",
+                        label="Strategy", width=140, tag=f"{node_id}_strategy")
+            dpg.add_combo(list(OPTIMIZER_METHODS), default_value="grid",
+                        label="Search", width=140, tag=f"{node_id}_method")
+            dpg.add_input_int(label="Samples", default_value=50,
+                            min_value=1, max_value=10000, width=140,
+                            tag=f"{node_id}_n_iter",
+                            tooltip="Random search only")
+            dpg.add_combo(["sharpe_ratio", "sortino_ratio", "calmar_ratio", "total_return", "profit_factor"],
+                        default_value="sharpe_ratio", label="Objective", width=140,
+                        tag=f"{node_id}_objective")
+            dpg.add_input_int(label="WF Folds", default_value=4,
+                            min_value=1, max_value=20, width=140,
+                            tag=f"{node_id}_folds")
+            dpg.add_input_float(label="Train %", default_value=70.0,
+                              min_value=10.0, max_value=95.0, width=140,
+                              tag=f"{node_id}_train_fraction")
+            dpg.add_input_int(label="Workers", default_value=0,
+                            min_value=0, max_value=64, width=140,
+                            tag=f"{node_id}_workers",
+                            tooltip="0 = auto")
+            dpg.add_separator()
+            dpg.add_text("Status: Ready", tag=f"{node_id}_status", wrap=200)
+
+        # Results display
+        with dpg.node_attribute(label="Results", attribute_type=dpg.mvNode_Attr_Static):
+            dpg.add_spacer(width=250)
+            dpg.add_text("Run optimization to see results",
+                       tag=f"{node_id}_results_text", wrap=240,
+                       color=[150, 150, 150])
+
+        # Output
+        output_attr = dpg.add_node_attribute(label="📊 Results",
+                                            attribute_type=dpg.mvNode_Attr_Output)
+        dpg.add_spacer(width=1, parent=output_attr)
+
+        global_state.node_registry[dpg_node_id].update({
+            'input_attr': input_attr,
+            'output_attr': output_attr
+        })
+
     def create_plot_node_content(self, node_id: str, dpg_node_id: int):
         """Create plot node content"""
         # Input
@@ -2458,6 +2851,15 @@ class AdvancedNodeEditorTab(BaseTab):
                         tp = dpg.get_value(f"{node_id}_take_profit") / 100
                         node.parameters['take_profit'] = tp if tp > 0 else None
 
+                elif node.node_type == NodeType.OPTIMIZATION:
+                    for key in ('strategy', 'method', 'n_iter', 'objective', 'folds'):
+                        if dpg.does_item_exist(f"{node_id}_{key}"):
+                            node.parameters[key] = dpg.get_value(f"{node_id}_{key}")
+                    if dpg.does_item_exist(f"{node_id}_train_fraction"):
+                        node.parameters['train_fraction'] = dpg.get_value(f"{node_id}_train_fraction") / 100
+                    if dpg.does_item_exist(f"{node_id}_workers"):
+                        node.parameters['workers'] = dpg.get_value(f"{node_id}_workers") or None
+
                 elif node.node_type == NodeType.PLOT:
                     if dpg.does_item_exist(f"{node_id}_plot_type"):
                         node.parameters['plot_type'] = dpg.get_value(f"{node_id}_plot_type")
@@ -2547,6 +2949,7 @@ class AdvancedNodeEditorTab(BaseTab):
         global_state.clear()
         self.node_processor.nodes.clear()
         self.node_processor.execution_order.clear()
+        self.node_processor.clear_cache()
         self.node_counter = 0
 
         # Clear displays
@@ -2749,23 +3152,353 @@ class PerformanceMonitor:
         return stats
 
 
+# Strategy families the optimizer can sweep, with default grids. Any strategy
+# also accepts 'stop_loss' / 'take_profit' lists in its grid.
+OPTIMIZER_STRATEGIES: Dict[str, Dict[str, List[Any]]] = {
+    'sma_crossover': {'fast': [5, 10, 20, 30, 50], 'slow': [50, 100, 150, 200]},
+    'ema_crossover': {'fast': [5, 8, 12, 20], 'slow': [26, 50, 100]},
+    'rsi_threshold': {'period': [7, 14, 21], 'buy_threshold': [20, 25, 30, 35],
+                      'sell_threshold': [65, 70, 75, 80]},
+    'macd_crossover': {'fast': [8, 12, 16], 'slow': [21, 26, 34], 'signal': [5, 9, 12]},
+}
+OPTIMIZER_METHODS = ('grid', 'random', 'halving')
+
+# worker-side state: prices attached once per process, indicators reused across jobs
+_opt_shm = None
+_opt_frame: Optional[pd.DataFrame] = None
+_opt_indicators: Dict[tuple, Any] = {}
+
+
+def _optimizer_init(shm_name: Optional[str], length: int, close: Optional[np.ndarray] = None):
+    """Attach to the shared close array (or take `close` directly when running in-process)"""
+    global _opt_shm, _opt_frame
+    _opt_indicators.clear()
+    if shm_name is not None:
+        from multiprocessing import shared_memory
+        _opt_shm = shared_memory.SharedMemory(name=shm_name)
+        close = np.ndarray((length,), dtype=np.float64, buffer=_opt_shm.buf)
+    _opt_frame = pd.DataFrame({'Close': close}, copy=False)
+
+
+def _opt_indicator(kind: str, *args) -> Any:
+    key = (kind,) + args
+    values = _opt_indicators.get(key)
+    if values is None:
+        if len(_opt_indicators) > 512:
+            _opt_indicators.clear()
+        if kind == 'sma':
+            values = TechnicalIndicatorProcessor.calculate_sma(_opt_frame, *args).to_numpy()
+        elif kind == 'ema':
+            values = TechnicalIndicatorProcessor.calculate_ema(_opt_frame, *args).to_numpy()
+        elif kind == 'rsi':
+            values = TechnicalIndicatorProcessor.calculate_rsi(_opt_frame, *args).to_numpy()
+        else:
+            macd = TechnicalIndicatorProcessor.calculate_macd(_opt_frame, *args)
+            values = (macd['MACD'].to_numpy(), macd['MACD_Signal'].to_numpy())
+        _opt_indicators[key] = values
+    return values
+
+
+def _crossover_signals(fast: np.ndarray, slow: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Same rule as the crossover signal node; NaN warm-up bars never signal"""
+    prev_fast = np.concatenate(([np.nan], fast[:-1]))
+    prev_slow = np.concatenate(([np.nan], slow[:-1]))
+    buy = (fast > slow) & (prev_fast <= prev_slow)
+    sell = (fast < slow) & (prev_fast >= prev_slow)
+    return buy, sell
+
+
+def _strategy_signals(strategy: str, params: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    if strategy in ('sma_crossover', 'ema_crossover'):
+        kind = strategy[:3]
+        return _crossover_signals(_opt_indicator(kind, params['fast']), _opt_indicator(kind, params['slow']))
+    if strategy == 'rsi_threshold':
+        rsi = _opt_indicator('rsi', params['period'])
+        return rsi < params['buy_threshold'], rsi > params['sell_threshold']
+    line, signal = _opt_indicator('macd', params['fast'], params['slow'], params['signal'])
+    return _crossover_signals(line, signal)
+
+
+def _signal_lookback(params: Dict[str, Any]) -> int:
+    """Longest indicator window of a candidate: bars before its signals are meaningful"""
+    return max(int(params[k]) for k in ('fast', 'slow', 'period', 'signal') if k in params)
+
+
+def _optimizer_evaluate(strategy: str, combos: List[Dict[str, Any]], folds: List[Tuple[int, int, int]],
+                        settings: Dict[str, Any]) -> List[List[Tuple[float, float, float, int, int]]]:
+    """Per combo and fold: (in-sample score, out-of-sample score, OOS return %, in-sample trades, OOS trades)"""
+    close = _opt_frame['Close'].to_numpy()
+    engine = AdvancedBacktestEngine()
+    objective = settings['objective']
+    capital = settings['initial_capital']
+
+    def run(buy, sell, params, lo, hi) -> PortfolioMetrics:
+        result = vectorized_backtest(
+            close[lo:hi], buy[lo:hi], sell[lo:hi], capital,
+            settings['position_size'], settings['commission'], settings['slippage'],
+            params.get('stop_loss', settings['stop_loss']), params.get('take_profit', settings['take_profit'])
+        )
+        return engine._calculate_metrics(result.portfolio_values, result.trades, capital)
+
+    out = []
+    for params in combos:
+        buy, sell = _strategy_signals(strategy, params)
+        rows = []
+        for train_start, test_start, test_end in folds:
+            in_sample = run(buy, sell, params, train_start, test_start)
+            out_sample = run(buy, sell, params, test_start, test_end)
+            rows.append((float(getattr(in_sample, objective)), float(getattr(out_sample, objective)),
+                         float(out_sample.total_return), int(in_sample.total_trades), int(out_sample.total_trades)))
+        out.append(rows)
+    return out
+
+
+class _SweepPool:
+    """Process pool whose workers map the close prices from shared memory instead of receiving them per job"""
+
+    def __init__(self, close: np.ndarray, workers: int):
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.workers = workers
+        self._shm = None
+        self._pool = None
+
+    def __enter__(self) -> '_SweepPool':
+        if self.workers > 1:
+            from multiprocessing import shared_memory
+            from concurrent.futures import ProcessPoolExecutor
+            self._shm = shared_memory.SharedMemory(create=True, size=max(self.close.nbytes, 1))
+            np.ndarray(self.close.shape, dtype=np.float64, buffer=self._shm.buf)[:] = self.close
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_optimizer_init,
+                                             initargs=(self._shm.name, len(self.close)))
+        else:
+            _optimizer_init(None, len(self.close), self.close)
+        return self
+
+    def evaluate(self, strategy: str, combos: List[Dict[str, Any]], folds: List[Tuple[int, int, int]],
+                 settings: Dict[str, Any]) -> List[List[Tuple[float, float, float, int, int]]]:
+        if self._pool is None or len(combos) < 2:
+            if self._pool is not None:
+                return self._pool.submit(_optimizer_evaluate, strategy, combos, folds, settings).result()
+            return _optimizer_evaluate(strategy, combos, folds, settings)
+        # a few batches per worker: keeps indicator reuse high and IPC low
+        size = max(1, -(-len(combos) // (self.workers * 4)))
+        batches = [combos[i:i + size] for i in range(0, len(combos), size)]
+        futures = [self._pool.submit(_optimizer_evaluate, strategy, b, folds, settings) for b in batches]
+        return [rows for f in futures for rows in f.result()]
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown()
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+        return False
+
+
+@dataclass
+class OptimizationResult:
+    """Ranked sweep results"""
+    strategy: str
+    objective: str
+    table: pd.DataFrame          # one row per candidate, ranked by in-sample score
+    walk_forward: pd.DataFrame   # per fold: best in-sample candidate and how it did out of sample
+    best_params: Dict[str, Any]
+    evaluations: int             # (candidate, fold) backtest pairs run
+
+
 class StrategyOptimizer:
     """Optimize strategy parameters"""
 
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
         self.optimization_results = []
 
+    @staticmethod
+    def parameter_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """Cartesian product of the grid, dropping fast >= slow pairs"""
+        import itertools
+        keys = list(grid)
+        combos = [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+        return [c for c in combos if not ('fast' in c and 'slow' in c and c['fast'] >= c['slow'])]
+
+    @staticmethod
+    def walk_forward_folds(n_bars: int, n_folds: int = 4, train_fraction: float = 0.7,
+                           window_size: Optional[int] = None,
+                           step_size: Optional[int] = None) -> List[Tuple[int, int, int]]:
+        """(train_start, test_start, test_end) bar positions of rolling train/test windows"""
+        window_size = window_size or n_bars // max(1, n_folds)
+        step_size = step_size or window_size
+        folds = []
+        for start in range(0, n_bars - window_size + 1, step_size):
+            split = start + int(window_size * train_fraction)
+            if split - start >= 2 and start + window_size - split >= 2:
+                folds.append((start, split, start + window_size))
+        return folds
+
+    def optimize(self,
+                 data: pd.DataFrame,
+                 strategy: str = 'sma_crossover',
+                 param_grid: Optional[Dict[str, List[Any]]] = None,
+                 method: str = 'grid',
+                 n_iter: int = 50,
+                 objective: str = 'sharpe_ratio',
+                 n_folds: int = 4,
+                 train_fraction: float = 0.7,
+                 window_size: Optional[int] = None,
+                 step_size: Optional[int] = None,
+                 halving_factor: int = 2,
+                 seed: Optional[int] = None,
+                 backtest_params: Optional[Dict[str, Any]] = None) -> OptimizationResult:
+        """
+        Sweep strategy parameters with walk-forward scoring.
+
+        Every candidate is backtested on the train and test part of each fold;
+        candidates are ranked by mean in-sample score and reported with their
+        out-of-sample scores. Candidates that cannot signal inside a training
+        window (an indicator window at least as long, or no in-sample trades)
+        are left out of the ranking. 'halving' starts all candidates on one
+        fold and keeps the best 1/halving_factor as the fold budget grows.
+        """
+        if strategy not in OPTIMIZER_STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Use one of {list(OPTIMIZER_STRATEGIES)}")
+        if method not in OPTIMIZER_METHODS:
+            raise ValueError(f"Unknown method '{method}'. Use one of {OPTIMIZER_METHODS}")
+        if objective not in PortfolioMetrics.__dataclass_fields__:
+            raise ValueError(f"Unknown objective '{objective}'")
+
+        close = data['Close'].to_numpy(dtype=np.float64)
+        folds = self.walk_forward_folds(len(close), n_folds, train_fraction, window_size, step_size)
+        if not folds:
+            raise ValueError("Not enough data for walk-forward folds")
+
+        candidates = self.parameter_grid(param_grid or OPTIMIZER_STRATEGIES[strategy])
+        if not candidates:
+            raise ValueError("Parameter grid is empty")
+        if method == 'random' and n_iter < len(candidates):
+            rng = np.random.default_rng(seed)
+            candidates = [candidates[i] for i in sorted(rng.choice(len(candidates), n_iter, replace=False))]
+
+        settings = {
+            'initial_capital': 10000, 'position_size': 0.95, 'commission': 0.001,
+            'slippage': 0.0005, 'stop_loss': None, 'take_profit': None,
+            **(backtest_params or {}), 'objective': objective,
+        }
+        workers = self.workers or min(os.cpu_count() or 1, 8)
+        scores: List[List[Tuple[float, float, float, int, int]]] = [[] for _ in candidates]
+        evaluations = 0
+
+        with _SweepPool(close, workers) as pool:
+            if method == 'halving':
+                alive = list(range(len(candidates)))
+                budget = 1
+                while True:
+                    budget = min(budget, len(folds))
+                    todo = folds[len(scores[alive[0]]):budget]
+                    rows = pool.evaluate(strategy, [candidates[i] for i in alive], todo, settings)
+                    for i, r in zip(alive, rows):
+                        scores[i].extend(r)
+                    evaluations += len(alive) * len(todo)
+                    if budget == len(folds) or len(alive) == 1:
+                        break
+                    alive.sort(key=lambda i: -self._in_sample_score(candidates[i], scores[i], folds))
+                    alive = sorted(alive[:max(1, -(-len(alive) // halving_factor))])
+                    budget *= halving_factor
+            else:
+                scores = pool.evaluate(strategy, candidates, folds, settings)
+                evaluations = len(candidates) * len(folds)
+
+        table, best = self._rank(candidates, scores, folds)
+        walk_forward = self._walk_forward_table(data.index, candidates, scores, folds)
+        result = OptimizationResult(
+            strategy=strategy, objective=objective, table=table, walk_forward=walk_forward,
+            best_params=dict(candidates[best]), evaluations=evaluations
+        )
+        self.optimization_results.append(result)
+        logger.info(f"Optimization of {strategy}: {len(candidates)} candidates, "
+                    f"{evaluations} fold evaluations, {workers} workers")
+        return result
+
+    @staticmethod
+    def _can_signal(params: Dict[str, Any], rows: List[tuple], folds: List[Tuple[int, int, int]]) -> bool:
+        """False for candidates whose indicators outlast the training window or that never traded in-sample"""
+        shortest_train = min(test_start - train_start for train_start, test_start, _ in folds[:max(1, len(rows))])
+        return _signal_lookback(params) < shortest_train and sum(r[3] for r in rows) > 0
+
+    @classmethod
+    def _in_sample_score(cls, params: Dict[str, Any], rows: List[tuple], folds: List[Tuple[int, int, int]]) -> float:
+        if not cls._can_signal(params, rows, folds):
+            return -np.inf
+        return float(np.nan_to_num(np.mean([r[0] for r in rows]), nan=-np.inf))
+
+    @classmethod
+    def _rank(cls, candidates: List[Dict[str, Any]], scores: List[List[tuple]],
+              folds: List[Tuple[int, int, int]]) -> Tuple[pd.DataFrame, int]:
+        rows = []
+        for i, (params, s) in enumerate(zip(candidates, scores)):
+            if not cls._can_signal(params, s, folds):
+                continue
+            s = np.asarray(s, dtype=np.float64).reshape(-1, 5)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN folds
+                rows.append({
+                    **params,
+                    'in_sample': np.nanmean(s[:, 0]),
+                    'out_of_sample': np.nanmean(s[:, 1]),
+                    'oos_std': np.nanstd(s[:, 1]),
+                    'oos_return_pct': np.nanmean(s[:, 2]),
+                    'is_trades': int(s[:, 3].sum()),
+                    'oos_trades': int(s[:, 4].sum()),
+                    'folds': len(s),
+                    'candidate': i,
+                })
+        if not rows:
+            raise ValueError("No candidate traded in-sample; use more bars per fold or shorter indicator periods")
+        table = pd.DataFrame(rows).replace([np.inf, -np.inf], np.nan)
+        table = table.sort_values(['folds', 'in_sample', 'out_of_sample'], ascending=False,
+                                  na_position='last', kind='stable')
+        best = int(table['candidate'].iloc[0])
+        table = table.drop(columns='candidate').reset_index(drop=True)
+        table.insert(0, 'rank', np.arange(1, len(table) + 1))
+        return table, best
+
+    @staticmethod
+    def _walk_forward_table(index: pd.Index, candidates: List[Dict[str, Any]], scores: List[List[tuple]],
+                            folds: List[Tuple[int, int, int]]) -> pd.DataFrame:
+        rows = []
+        for f, (train_start, test_start, test_end) in enumerate(folds):
+            scored = [(s[f][0], i) for i, s in enumerate(scores)
+                      if len(s) > f and np.isfinite(s[f][0]) and s[f][3] > 0
+                      and _signal_lookback(candidates[i]) < test_start - train_start]
+            if not scored:
+                continue
+            best = max(scored)[1]
+            rows.append({
+                'fold': f + 1,
+                'train_start': index[train_start],
+                'test_start': index[test_start],
+                'test_end': index[test_end - 1],
+                **candidates[best],
+                'in_sample': scores[best][f][0],
+                'out_of_sample': scores[best][f][1],
+                'oos_return_pct': scores[best][f][2],
+            })
+        return pd.DataFrame(rows)
+
     def optimize_parameters(self, strategy_config: Dict[str, Any],
                            optimization_targets: List[str]) -> Dict[str, Any]:
-        """Optimize strategy parameters using grid search or genetic algorithms"""
-        # Optimization logic would go here
-        return {}
+        """Optimize strategy parameters; strategy_config holds 'data' plus optimize() keyword arguments"""
+        config = dict(strategy_config)
+        data = config.pop('data')
+        result = self.optimize(data, objective=(optimization_targets or ['sharpe_ratio'])[0], **config)
+        return {'best_params': result.best_params, 'table': result.table, 'walk_forward': result.walk_forward}
 
     def walk_forward_analysis(self, strategy_config: Dict[str, Any],
                              window_size: int, step_size: int) -> List[Dict[str, Any]]:
         """Perform walk-forward analysis"""
-        # Walk-forward analysis would go here
-        return []
+        config = dict(strategy_config)
+        data = config.pop('data')
+        result = self.optimize(data, window_size=window_size, step_size=step_size, **config)
+        return result.walk_forward.to_dict('records')
 
 
 class AlertManager:
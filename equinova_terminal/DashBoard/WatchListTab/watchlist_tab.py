@@ -18,6 +18,7 @@ from decimal import Decimal, ROUND_HALF_UP
 # Try to import yfinance for real data, fallback to simulated data
 try:
     import yfinance as yf
+    from equinova_terminal.utils.quote_hub import get_quote_hub
 
     HAS_YFINANCE = True
     logger.info("yfinance module loaded successfully")
@@ -501,13 +502,12 @@ class WatchlistTab(BaseTab):
         while retries < MAX_RETRIES:
             try:
                 with operation(f"Fetch price for {ticker}"):
-                    stock = yf.Ticker(ticker)
-                    data = stock.history(period="30d", interval="1d")
+                    quote = get_quote_hub().get_quote(ticker, max_age=60)
 
-                    if data.empty:
+                    if quote is None:
                         raise ValueError("No data available")
 
-                    last_price = float(data["Close"].iloc[-1])
+                    last_price = quote.price
 
                     # Cache the price
                     self._price_cache[ticker] = (last_price, current_time)
@@ -520,14 +520,10 @@ class WatchlistTab(BaseTab):
                         """, [ticker, last_price])
 
                     # Calculate changes
-                    if len(data) >= 2:
-                        prev_price = float(data["Close"].iloc[-2])
-                        change = last_price - prev_price
-                        change_pct = (change / prev_price * 100) if abs(prev_price) > 1e-10 else 0.0
-                        change_pct = self._round_percentage(change_pct)
-                    else:
-                        change = 0.0
-                        change_pct = 0.0
+                    prev_price = quote.previous_close
+                    change = last_price - prev_price
+                    change_pct = (change / prev_price * 100) if abs(prev_price) > 1e-10 else 0.0
+                    change_pct = self._round_percentage(change_pct)
 
                     # Update watchlist data atomically
                     with self._update_lock:
@@ -584,13 +580,11 @@ class WatchlistTab(BaseTab):
                 tickers = list(self.watchlist.keys())
                 logger.info("Starting price refresh", context={"ticker_count": len(tickers)})
 
-                for i, ticker in enumerate(tickers):
+                # One bulk fetch for the whole list; the per-ticker calls below hit the hub cache
+                get_quote_hub().get_quotes(tickers)
+                for ticker in tickers:
                     self.fetch_single_price(ticker)
 
-                    # Rate limiting - avoid overwhelming the API
-                    if i < len(tickers) - 1:  # Don't sleep after the last request
-                        time.sleep(REQUEST_DELAY)
-
                 self.save_watchlist_to_database()
                 logger.info("Price refresh completed")
 
@@ -3,12 +3,13 @@ from __future__ import annotations
 import threading
 import time
 from typing import List, Dict
-import yfinance as yf
+
+from equinova_terminal.utils.quote_hub import get_quote_hub
 
 class YFinancePoller:
     """
-    Polls Yahoo Finance every N seconds for given tickers.
-    Returns a dict per symbol with last/percent change etc.
+    Polls the shared quote hub every N seconds for given tickers.
+    Returns a dict per symbol with last/change vs previous close/percent change.
     """
     def __init__(self, symbols: List[str], interval_sec: int = 5):
         self.symbols = symbols
@@ -34,41 +35,20 @@ class YFinancePoller:
         return dict(self._latest)
 
     def _run(self):
+        hub = get_quote_hub()
         while not self._stop.is_set():
             try:
-                data = yf.download(
-                    tickers=" ".join(self.symbols),
-                    period="1d",
-                    interval="1m",
-                    threads=True,
-                    progress=False
-                )
-                now = {}
-                for sym in self.symbols:
-                    try:
-                        last_close = float(data["Close"][sym].dropna().iloc[-1])
-                        prev_close = float(data["Close"][sym].dropna().iloc[-2])
-                        change = last_close - prev_close
-                        pct = (change / prev_close) * 100 if prev_close else 0.0
-                        now[sym] = {
-                            "last": round(last_close, 4),
-                            "change": round(change, 4),
-                            "pct": round(pct, 4),
-                        }
-                    except Exception:
-                        try:
-                            last_close = float(data["Close"].dropna().iloc[-1])
-                            prev_close = float(data["Close"].dropna().iloc[-2])
-                            change = last_close - prev_close
-                            pct = (change / prev_close) * 100 if prev_close else 0.0
-                            now[sym] = {
-                                "last": round(last_close, 4),
-                                "change": round(change, 4),
-                                "pct": round(pct, 4),
-                            }
-                        except Exception:
-                            pass
-                self._latest = now
+                # shared, coalesced fetch; anything younger than one tick comes from the hub cache
+                quotes = hub.get_quotes(self.symbols, fields=("price", "change", "change_pct"),
+                                        max_age=self.interval_sec)
+                self._latest = {
+                    sym: {
+                        "last": round(q.price, 4),
+                        "change": round(q.change, 4),
+                        "pct": round(q.change_pct, 4),
+                    }
+                    for sym, q in quotes.items()
+                }
             except Exception:
                 pass
-            self._stop.wait(self.interval_sec)
\ No newline at end of file
+            self._stop.wait(self.interval_sec)
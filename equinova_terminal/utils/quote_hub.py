@@ -0,0 +1,440 @@
+"""
+Quote Hub Module
+One in-process quote service shared by every tab and the web API
+
+Callers ask the hub instead of calling yfinance themselves:
+
+- daily bars are cached per (symbol, period, interval) with their fetch time,
+  and quotes are derived from them, so each field is served from memory until
+  it is older than the caller's max age (session fields go stale in seconds,
+  7d/30d trends in an hour);
+- concurrent requests for the same bars share one in-flight upstream fetch;
+- whatever is missing is fetched in bulk, one upstream call per chunk;
+- subscriptions are refreshed by a single background thread and every fetch
+  pushes fresh quotes to the subscribers that hold those symbols.
+
+The upstream is any object with fetch_history(symbols, period, interval);
+YFinanceUpstream is the default, set_quote_hub() swaps in another.
+"""
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import Future, wait
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SESSION_FIELDS = ("price", "previous_close", "change", "change_pct", "open", "high", "low", "volume")
+TREND_FIELDS = ("change_pct_7d", "change_pct_30d")
+
+_WEEK = ("5d", "1d")
+_MONTH = ("1mo", "1d")
+# field group -> default max age in seconds
+_MAX_AGE = {"session": 15.0, "trend": 3600.0}
+# bars each group can be read from; the month frame's last bars carry the
+# session fields too, so a caller wanting both costs one download
+_SOURCES = {"session": (_WEEK, _MONTH), "trend": (_MONTH,)}
+_FIELD_GROUP = {**{f: "session" for f in SESSION_FIELDS}, **{f: "trend" for f in TREND_FIELDS}}
+
+QuoteCallback = Callable[[Dict[str, "Quote"]], None]
+
+
+# ---------------- upstream ----------------
+
+class YFinanceUpstream:
+    """
+    Bulk Yahoo Finance bars: one yf.download per call, then Ticker.history for
+    the symbols the batch came back without. Closes are raw (auto_adjust=False),
+    so "price" is the traded price rather than a dividend/split-adjusted one.
+    """
+
+    def __init__(self, max_concurrency: int = int(os.getenv("YAHOO_MAX_CONCURRENCY", "8"))):
+        self.max_concurrency = max_concurrency
+        self._sem = threading.BoundedSemaphore(max_concurrency)
+
+    def fetch_history(self, symbols: Sequence[str], period: str, interval: str) -> Dict[str, pd.DataFrame]:
+        import yfinance as yf
+
+        out: Dict[str, pd.DataFrame] = {}
+        with self._sem:
+            df = yf.download(list(symbols), period=period, interval=interval, group_by="ticker",
+                             auto_adjust=False, threads=True, progress=False)
+        if df is not None and not df.empty:
+            if isinstance(df.columns, pd.MultiIndex):
+                present = set(df.columns.get_level_values(0))
+                for sym in symbols:
+                    if sym in present:
+                        bars = df[sym].dropna(how="all")
+                        if not bars.empty:
+                            out[sym] = bars
+            elif len(symbols) == 1:
+                out[symbols[0]] = df.dropna(how="all")
+
+        for sym in symbols:
+            if sym in out:
+                continue
+            try:
+                with self._sem:
+                    bars = yf.Ticker(sym).history(period=period, interval=interval, auto_adjust=False)
+                if bars is not None and not bars.empty:
+                    out[sym] = bars
+            except Exception as e:
+                logger.debug(f"Single-ticker fetch failed for {sym}: {e}")
+        return out
+
+
+# ---------------- quotes ----------------
+
+@dataclass
+class Quote:
+    """Latest figures for one symbol; as_of holds the fetch time behind each field"""
+    symbol: str
+    price: Optional[float] = None
+    previous_close: Optional[float] = None
+    change: Optional[float] = None
+    change_pct: Optional[float] = None
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    volume: Optional[int] = None
+    change_pct_7d: Optional[float] = None
+    change_pct_30d: Optional[float] = None
+    as_of: Dict[str, float] = field(default_factory=dict)
+
+    def age(self, name: str) -> float:
+        """Seconds since `name` was fetched (inf if it never was)"""
+        t = self.as_of.get(name)
+        return float("inf") if t is None else max(0.0, time.time() - t)
+
+
+def _pct(now: float, then: float) -> float:
+    return (now - then) / then * 100.0 if then else 0.0
+
+
+def _session_fields(bars: pd.DataFrame) -> Dict[str, object]:
+    closes = bars["Close"].dropna()
+    if closes.empty:
+        return {}
+    last = bars.loc[closes.index[-1]]
+    price = float(closes.iloc[-1])
+    prev = float(closes.iloc[-2]) if len(closes) >= 2 else price
+    volume = last.get("Volume")
+    return {
+        "price": price,
+        "previous_close": prev,
+        "change": price - prev,
+        "change_pct": _pct(price, prev),
+        "open": float(last["Open"]) if "Open" in last and pd.notna(last["Open"]) else price,
+        "high": float(last["High"]) if "High" in last and pd.notna(last["High"]) else price,
+        "low": float(last["Low"]) if "Low" in last and pd.notna(last["Low"]) else price,
+        "volume": int(volume) if volume is not None and pd.notna(volume) else 0,
+    }
+
+
+def _trend_fields(bars: pd.DataFrame) -> Dict[str, object]:
+    closes = bars["Close"].dropna()
+    if closes.empty:
+        return {}
+    price = float(closes.iloc[-1])
+    n = len(closes)
+    # 30d falls back to the first bar when the window holds fewer sessions
+    return {
+        "change_pct_7d": _pct(price, float(closes.iloc[-7])) if n >= 7 else 0.0,
+        "change_pct_30d": _pct(price, float(closes.iloc[-30 if n >= 30 else 0])) if n > 1 else 0.0,
+    }
+
+
+@dataclass
+class _Record:
+    bars: pd.DataFrame
+    fetched_at: float
+    derived: Dict[str, object]  # quote fields computed once when the bars land
+
+
+@dataclass
+class _Subscription:
+    symbols: frozenset
+    callback: QuoteCallback
+    fields: Tuple[str, ...]
+
+
+class QuoteHub:
+    """
+    Args:
+        upstream: object with fetch_history(symbols, period, interval) -> {symbol: bars}
+        batch_size: symbols per upstream call
+        refresh_sec: how often subscribed symbols are refreshed
+        wait_timeout: longest a caller waits on a fetch another caller started
+    """
+
+    def __init__(self, upstream=None, batch_size: int = 100, refresh_sec: float = 15.0,
+                 wait_timeout: float = 30.0):
+        self.upstream = upstream if upstream is not None else YFinanceUpstream()
+        self.batch_size = max(1, int(batch_size))
+        self.refresh_sec = refresh_sec
+        self.wait_timeout = wait_timeout
+        self.errors: Dict[str, str] = {}
+
+        self._lock = threading.Lock()
+        self._records: Dict[Tuple[str, str, str], _Record] = {}
+        self._inflight: Dict[Tuple[str, str, str], Future] = {}
+        self._subs: Dict[int, _Subscription] = {}
+        self._next_token = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------- bars ----------------
+
+    def get_history(self, symbols: Iterable[str], period: str = "5d", interval: str = "1d",
+                    max_age: float = 60.0) -> Dict[str, pd.DataFrame]:
+        """
+        Bars per symbol, fetched only for symbols with no record younger than
+        max_age. Symbols the upstream has nothing for are left out.
+        """
+        syms = list(dict.fromkeys(symbols))
+        now = time.time()
+        mine: List[str] = []
+        others: List[Future] = []
+        with self._lock:
+            for s in syms:
+                key = (s, period, interval)
+                rec = self._records.get(key)
+                if rec is not None and now - rec.fetched_at <= max_age:
+                    continue
+                fut = self._inflight.get(key)
+                if fut is None:
+                    self._inflight[key] = Future()
+                    mine.append(s)
+                else:
+                    others.append(fut)
+
+        if mine:
+            self._fetch(mine, period, interval)
+        if others:
+            wait(others, timeout=self.wait_timeout)
+
+        with self._lock:
+            out = {}
+            for s in syms:
+                rec = self._records.get((s, period, interval))
+                if rec is not None and not rec.bars.empty:
+                    out[s] = rec.bars
+            return out
+
+    def _fetch(self, symbols: List[str], period: str, interval: str):
+        try:
+            for i in range(0, len(symbols), self.batch_size):
+                self._fetch_chunk(symbols[i:i + self.batch_size], period, interval)
+        finally:
+            # never leave waiters hanging, whatever went wrong above
+            with self._lock:
+                left = [self._inflight.pop((s, period, interval), None) for s in symbols]
+            for fut in left:
+                if fut is not None:
+                    fut.set_result(None)
+
+    def _fetch_chunk(self, chunk: List[str], period: str, interval: str):
+        got: Dict[str, pd.DataFrame] = {}
+        failure = None
+        try:
+            got = self.upstream.fetch_history(chunk, period, interval)
+        except Exception as e:
+            failure = str(e) or type(e).__name__
+            logger.warning(f"Quote upstream failed for {len(chunk)} symbols: {failure}")
+
+        now = time.time()
+        fresh = {}
+        for s in chunk:
+            bars = got.get(s)
+            if bars is not None and not bars.empty:
+                derived = {}
+                if interval == "1d" and "Close" in bars:
+                    derived = {**_session_fields(bars), **_trend_fields(bars)}
+                fresh[s] = _Record(bars, now, derived)
+
+        done = []
+        with self._lock:
+            for s in chunk:
+                key = (s, period, interval)
+                if s in fresh:
+                    self._records[key] = fresh[s]
+                    self.errors.pop(s, None)
+                elif failure is None:
+                    # remember the miss too, so unknown symbols are not refetched on every call
+                    self._records[key] = _Record(pd.DataFrame(), now, {})
+                    self.errors[s] = "No data"
+                else:
+                    self.errors[s] = failure  # keep any older bars; retry on the next call
+                fut = self._inflight.pop(key, None)
+                if fut is not None:
+                    done.append(fut)
+        for fut in done:
+            fut.set_result(None)
+        if fresh and interval == "1d":
+            self._publish(list(fresh), (period, interval))
+
+    # ---------------- quotes ----------------
+
+    def get_quotes(self, symbols: Iterable[str], fields: Sequence[str] = SESSION_FIELDS,
+                   max_age: Optional[float] = None) -> Dict[str, Quote]:
+        """
+        Quotes for the symbols the upstream knows; fields outside `fields` are
+        left as None. max_age overrides every group's default freshness.
+        """
+        syms = list(dict.fromkeys(symbols))
+        ages = dict(_MAX_AGE) if max_age is None else dict.fromkeys(_MAX_AGE, max_age)
+        for source, stale, age in self._stale(syms, fields, ages):
+            self.get_history(stale, *source, max_age=age)
+        return self._quotes(syms, fields)
+
+    def get_quote(self, symbol: str, fields: Sequence[str] = SESSION_FIELDS,
+                  max_age: Optional[float] = None) -> Optional[Quote]:
+        return self.get_quotes([symbol], fields, max_age).get(symbol)
+
+    def _stale(self, symbols: List[str], fields: Sequence[str],
+               ages: Dict[str, float]) -> List[Tuple[Tuple[str, str], List[str], float]]:
+        """
+        (source, symbols, max age) fetches that bring `fields` within their
+        group's max age in `ages`: the month frame where trends are stale (it
+        refreshes the session fields too), the week frame where only session
+        fields are.
+        """
+        groups = {_FIELD_GROUP[f] for f in fields}
+        now = time.time()
+        week, month = [], []
+        with self._lock:
+            for s in symbols:
+                held = {src: now - r.fetched_at for src in (_WEEK, _MONTH)
+                        for r in [self._records.get((s, *src))] if r is not None}
+                if "trend" in groups and held.get(_MONTH, float("inf")) > ages["trend"]:
+                    month.append(s)
+                elif "session" in groups and min(held.values(), default=float("inf")) > ages["session"]:
+                    week.append(s)
+        plan = []
+        if week:
+            plan.append((_WEEK, week, ages["session"]))
+        if month:
+            plan.append((_MONTH, month, ages["trend"]))
+        return plan
+
+    def _quotes(self, symbols: Iterable[str], fields: Sequence[str]) -> Dict[str, Quote]:
+        out: Dict[str, Quote] = {}
+        by_group: Dict[str, List[str]] = {}
+        for f in fields:
+            by_group.setdefault(_FIELD_GROUP[f], []).append(f)
+        with self._lock:
+            for s in symbols:
+                q = None
+                for g, names in by_group.items():
+                    held = [r for src in _SOURCES[g] for r in [self._records.get((s, *src))]
+                            if r is not None and r.derived]
+                    if not held:
+                        continue
+                    rec = max(held, key=lambda r: r.fetched_at)
+                    if q is None:
+                        q = Quote(s)
+                    for name in names:
+                        setattr(q, name, rec.derived[name])
+                        q.as_of[name] = rec.fetched_at
+                if q is not None:
+                    out[s] = q
+        return out
+
+    # ---------------- subscriptions ----------------
+
+    def subscribe(self, symbols: Iterable[str], callback: QuoteCallback,
+                  fields: Sequence[str] = SESSION_FIELDS) -> int:
+        """
+        Call `callback({symbol: Quote})` whenever any of `symbols` is refreshed,
+        by the background thread or by another caller's fetch. Returns a token
+        for unsubscribe(). Callbacks run on the fetching thread; keep them short.
+        """
+        with self._lock:
+            self._next_token += 1
+            token = self._next_token
+            self._subs[token] = _Subscription(frozenset(symbols), callback, tuple(fields))
+        self.start()
+        return token
+
+    def unsubscribe(self, token: int):
+        with self._lock:
+            self._subs.pop(token, None)
+
+    def _publish(self, symbols: List[str], source: Tuple[str, str]):
+        groups = {g for g, sources in _SOURCES.items() if source in sources}
+        if not groups:
+            return
+        changed = set(symbols)
+        with self._lock:
+            subs = list(self._subs.values())
+        for sub in subs:
+            hit = sub.symbols & changed
+            if not hit or not any(_FIELD_GROUP[f] in groups for f in sub.fields):
+                continue
+            try:
+                sub.callback(self._quotes(hit, sub.fields))
+            except Exception as e:
+                logger.warning(f"Quote subscriber failed: {e}")
+
+    def refresh_subscriptions(self):
+        """One refresh pass over the union of every subscription"""
+        with self._lock:
+            subs = list(self._subs.values())
+        # refresh each group early enough that it is not stale before the next pass
+        ages = {g: max(age - self.refresh_sec, self.refresh_sec) for g, age in _MAX_AGE.items()}
+        by_fields: Dict[Tuple[str, ...], set] = {}
+        for sub in subs:
+            by_fields.setdefault(tuple(sorted(set(sub.fields))), set()).update(sub.symbols)
+        plan: Dict[Tuple[Tuple[str, str], float], set] = {}
+        for fields, syms in by_fields.items():
+            for source, stale, age in self._stale(sorted(syms), fields, ages):
+                plan.setdefault((source, age), set()).update(stale)
+        for (source, age), syms in plan.items():
+            self.get_history(sorted(syms), *source, max_age=age)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_subscriptions()
+            except Exception as e:
+                logger.warning(f"Quote refresh failed: {e}")
+            self._stop.wait(self.refresh_sec)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="quote-hub", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+
+_hub: Optional[QuoteHub] = None
+_init_lock = threading.Lock()
+
+
+def get_quote_hub() -> QuoteHub:
+    global _hub
+    if _hub is None:
+        with _init_lock:
+            if _hub is None:
+                _hub = QuoteHub()
+    return _hub
+
+
+def set_quote_hub(hub: QuoteHub) -> Optional[QuoteHub]:
+    """Install another hub (e.g. over a different upstream); returns the previous one"""
+    global _hub
+    with _init_lock:
+        previous, _hub = _hub, hub
+    return previous
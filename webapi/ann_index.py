@@ -0,0 +1,193 @@
+"""
+Pure-numpy nearest-neighbour backends for the RAG searcher.
+
+All backends take L2-normalized float32 rows and score by inner product.
+
+  ExactIndex  brute-force matrix-vector product (the previous behaviour)
+  IVFIndex    inverted-file index: spherical k-means centroids, each row is
+              filed under its nearest centroid and a query scans only the
+              `nprobe` best lists. Falls back to exact search until the corpus
+              reaches `exact_below` rows, and re-trains when it has grown 4x
+              since the last training.
+
+Both support incremental `add()`. Readers never take a lock: every mutation
+builds new arrays and publishes them with a single attribute assignment.
+`search(..., n=...)` limits results to the first n rows so a caller holding
+older metadata never sees ids it can't resolve.
+"""
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+_CHUNK = 65536  # rows per block when assigning to centroids
+
+
+def topk(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best scores, best first (argpartition + small sort)."""
+    n = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    part = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+    return part[np.argsort(-scores[part])]
+
+
+class _Buffer:
+    """Append-only row buffer with amortized doubling."""
+
+    def __init__(self, dim: int = 0):
+        self.data = np.zeros((0, dim), dtype=np.float32)
+        self.n = 0
+
+    def extend(self, rows: np.ndarray):
+        m = rows.shape[0]
+        if self.data.shape[1] != rows.shape[1]:
+            self.data = np.zeros((0, rows.shape[1]), dtype=np.float32)
+            self.n = 0
+        if self.n + m > self.data.shape[0]:
+            grown = np.empty((max(2 * self.data.shape[0], self.n + m, 1024), rows.shape[1]),
+                             dtype=np.float32)
+            grown[: self.n] = self.data[: self.n]
+            self.data = grown  # readers holding the old array keep a valid view
+        self.data[self.n : self.n + m] = rows
+        self.n += m
+
+    def view(self) -> np.ndarray:
+        return self.data[: self.n]
+
+
+class ExactIndex:
+    def __init__(self):
+        self._buf = _Buffer()
+        self._vecs = self._buf.view()
+
+    def __len__(self) -> int:
+        return self._vecs.shape[0]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vecs
+
+    def add(self, rows: np.ndarray):
+        if rows.shape[0]:
+            self._buf.extend(np.asarray(rows, dtype=np.float32))
+            self._vecs = self._buf.view()
+
+    def scores(self, q: np.ndarray, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(candidate ids, scores). Exact: every row is a candidate."""
+        vecs = self._vecs if n is None else self._vecs[:n]
+        return np.arange(vecs.shape[0]), vecs @ q
+
+    def search(self, q: np.ndarray, k: int, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        ids, s = self.scores(q, n)
+        best = topk(s, k)
+        return ids[best], s[best]
+
+
+def spherical_kmeans(x: np.ndarray, k: int, iters: int = 8, seed: int = 0) -> np.ndarray:
+    """Unit-norm centroids maximizing inner product with their members."""
+    rng = np.random.default_rng(seed)
+    cent = x[rng.choice(x.shape[0], size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.argmax(x @ cent.T, axis=1)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=k)
+        sums = np.zeros_like(cent)
+        live = counts > 0
+        sums[live] = np.add.reduceat(x[order], np.concatenate([[0], np.cumsum(counts)[:-1]])[live])
+        empty = counts == 0
+        if empty.any():  # re-seed dead centroids from random points
+            sums[empty] = x[rng.choice(x.shape[0], size=int(empty.sum()), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        cent = (sums / norms).astype(np.float32)
+    return cent
+
+
+class IVFIndex(ExactIndex):
+    def __init__(self, nprobe: int = 8, nlist: Optional[int] = None,
+                 exact_below: int = 10000, seed: int = 0):
+        super().__init__()
+        self.nprobe = nprobe
+        self.nlist = nlist
+        self.exact_below = exact_below
+        self.seed = seed
+        self._trained_at = 0
+        # (centroids, per-list id arrays), swapped together
+        self._ivf: Optional[Tuple[np.ndarray, List[np.ndarray]]] = None
+
+    @property
+    def trained(self) -> bool:
+        return self._ivf is not None
+
+    def _assign(self, cent: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        out = np.empty(rows.shape[0], dtype=np.int64)
+        for s in range(0, rows.shape[0], _CHUNK):
+            out[s : s + _CHUNK] = np.argmax(rows[s : s + _CHUNK] @ cent.T, axis=1)
+        return out
+
+    @staticmethod
+    def _group(assign: np.ndarray, ids: np.ndarray, nlist: int) -> List[np.ndarray]:
+        order = np.argsort(assign, kind="stable")
+        bounds = np.searchsorted(assign[order], np.arange(nlist + 1))
+        sorted_ids = ids[order]
+        return [sorted_ids[bounds[c] : bounds[c + 1]] for c in range(nlist)]
+
+    def train(self):
+        vecs = self._vecs
+        n = vecs.shape[0]
+        nlist = self.nlist or int(np.clip(2 * np.sqrt(n), 16, 4096))
+        nlist = min(nlist, n)
+        rng = np.random.default_rng(self.seed)
+        sample = vecs[rng.choice(n, size=min(n, 32 * nlist), replace=False)]
+        cent = spherical_kmeans(sample, nlist, seed=self.seed)
+        lists = self._group(self._assign(cent, vecs), np.arange(n), nlist)
+        self._ivf = (cent, lists)
+        self._trained_at = n
+
+    def add(self, rows: np.ndarray):
+        if not rows.shape[0]:
+            return
+        start = len(self)
+        super().add(rows)
+        n = len(self)
+        if n < self.exact_below:
+            return
+        if self._ivf is None or n > 4 * self._trained_at:
+            self.train()
+            return
+        cent, lists = self._ivf
+        new = self._group(self._assign(cent, self._vecs[start:n]), np.arange(start, n), len(lists))
+        self._ivf = (cent, [np.concatenate([a, b]) if b.size else a for a, b in zip(lists, new)])
+
+    def scores(self, q: np.ndarray, n: Optional[int] = None,
+               nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        ivf, vecs = self._ivf, self._vecs
+        if ivf is None:
+            return super().scores(q, n)
+        cent, lists = ivf
+        probe = topk(cent @ q, nprobe or self.nprobe)
+        cand = np.concatenate([lists[c] for c in probe])
+        if n is not None and n < vecs.shape[0]:
+            cand = cand[cand < n]
+        return cand, vecs[cand] @ q
+
+    def search(self, q: np.ndarray, k: int, n: Optional[int] = None,
+               nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        ids, s = self.scores(q, n, nprobe)
+        best = topk(s, k)
+        return ids[best], s[best]
+
+
+def make_index(backend: Optional[str] = None) -> ExactIndex:
+    """Backend from RAG_ANN_BACKEND ('ivf' default, or 'exact')."""
+    backend = (backend or os.getenv("RAG_ANN_BACKEND", "ivf")).lower()
+    if backend == "exact":
+        return ExactIndex()
+    if backend == "ivf":
+        return IVFIndex(
+            nprobe=int(os.getenv("RAG_ANN_NPROBE", "8")),
+            exact_below=int(os.getenv("RAG_ANN_EXACT_BELOW", "10000")),
+        )
+    raise ValueError(f"unknown ANN backend: {backend}")
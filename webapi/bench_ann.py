@@ -0,0 +1,81 @@
+"""
+Benchmark: IVF vs the exact linear scan used by RagSearcher.
+
+Synthetic clustered unit vectors (news headlines cluster by topic, so uniform
+random data would flatter neither backend). Reports build time, recall@k
+against the exact result and p50/p99 query latency.
+
+    python -m webapi.bench_ann                       # 10k, 100k, 1M @ dim 128
+    python -m webapi.bench_ann --sizes 10000 --dim 1536 --nprobe 4 8 16
+"""
+import argparse, time
+from typing import List
+
+import numpy as np
+
+from webapi.ann_index import ExactIndex, IVFIndex
+
+
+def _clustered(n: int, dim: int, n_topics: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.standard_normal((n_topics, dim)).astype(np.float32)
+    out = np.empty((n, dim), dtype=np.float32)
+    for s in range(0, n, 65536):
+        m = min(65536, n - s)
+        out[s : s + m] = centers[rng.integers(0, n_topics, m)]
+        out[s : s + m] += 0.6 * rng.standard_normal((m, dim)).astype(np.float32)
+    out /= np.linalg.norm(out, axis=1, keepdims=True)
+    return out
+
+
+def _latencies(fn, queries: np.ndarray) -> np.ndarray:
+    out = np.empty(len(queries))
+    for i, q in enumerate(queries):
+        t0 = time.perf_counter()
+        fn(q)
+        out[i] = time.perf_counter() - t0
+    return out * 1e3
+
+
+def run(sizes: List[int], dim: int, k: int, n_queries: int, nprobes: List[int], seed: int):
+    rng = np.random.default_rng(seed)
+    print(f"{'N':>9} {'backend':>12} {'build_s':>8} {'recall@' + str(k):>9} {'p50_ms':>8} {'p99_ms':>8}")
+    for n in sizes:
+        data = _clustered(n, dim, max(16, n // 500), rng)
+        queries = data[rng.choice(n, n_queries, replace=False)]
+        queries = queries + 0.1 * rng.standard_normal(queries.shape).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        exact = ExactIndex()
+        exact.add(data)
+        truth = [set(exact.search(q, k)[0].tolist()) for q in queries]
+        lat = _latencies(lambda q: exact.search(q, k), queries)
+        print(f"{n:>9} {'exact':>12} {0.0:>8.2f} {1.0:>9.3f} "
+              f"{np.percentile(lat, 50):>8.3f} {np.percentile(lat, 99):>8.3f}")
+
+        t0 = time.perf_counter()
+        ivf = IVFIndex(exact_below=0, seed=seed)
+        ivf.add(data)
+        build = time.perf_counter() - t0
+        for nprobe in nprobes:
+            hits = [ivf.search(q, k, nprobe=nprobe)[0] for q in queries]
+            recall = np.mean([len(truth[i].intersection(h.tolist())) / k for i, h in enumerate(hits)])
+            lat = _latencies(lambda q: ivf.search(q, k, nprobe=nprobe), queries)
+            print(f"{n:>9} {'ivf/np=' + str(nprobe):>12} {build:>8.2f} {recall:>9.3f} "
+                  f"{np.percentile(lat, 50):>8.3f} {np.percentile(lat, 99):>8.3f}")
+        del data, exact, ivf
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--dim", type=int, default=128)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    ap.add_argument("--seed", type=int, default=0)
+    a = ap.parse_args()
+    run(a.sizes, a.dim, a.k, a.queries, a.nprobe, a.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Shared embedding client + query-embedding cache.
+
+One OpenAI client (and therefore one HTTP connection pool) per process, and a
+bounded LRU/TTL cache of query vectors keyed by (model, normalized text).
+`QueryEmbedder` takes any `embed_fn(texts, model) -> vectors`, so it can be
+driven by a local fake with no network.
+"""
+import os, time, atexit, threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EmbedFn = Callable[[Sequence[str], str], Sequence[Sequence[float]]]
+
+DEFAULT_MODEL = "text-embedding-3-small"
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide OpenAI client; its httpx pool is reused by every caller."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+                from openai import OpenAI, DefaultHttpxClient
+                _client = OpenAI(
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    timeout=float(os.getenv("OPENAI_EMBED_TIMEOUT", "10")),
+                    http_client=DefaultHttpxClient(
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    ),
+                )
+    return _client
+
+
+def openai_embed(texts: Sequence[str], model: str) -> List[List[float]]:
+    out = get_client().embeddings.create(model=model, input=list(texts))
+    return [d.embedding for d in out.data]
+
+
+def normalize_text(text: str) -> str:
+    return " ".join((text or "").split()).casefold()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU with per-entry TTL; optional .npz persistence."""
+
+    def __init__(self, max_items: int = 2048, ttl_sec: float = 24 * 3600,
+                 path: Optional[str] = None):
+        self.max_items = max_items
+        self.ttl_sec = ttl_sec
+        self.path = path
+        self._data: "OrderedDict[Tuple[str, str], Tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self.load()
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        key = (model, normalize_text(text))
+        now = time.time()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None or now - hit[0] > self.ttl_sec:
+                if hit is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return hit[1]
+
+    def put(self, model: str, text: str, vec: np.ndarray, ts: Optional[float] = None):
+        key = (model, normalize_text(text))
+        v = np.asarray(vec, dtype=np.float32)
+        v.setflags(write=False)  # shared between callers
+        with self._lock:
+            self._data[key] = (time.time() if ts is None else ts, v)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    # ---------------- persistence ----------------
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            entries = list(self._data.items())
+        if not entries:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        vecs = [v for _, (_, v) in entries]
+        offsets = np.cumsum([0] + [v.shape[0] for v in vecs])
+        tmp = self.path + ".tmp.npz"
+        np.savez(
+            tmp,
+            models=np.array([k[0] for k, _ in entries]),
+            texts=np.array([k[1] for k, _ in entries]),
+            ts=np.array([t for _, (t, _) in entries], dtype=np.float64),
+            offsets=offsets.astype(np.int64),
+            flat=np.concatenate(vecs).astype(np.float32),
+        )
+        os.replace(tmp, self.path)
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as z:
+                models, texts, ts = z["models"], z["texts"], z["ts"]
+                offsets, flat = z["offsets"], z["flat"]
+        except Exception as e:
+            print("[embed-cache] ignoring unreadable cache file:", e)
+            return
+        now = time.time()
+        for i in range(len(texts)):
+            if now - float(ts[i]) <= self.ttl_sec:
+                self.put(str(models[i]), str(texts[i]), flat[offsets[i]:offsets[i + 1]], float(ts[i]))
+
+
+class QueryEmbedder:
+    def __init__(self, embed_fn: Optional[EmbedFn] = None, model: Optional[str] = None,
+                 cache: Optional[EmbeddingCache] = None):
+        self.embed_fn = embed_fn or openai_embed
+        self.model = model or os.getenv("OPENAI_EMBED_MODEL", DEFAULT_MODEL)
+        self.cache = cache if cache is not None else EmbeddingCache()
+
+    def embed(self, text: str) -> np.ndarray:
+        vec = self.cache.get(self.model, text)
+        if vec is None:
+            vec = np.asarray(self.embed_fn([" ".join(text.split())], self.model)[0], dtype=np.float32)
+            self.cache.put(self.model, text, vec)
+        return vec
+
+
+_query_embedder: Optional[QueryEmbedder] = None
+
+
+def get_query_embedder() -> QueryEmbedder:
+    global _query_embedder
+    if _query_embedder is None:
+        with _client_lock:
+            if _query_embedder is None:
+                cache = EmbeddingCache(
+                    max_items=int(os.getenv("RAG_EMBED_CACHE_SIZE", "2048")),
+                    ttl_sec=float(os.getenv("RAG_EMBED_CACHE_TTL", str(24 * 3600))),
+                    path=os.getenv("RAG_EMBED_CACHE_FILE") or None,
+                )
+                if cache.path:
+                    atexit.register(cache.save)
+                _query_embedder = QueryEmbedder(cache=cache)
+    return _query_embedder
@@ -0,0 +1,211 @@
+"""
+Async RSS/Atom ingestion.
+
+- One aiohttp session (shared connection pool) on a private event-loop thread,
+  so sync callers (FastAPI handlers, Pathway connector threads) can use it too.
+- Conditional GET: ETag / Last-Modified are remembered per URL, an unchanged
+  feed costs a 304 and its previously parsed items are served from memory.
+- Bodies are parsed incrementally with XMLPullParser as chunks arrive; items
+  come out as dicts keyed by GUID (falling back to link, then title hash).
+"""
+import os, asyncio, hashlib, threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+import aiohttp
+
+USER_AGENT = "EquiNova/1.0"
+_CHUNK = 16384
+_DATE_TAGS = ("pubDate", "published", "updated", "date")  # RSS, Atom, Atom, dc:date
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
+
+
+def _item_from_element(el) -> Optional[Dict[str, str]]:
+    fields: Dict[str, str] = {}
+    for child in el:
+        name = _local(child.tag)
+        if name == "link" and child.get("href"):  # Atom <link href=...>
+            fields.setdefault("link", child.get("href", ""))
+        elif name not in fields:
+            fields[name] = (child.text or "").strip()
+    title = fields.get("title", "")
+    if not title:
+        return None
+    link = fields.get("link", "")
+    guid = fields.get("guid") or fields.get("id") or link or hashlib.sha256(title.encode("utf-8")).hexdigest()
+    published = next((fields[t] for t in _DATE_TAGS if fields.get(t)), "")
+    desc = fields.get("description") or fields.get("summary") or ""
+    return {"id": guid, "title": title, "link": link, "published": published,
+            "description": desc[:500]}
+
+
+class FeedParser:
+    """Incremental RSS 2.0 / Atom parser: feed() bytes, collect items as they complete."""
+
+    def __init__(self, limit: Optional[int] = None):
+        self._p = XMLPullParser(events=("end",))
+        self.limit = limit
+        self.items: List[Dict[str, str]] = []
+        self.error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.error is not None or (self.limit is not None and len(self.items) >= self.limit)
+
+    def _drain(self):
+        for _, el in self._p.read_events():
+            if _local(el.tag) in ("item", "entry"):
+                it = _item_from_element(el)
+                el.clear()  # keep memory flat on large feeds
+                if it:
+                    self.items.append(it)
+                    if self.done:
+                        return
+
+    def feed(self, data: bytes):
+        if self.done:
+            return
+        try:
+            self._p.feed(data)
+            self._drain()
+        except ParseError as e:
+            self.error = str(e)  # keep what was parsed before the bad byte
+
+    def close(self) -> List[Dict[str, str]]:
+        if not self.done:
+            try:
+                self._p.close()
+                self._drain()
+            except ParseError as e:
+                self.error = str(e)
+        return self.items
+
+
+def parse_feed(data: bytes, limit: Optional[int] = None) -> List[Dict[str, str]]:
+    p = FeedParser(limit)
+    p.feed(data)
+    return p.close()
+
+
+@dataclass
+class FeedResult:
+    url: str
+    items: List[Dict[str, str]] = field(default_factory=list)
+    status: Optional[int] = None
+    changed: bool = False  # False on 304 / error: items are the last good parse
+    error: Optional[str] = None
+
+
+class FeedFetcher:
+    def __init__(self, max_concurrency: int = 4, timeout_sec: float = 5.0,
+                 per_feed_limit: Optional[int] = None):
+        self.max_concurrency = max_concurrency
+        self.timeout_sec = timeout_sec
+        self.per_feed_limit = per_feed_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}  # url -> (etag, last-modified)
+        self._cache: Dict[str, List[Dict[str, str]]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency * 2, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_sec),
+                headers={"User-Agent": USER_AGENT},
+            )
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _fetch_local(self, path: str) -> FeedResult:
+        mtime = str(os.stat(path).st_mtime_ns)
+        if self._validators.get(path, (None, None))[0] == mtime:
+            return FeedResult(path, self._cache.get(path, []), 304, False)
+        parser = FeedParser(self.per_feed_limit)
+        with open(path, "rb") as f:
+            parser.feed(f.read())
+        items = parser.close()
+        if parser.error is not None:
+            return FeedResult(path, self._cache.get(path, items), 200, False, parser.error)
+        self._validators[path] = (mtime, None)
+        self._cache[path] = items
+        return FeedResult(path, items, 200, True)
+
+    async def fetch(self, url: str) -> FeedResult:
+        try:
+            if os.path.exists(url):  # fixture feeds for offline runs
+                return await self._fetch_local(url)
+            session = await self._get_session()
+            etag, modified = self._validators.get(url, (None, None))
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+            async with self._sem:
+                async with session.get(url, headers=headers) as resp:
+                    if resp.status == 304:
+                        return FeedResult(url, self._cache.get(url, []), 304, False)
+                    if resp.status >= 400:
+                        return FeedResult(url, self._cache.get(url, []), resp.status, False,
+                                          f"HTTP {resp.status}")
+                    parser = FeedParser(self.per_feed_limit)
+                    async for chunk in resp.content.iter_chunked(_CHUNK):
+                        parser.feed(chunk)
+                        if parser.done:
+                            break  # enough items (or broken XML); drop the rest of the body
+                    items = parser.close()
+                    validators = (resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+            if parser.error is not None:
+                # no validators for a broken body, so the next poll refetches it in full;
+                # serve the last good parse meanwhile (or what parsed before the bad byte)
+                return FeedResult(url, self._cache.get(url, items), 200, False, parser.error)
+            self._validators[url] = validators
+            self._cache[url] = items
+            return FeedResult(url, items, 200, True)
+        except Exception as e:
+            return FeedResult(url, self._cache.get(url, []), None, False, str(e) or type(e).__name__)
+
+    async def fetch_all(self, urls: Iterable[str]) -> List[FeedResult]:
+        return list(await asyncio.gather(*(self.fetch(u) for u in urls)))
+
+    async def aclose(self):
+        if self._session is not None:
+            await self._session.close()
+
+
+class _LoopThread:
+    """A private event loop so the shared session outlives any one sync call."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="feed-fetcher", daemon=True).start()
+
+    def run(self, coro, timeout: Optional[float] = None):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+
+_runner: Optional[_LoopThread] = None
+_fetcher: Optional[FeedFetcher] = None
+_init_lock = threading.Lock()
+
+
+def get_fetcher() -> Tuple[_LoopThread, FeedFetcher]:
+    global _runner, _fetcher
+    if _fetcher is None:
+        with _init_lock:
+            if _fetcher is None:
+                from webapi.live_context import SOURCE_LIMITS
+                _runner = _LoopThread()
+                _fetcher = FeedFetcher(max_concurrency=SOURCE_LIMITS["rss"])
+    return _runner, _fetcher
+
+
+def fetch_feeds(urls: List[str], timeout_sec: float = 30.0) -> List[FeedResult]:
+    """Blocking entry point for sync code; fetches all feeds concurrently."""
+    runner, fetcher = get_fetcher()
+    return runner.run(fetcher.fetch_all(urls), timeout_sec)
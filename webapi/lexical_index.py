@@ -0,0 +1,139 @@
+"""
+In-memory BM25 inverted index over RAG headlines.
+
+Tokens keep ticker punctuation ("TCS.NS", "BRK-B") and also emit the base
+symbol ("tcs", "brk") so "TCS.NS guidance" matches "TCS beats estimates".
+Like webapi.ann_index, `add()` publishes new arrays with single assignments
+and `search(..., n=...)` ignores rows the caller has no metadata for yet.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_TOKEN = re.compile(r"[A-Za-z0-9$]+(?:[.\-&][A-Za-z0-9]+)*")
+_TICKER = re.compile(r"^(\$)?([A-Z]{1,5})([.\-][A-Z]{1,3})?$")
+# all-caps words that read like tickers but are ordinary query vocabulary
+_ACRONYMS = {
+    "AI", "API", "CEO", "CFO", "CPI", "ECB", "EPS", "ESG", "ETF", "EU", "EV", "FDA", "FED",
+    "FOMC", "FX", "GDP", "IMF", "IPO", "IT", "OPEC", "PE", "PMI", "SEC", "UK", "US", "USA",
+    "USD", "YOY",
+}
+_STOP = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in", "is",
+    "it", "its", "of", "on", "or", "that", "the", "to", "was", "will", "with",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    out: List[str] = []
+    for tok in _TOKEN.findall(text or ""):
+        t = tok.lower().lstrip("$")
+        if not t or t in _STOP:
+            continue
+        out.append(t)
+        base = re.split(r"[.\-&]", t, maxsplit=1)[0]
+        if base != t and base and base not in _STOP:
+            out.append(base)
+    return out
+
+
+def is_symbol_query(query: str, max_words: int = 4, symbols: Optional[Iterable[str]] = None) -> bool:
+    """
+    Short queries that name a ticker: "$NVDA", "TCS.NS guidance", or a bare
+    symbol from `symbols` ("JPM earnings"). Other all-caps words ("US
+    inflation", "GDP print") are not tickers.
+    """
+    words = (query or "").split()
+    if not words or len(words) > max_words:
+        return False
+    known = {s.upper() for s in symbols} if symbols else set()
+    for w in words:
+        m = _TICKER.match(w)
+        if not m:
+            continue
+        dollar, base, suffix = m.groups()
+        if dollar or suffix:
+            if len(base) > 1 or suffix:
+                return True
+        elif w not in _ACRONYMS and w in known:
+            return True
+    return False
+
+
+class BM25Index:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._doc_len = np.zeros(0, dtype=np.float32)
+        # term -> (doc ids int32, term freqs float32)
+        self._post: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return self._doc_len.shape[0]
+
+    def add(self, texts: Iterable[str]):
+        start = len(self)
+        lens: List[int] = []
+        grouped: Dict[str, Tuple[List[int], List[int]]] = {}
+        for i, text in enumerate(texts, start=start):
+            toks = tokenize(text)
+            lens.append(len(toks))
+            tf: Dict[str, int] = {}
+            for t in toks:
+                tf[t] = tf.get(t, 0) + 1
+            for t, c in tf.items():
+                d, f = grouped.setdefault(t, ([], []))
+                d.append(i)
+                f.append(c)
+        if not lens:
+            return
+        # doc lengths first: readers bound by `n` never look past them
+        self._doc_len = np.concatenate([self._doc_len, np.asarray(lens, dtype=np.float32)])
+        for t, (d, f) in grouped.items():
+            nd, nf = np.asarray(d, dtype=np.int32), np.asarray(f, dtype=np.float32)
+            old = self._post.get(t)
+            self._post[t] = (nd, nf) if old is None else (
+                np.concatenate([old[0], nd]), np.concatenate([old[1], nf])
+            )
+
+    def scores(self, query: str, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(doc ids with a non-zero score, their BM25 scores)."""
+        doc_len = self._doc_len
+        n = doc_len.shape[0] if n is None else min(n, doc_len.shape[0])
+        terms = set(tokenize(query))
+        if not n or not terms:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        dl = doc_len[:n]
+        avgdl = float(dl.mean()) or 1.0
+        acc = np.zeros(n, dtype=np.float32)
+        for t in terms:
+            post = self._post.get(t)
+            if post is None:
+                continue
+            docs, tfs = post
+            if docs.shape[0] and docs[-1] >= n:
+                keep = docs < n
+                docs, tfs = docs[keep], tfs[keep]
+            df = docs.shape[0]
+            if not df:
+                continue
+            idf = np.log1p((n - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * dl[docs] / avgdl)
+            acc[docs] += idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+        ids = np.flatnonzero(acc)
+        return ids, acc[ids]
+
+
+def rrf_fuse(rankings: List[np.ndarray], k: int = 60) -> Tuple[np.ndarray, np.ndarray]:
+    """Reciprocal-rank fusion of several best-first id lists."""
+    fused: Dict[int, float] = {}
+    for ranked in rankings:
+        for r, i in enumerate(ranked.tolist()):
+            fused[i] = fused.get(i, 0.0) + 1.0 / (k + r + 1)
+    if not fused:
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+    ids = np.fromiter(fused.keys(), dtype=np.int64, count=len(fused))
+    sc = np.fromiter(fused.values(), dtype=np.float64, count=len(fused))
+    order = np.argsort(-sc, kind="stable")
+    return ids[order], sc[order]
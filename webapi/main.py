@@ -1,32 +1,48 @@
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Any, Dict
 from pydantic import BaseModel
-import os
-import json, time
+import os, json, asyncio
 from dotenv import load_dotenv
-import json
-import pathlib
-import time
 from datetime import datetime, timezone
-from webapi.rag_search import rag_search
-# cache file written by pathway_livebus.py
-CACHE_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache", "live_snapshot.json"))
+from webapi.rag_search import RagSearcher
+from webapi.snapshot_store import SnapshotStore
 
-def read_cached_snapshot():
-    try:
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    except Exception:
-        return None
-    
 from webapi.live_context import (
     get_market_snapshot,
     get_news_snapshot,
     build_live_context,
 )
 
-app = FastAPI(title="Pathway-GenAI Bridge", version="0.1.0")
+def _bootstrap_snapshot() -> Dict[str, Any]:
+    # only used (in the background) when the livebus hasn't written a snapshot yet
+    mkts = get_market_snapshot()
+    nws  = get_news_snapshot()
+    return {
+        "ts_utc": datetime.now(timezone.utc).isoformat(),
+        "markets": mkts,
+        "news": nws,
+        "context": build_live_context(mkts=mkts, news=nws),
+    }
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # snapshot watcher: /live and /chat read from memory, never from disk
+    app.state.snapshots.start()
+    # warm the resident RAG searcher so the first /chat doesn't pay the load
+    try:
+        app.state.rag_searcher.refresh()
+    except Exception as e:
+        print("[rag] warm-up failed:", e)
+    yield
+    app.state.snapshots.stop()
+
+app = FastAPI(title="Pathway-GenAI Bridge", version="0.1.0", lifespan=_lifespan)
+app.state.rag_searcher = RagSearcher()
+# cache file written by pathway_livebus.py
+app.state.snapshots = SnapshotStore(bootstrap=_bootstrap_snapshot)
 
 # Allow Tauri frontend to connect
 origins = [
@@ -44,37 +60,6 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-CACHE_FILE = os.path.join(os.path.dirname(__file__), "cache", "live_snapshot.json")
-
-def _load_cached_snapshot():
-    try:
-        with open(CACHE_FILE) as f:
-            j = json.load(f)
-        return j
-    except Exception:
-        return None
-
-def _format_cached_context(j):
-    if not j:
-        return None
-    # prefer the prebuilt context string; fall back to a compact line
-    ctx = j.get("context")
-    if ctx:
-        return ctx
-    mk = j.get("markets", [])
-    heads = "; ".join([h.get("title", "") for h in (j.get("news", [])[:5])])
-    row = " | ".join([f"{m['symbol']}: {m['last']} ({m['d1_pct']}%)" for m in mk[:5]])
-    ts = j.get("ts_utc", "?")
-    return f"(Live snapshot @ {ts})\nMarkets: {row}\nTop headlines: {heads}"
-def _format_market_line(j):
-    if not j:
-        return None
-    mk = j.get("markets", [])
-    if not mk:
-        return None
-    row = " | ".join([f"{m['symbol']}: {m['last']} ({m['d1_pct']}%)" for m in mk])
-    ts = j.get("ts_utc", "?")
-    return f"(Live markets @ {ts})\nMarkets: {row}"
 
 # ------------------- Health & Test Endpoints -------------------
 
@@ -95,32 +80,25 @@ def markets_summary() -> List[Dict]:
         {"symbol": "Dow Jones", "last": 37970, "chg": -983.53, "d1": -2.47, "d7": -1.16},
     ]
 
-# ------------------- Cached snapshot (from Pathway livebus) -------------------
-
-CACHE_PATH = pathlib.Path(__file__).with_name("cache") / "live_snapshot.json"
-
-def read_cached_snapshot() -> Optional[Dict[str, Any]]:
-    try:
-        with open(CACHE_PATH, "r") as f:
-            return json.load(f)
-    except Exception:
-        return None
-
 # ------------------- OpenAI Chat Endpoint -------------------
 
 # Load .env so OPENAI_API_KEY is available when running via uvicorn
 env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
 load_dotenv(dotenv_path=os.path.abspath(env_path))
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-_openai_client = None
+_async_openai_client = None
 try:
-    _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    _async_openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     print("✅ OpenAI client initialized")
 except Exception as e:
     print("❌ DEBUG: OpenAI init failed:", e)
-    _openai_client = None
+    _async_openai_client = None
+
+# per-stage budgets for prompt assembly; a stage that misses it is left out
+LIVE_DEADLINE_SEC = float(os.getenv("CHAT_LIVE_DEADLINE_SEC", "0.25"))
+RAG_DEADLINE_SEC = float(os.getenv("CHAT_RAG_DEADLINE_SEC", "1.5"))
 
 class ChatIn(BaseModel):
     message: str
@@ -141,119 +119,121 @@ class LiveOut(BaseModel):
     news: List[Dict[str, Any]]
     context: str
 
+async def _with_deadline(fn, timeout: float, label: str):
+    # run a blocking stage off the event loop; None if it fails or runs late
+    try:
+        return await asyncio.wait_for(asyncio.to_thread(fn), timeout)
+    except asyncio.TimeoutError:
+        print(f"[chat] {label} missed its {timeout}s deadline")
+    except Exception as e:
+        print(f"[chat] {label} failed:", e)
+    return None
+
+def _live_section() -> str:
+    # last good snapshot from memory; never blocks on upstream fetches
+    return app.state.snapshots.market_line() or "(Live markets unavailable)"
+
+def _rag_section(query: str, k: int) -> Optional[str]:
+    hits = app.state.rag_searcher.search(query, topk=max(1, min(10, k)))
+    if not hits:
+        return None
+    rag_lines = "\n".join(f"- {h['title']} ({h.get('published','')})" for h in hits)
+    return "RAG context (top headlines related to the user prompt):\n" + rag_lines
+
+async def _build_messages(req: ChatIn) -> List[Dict[str, str]]:
+    """Live context and RAG hits are gathered concurrently, each under its own deadline."""
+    stages = []
+    if req.include_live:
+        stages.append(_with_deadline(_live_section, LIVE_DEADLINE_SEC, "live context"))
+    if req.include_rag:
+        stages.append(_with_deadline(lambda: _rag_section(req.message, req.rag_k),
+                                     RAG_DEADLINE_SEC, "RAG search"))
+    sys_content = "You are EquiNova AI assistant. Be concise and helpful."
+    for part in await asyncio.gather(*stages):
+        if part:
+            sys_content += "\n\n" + part
+    return [
+        {"role": "system", "content": sys_content},
+        {"role": "user", "content": req.message},
+    ]
+
+def _require_openai():
+    if not _async_openai_client or not os.getenv("OPENAI_API_KEY"):
+        raise HTTPException(status_code=500, detail="OpenAI not configured on server")
+
 @app.post("/chat", response_model=ChatOut)
-def chat(req: ChatIn):
+async def chat(req: ChatIn):
     """
     Minimal chat endpoint for EquiNova AI tab.
     """
-    if not _openai_client or not os.getenv("OPENAI_API_KEY"):
-        raise HTTPException(status_code=500, detail="OpenAI not configured on server")
-
+    _require_openai()
     try:
-        sys_content = "You are EquiNova AI assistant. Be concise and helpful."
-        if req.include_live:
-            snap = _load_cached_snapshot()
-            mline = _format_market_line(snap)
-            if mline:
-                sys_content += "\n\n" + mline
-            else:
-                try:
-                    # fallback: build markets directly (no headlines)
-                    mkts = get_market_snapshot(req.symbols)
-                    if mkts:
-                        row = " | ".join(f"{m['symbol']}: {m['last']} ({m['d1_pct']}%)" for m in mkts)
-                        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-                        sys_content += f"\n\n(Live markets @ {now})\nMarkets: {row}"
-                    else:
-                        sys_content += "\n\n(Live markets unavailable)"
-                except Exception:
-                    sys_content += "\n\n(Live markets unavailable)"
-        if req.include_rag:
-            try:
-                hits = rag_search(req.message, topk=max(1, min(10, req.rag_k)))
-                if hits:
-                    rag_lines = "\n".join(f"- {h['title']} ({h.get('published','')})" for h in hits)
-                    sys_content += "\n\nRAG context (top headlines related to the user prompt):\n" + rag_lines
-            except Exception as _e:
-                # keep chat working even if RAG lookup fails
-                pass
-
-        result = _openai_client.chat.completions.create(
+        result = await _async_openai_client.chat.completions.create(
             model=req.model,
-            messages=[
-                {"role": "system", "content": sys_content},
-                {"role": "user", "content": req.message},
-            ],
+            messages=await _build_messages(req),
             temperature=0.2,
         )
         reply = result.choices[0].message.content
         return ChatOut(reply=reply)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    
-CACHE_FILE = pathlib.Path(__file__).parent / "cache" / "live_snapshot.json"
-
-def _read_cached_live(max_stale_sec: int = 120) -> Dict[str, Any]:
-    if not CACHE_FILE.exists():
-        # Fallback: build on-demand (slower, but keeps the UI alive)
-        mkts = get_market_snapshot()
-        nws  = get_news_snapshot()
-        ctx  = build_live_context()
-        return {
-            "ts_utc": None,
-            "age_sec": None,
-            "stale": True,
-            "markets": mkts,
-            "news": nws,
-            "context": ctx,
-        }
-
-    with open(CACHE_FILE, "r") as f:
-        data = json.load(f)
-
-    ts = data.get("ts_utc")
-    age = None
-    stale = True
-    if ts:
+
+def _sse(payload: Dict[str, Any], event: Optional[str] = None) -> str:
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {json.dumps(payload)}\n\n"
+
+@app.post("/chat/stream")
+async def chat_stream(req: ChatIn):
+    """
+    Same as /chat, but streams the reply as server-sent events:
+      data: {"delta": "..."}   one per token chunk
+      event: error / data: {"detail": "..."}   if the upstream call fails mid-way
+      data: [DONE]
+    """
+    _require_openai()
+    messages = await _build_messages(req)
+
+    async def events():
         try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            age = max(0.0, time.time() - dt.timestamp())
-            stale = age > max_stale_sec
-        except Exception:
-            pass
+            stream = await _async_openai_client.chat.completions.create(
+                model=req.model,
+                messages=messages,
+                temperature=0.2,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield _sse({"delta": delta})
+        except Exception as e:
+            yield _sse({"detail": str(e)}, event="error")
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    return {
-        "ts_utc": ts,
-        "age_sec": age,
-        "stale": stale,
-        "markets": data.get("markets", []),
-        "news": data.get("news", []),
-        "context": data.get("context", ""),
-    }
 @app.get("/live", response_model=LiveOut)
 def live():
-    try:
-        payload = _read_cached_live()
-        return LiveOut(
-            ts_utc=payload["ts_utc"],
-            age_sec=payload["age_sec"],
-            stale=payload["stale"],
-            markets=payload["markets"],
-            news=payload["news"],
-            context=payload["context"],
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # pre-serialized by the snapshot store; age/stale are computed per request
+    return Response(content=app.state.snapshots.live_bytes(), media_type="application/json")
 from fastapi import Query
 
 @app.get("/rag/search")
 def rag_search_api(q: str = Query(..., description="User query"),
-                   k: int = Query(3, description="Number of results")):
+                   k: int = Query(3, description="Number of results"),
+                   mode: str = Query("auto", description="auto | hybrid | vector | lexical")):
     """
     Search the RAG index for relevant news headlines.
     """
+    if mode not in RagSearcher.MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {RagSearcher.MODES}")
     try:
-        hits = rag_search(q, topk=k)
+        hits = app.state.rag_searcher.search(q, topk=k, mode=mode)
         return hits
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,57 +1,119 @@
-import os, time, json, threading
+import os, time, json, heapq, argparse, threading
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
 import pathway as pw
 
-# reuse your existing helpers
-from webapi.live_context import get_market_snapshot, get_news_snapshot, build_live_context
+from webapi.live_context import DEFAULT_SYMBOLS, DEFAULT_FEEDS, format_live_context
+from webapi.pathway_sources import (
+    FIXTURE_FEEDS,
+    FakeQuoteSource,
+    build_pipeline,
+    fetch_market,
+    fetch_news,
+)
 
 CACHE_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache", "live_snapshot.json"))
 
-def _collect_once():
-    """Pull markets + news once using the existing helpers."""
-    mkts = get_market_snapshot()
-    nws  = get_news_snapshot()
-    ctx  = build_live_context()
-    return {"ts_utc": datetime.now(timezone.utc).isoformat(), "markets": mkts, "news": nws, "context": ctx}
-
-def _writer_loop(interval_sec: int = 20):
-    """Simple file writer — we’ll swap this with Pathway sinks later if needed."""
-    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    while True:
-        try:
-            payload = _collect_once()
-            with open(CACHE_FILE, "w") as f:
-                json.dump(payload, f)
-            print("[livebus] wrote snapshot @", payload["ts_utc"], flush=True)  # success log
-        except Exception as e:
-            print("[livebus] write error:", e, flush=True)
-        time.sleep(interval_sec)
-
-# --- Minimal Pathway graph (kept simple) ---
-table = pw.debug.table_from_markdown("col\ninit\n")
-
-@pw.udf
-def annotate(_: str) -> str:
-    return f"livebus-started@{datetime.now(timezone.utc).strftime('%H:%M:%S')}"
-
-annotated = table.select(msg=annotate(table.col))
-pw.debug.compute_and_print(annotated)
-
-# Do one immediate write so the file exists right away
-try:
-    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    _first = _collect_once()
-    with open(CACHE_FILE, "w") as f:
-        json.dump(_first, f)
-    print("[livebus] initial snapshot @", _first["ts_utc"], flush=True)
-except Exception as e:
-    print("[livebus] initial write error:", e, flush=True)
-
-# Start the background writer thread
-_writer = threading.Thread(target=_writer_loop, args=(20,), daemon=False)
-_writer.start()
-
-# Keep Pathway engine alive
-pw.run()
-# Ensure process stays up even if Pathway graph completes
-_writer.join()
+def _published_sort_key(row: Dict[str, Any]) -> float:
+    try:
+        return parsedate_to_datetime(row.get("published") or "").timestamp()
+    except Exception:
+        return 0.0
+
+class SnapshotSink:
+    """
+    Mirrors the two Pathway output tables in memory and rewrites the snapshot
+    file once per engine commit in which something actually changed.
+    """
+
+    def __init__(self, path: str = CACHE_FILE, symbols=None, max_news: int = 50):
+        self.path = path
+        self.order = {s: i for i, s in enumerate(symbols or DEFAULT_SYMBOLS)}
+        self.max_news = max_news
+        self.markets: Dict[Any, Dict[str, Any]] = {}
+        self.news: Dict[Any, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _apply(state: Dict[Any, Dict[str, Any]], key, row, is_addition: bool):
+        if is_addition:
+            state[key] = row
+        elif state.get(key) == row:
+            # retraction of the row we hold (an update retracts the old value)
+            del state[key]
+
+    def on_market(self, key, row, time, is_addition):
+        with self._lock:
+            self._apply(self.markets, key, dict(row), is_addition)
+            self._dirty = True
+
+    def on_news(self, key, row, time, is_addition):
+        with self._lock:
+            self._apply(self.news, key, dict(row), is_addition)
+            self._dirty = True
+
+    def payload(self) -> Dict[str, Any]:
+        mkts = sorted(self.markets.values(), key=lambda m: self.order.get(m["symbol"], len(self.order)))
+        mkts = [{"symbol": m["symbol"], "last": m["last"], "d1_pct": m["d1_pct"]} for m in mkts]
+        news = sorted(self.news.values(), key=_published_sort_key, reverse=True)[: self.max_news]
+        news = [{"title": n["title"], "published": n["published"]} for n in news]
+        now = datetime.now(timezone.utc)
+        return {"ts_utc": now.isoformat(), "markets": mkts, "news": news,
+                "context": format_live_context(mkts, news, now)}
+
+    def _prune_news(self):
+        # only the newest max_news can ever be shown; older ones would just accumulate
+        if len(self.news) > self.max_news:
+            keep = heapq.nlargest(self.max_news, self.news.items(), key=lambda kv: _published_sort_key(kv[1]))
+            self.news = dict(keep)
+
+    def flush(self, *_):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._prune_news()
+            payload = self.payload()
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp, self.path)
+        print(f"[livebus] wrote snapshot @ {payload['ts_utc']} "
+              f"({len(payload['markets'])} mkts, {len(payload['news'])} news)", flush=True)
+
+def main(argv: Optional[list] = None):
+    ap = argparse.ArgumentParser(description="Pathway livebus: quotes + RSS -> live_snapshot.json")
+    ap.add_argument("--offline", action="store_true",
+                    default=os.getenv("LIVEBUS_OFFLINE") == "1",
+                    help="fake quote source + fixture feeds, no network")
+    ap.add_argument("--quote-interval", type=float, default=20)
+    ap.add_argument("--news-interval", type=float, default=60)
+    ap.add_argument("--polls", type=int, default=None, help="stop after N polls (default: run forever)")
+    ap.add_argument("--news-retention", type=float, default=6 * 3600,
+                    help="seconds a headline is kept in engine state")
+    ap.add_argument("--out", default=CACHE_FILE)
+    a = ap.parse_args(argv)
+
+    quote_fetch = FakeQuoteSource() if a.offline else fetch_market
+    feeds = FIXTURE_FEEDS if a.offline else DEFAULT_FEEDS
+    latest_quotes, headlines = build_pipeline(
+        symbols=DEFAULT_SYMBOLS,
+        feeds=feeds,
+        quote_fetch=quote_fetch,
+        news_fetch=fetch_news,
+        quote_interval_sec=a.quote_interval,
+        news_interval_sec=a.news_interval,
+        max_polls=a.polls,
+        news_retention_sec=a.news_retention,
+    )
+
+    sink = SnapshotSink(a.out, DEFAULT_SYMBOLS)
+    pw.io.subscribe(latest_quotes, on_change=sink.on_market, on_time_end=sink.flush)
+    pw.io.subscribe(headlines, on_change=sink.on_news, on_time_end=sink.flush)
+    pw.run(monitoring_level=pw.MonitoringLevel.NONE)
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,202 @@
 # pathway_sources.py
+import os, time, random, hashlib
+from abc import abstractmethod
 import pathway as pw
-import requests
-import yfinance as yf
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
+
+from webapi.feeds import fetch_feeds
+from webapi.live_context import DEFAULT_SYMBOLS, get_market_snapshot
+
+FEEDS = [
+    "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",         # WSJ Markets
+    "https://www.investing.com/rss/news.rss",               # Investing.com
+    "https://www.moneycontrol.com/rss/MCtopnews.xml",       # Moneycontrol India
+    "https://www.cnbc.com/id/100003114/device/rss/rss.xml"  # CNBC Top News
+]
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE_FEEDS = [
+    os.path.join(FIXTURE_DIR, "markets_feed.xml"),
+    os.path.join(FIXTURE_DIR, "business_feed.xml"),
+]
+
+QuoteFetcher = Callable[[List[str]], List[Dict[str, Any]]]
+NewsFetcher = Callable[[List[str]], List[Dict[str, Any]]]
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 # --- Market data stream ---
 def fetch_market(symbols: List[str]) -> List[Dict[str, Any]]:
-    out = []
-    for sym in symbols:
-        try:
-            t = yf.Ticker(sym)
-            hist = t.history(period="5d", interval="1d")
-            if hist is None or hist.empty:
-                continue
-            last = float(hist["Close"].iloc[-1])
-            prev = float(hist["Close"].iloc[-2])
-            d1 = (last - prev) / prev * 100.0 if prev else 0.0
+    ts = _now_iso()
+    return [{**q, "ts": ts} for q in get_market_snapshot(symbols)]
+
+class FakeQuoteSource:
+    """Seeded random walk standing in for yfinance (offline runs, tests)."""
+
+    def __init__(self, seed: int = 0, vol: float = 0.002, p_move: float = 0.5):
+        self._rng = random.Random(seed)
+        self.vol = vol
+        self.p_move = p_move  # chance a symbol ticks at all in a poll
+        self._prev: Dict[str, float] = {}
+        self._last: Dict[str, float] = {}
+
+    def __call__(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        out = []
+        for sym in symbols:
+            if sym not in self._last:
+                self._prev[sym] = self._last[sym] = 50.0 + self._rng.random() * 450.0
+            elif self._rng.random() < self.p_move:
+                self._last[sym] *= 1.0 + self._rng.gauss(0.0, self.vol)
+            last, prev = self._last[sym], self._prev[sym]
             out.append({
                 "symbol": sym,
-                "last": round(last, 2),
-                "d1_pct": round(d1, 2),
-                "ts": datetime.now(timezone.utc).isoformat()
+                "last": round(last, 4),
+                "d1_pct": round((last - prev) / prev * 100.0, 2),
+                "ts": _now_iso(),
             })
-        except Exception:
-            continue
-    return out
+        return out
 
 # --- News RSS stream ---
-def fetch_news(feed_urls: List[str]) -> List[Dict[str, Any]]:
+def fetch_news(feed_urls: List[str], per_feed: int = 20) -> List[Dict[str, Any]]:
+    """
+    Items from feeds (http(s) URLs or local fixture paths) that changed since
+    the last call; feeds answering 304 contribute nothing.
+    """
     items = []
-    for url in feed_urls:
-        try:
-            resp = requests.get(url, timeout=5)
-            if resp.status_code != 200:
-                continue
-            import re
-            titles = re.findall(r"<title>(.*?)</title>", resp.text, re.IGNORECASE)
-            for t in titles[1:5]:
-                items.append({
-                    "title": t.strip(),
-                    "ts": datetime.now(timezone.utc).isoformat()
-                })
-        except Exception:
+    ts = _now_iso()
+    for res in fetch_feeds(feed_urls):
+        if not res.changed:
             continue
+        for it in res.items[:per_feed]:
+            items.append({**it, "source": res.url, "ts": ts})
     return items
 
-# --- Pathway pipeline ---
-def build_pipeline():
-    symbols = [
-    "SPY", "QQQ", "AAPL", "MSFT", "NVDA",
-    "GOOGL", "AMZN", "TSLA", "META", "NFLX",
-    "JPM", "GS", "BAC", "WMT", "TCS.NS"
-]
-    feeds = [
-    "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",         # WSJ Markets
-    "https://www.investing.com/rss/news.rss",               # Investing.com
-    "https://www.moneycontrol.com/rss/MCtopnews.xml",       # Moneycontrol India
-    "https://www.cnbc.com/id/100003114/device/rss/rss.xml"  # CNBC Top News
-]
+# --- Pathway connectors ---
+class QuoteSchema(pw.Schema):
+    symbol: str
+    last: float
+    d1_pct: float
+    ts: str
+
+class NewsSchema(pw.Schema):
+    id: str
+    title: str
+    published: str
+    source: str
+    ts: str
+
+class _PollingSubject(pw.io.python.ConnectorSubject):
+    """Polls `fetch` every `interval_sec`; subclasses emit only what changed."""
+
+    def __init__(self, interval_sec: float, max_polls: Optional[int] = None):
+        super().__init__()
+        self.interval_sec = interval_sec
+        self.max_polls = max_polls
+
+    @abstractmethod
+    def poll(self) -> int:
+        """Fetch once and emit changed rows; returns how many were emitted."""
 
-    market_stream = pw.io.python.iterate(fetch_market(symbols))
-    news_stream = pw.io.python.iterate(fetch_news(feeds))
+    def run(self):
+        n = 0
+        while self.max_polls is None or n < self.max_polls:
+            try:
+                if self.poll():
+                    self.commit()
+            except Exception as e:
+                print(f"[livebus] {type(self).__name__} poll error:", e, flush=True)
+            n += 1
+            if self.max_polls is None or n < self.max_polls:
+                time.sleep(self.interval_sec)
+
+class QuoteSubject(_PollingSubject):
+    def __init__(self, symbols: List[str], fetch: QuoteFetcher = fetch_market,
+                 interval_sec: float = 20, max_polls: Optional[int] = None):
+        super().__init__(interval_sec, max_polls)
+        self.symbols = list(symbols)
+        self.fetch = fetch
+        self._last: Dict[str, tuple] = {}
+
+    def poll(self) -> int:
+        sent = 0
+        for q in self.fetch(self.symbols):
+            sig = (q["last"], q["d1_pct"])
+            if self._last.get(q["symbol"]) == sig:
+                continue
+            self._last[q["symbol"]] = sig
+            self.next(symbol=q["symbol"], last=float(q["last"]), d1_pct=float(q["d1_pct"]), ts=q["ts"])
+            sent += 1
+        return sent
+
+class NewsSubject(_PollingSubject):
+    def __init__(self, feeds: List[str], fetch: NewsFetcher = fetch_news,
+                 interval_sec: float = 60, max_polls: Optional[int] = None,
+                 max_seen: int = 20000):
+        super().__init__(interval_sec, max_polls)
+        self.feeds = list(feeds)
+        self.fetch = fetch
+        self.max_seen = max_seen
+        self._seen: Dict[str, None] = {}  # insertion-ordered, trimmed oldest-first
+
+    def poll(self) -> int:
+        sent = 0
+        for it in self.fetch(self.feeds):
+            title = (it.get("title") or "").strip()
+            if not title:
+                continue
+            key = it.get("id") or hashlib.sha256(title.encode("utf-8")).hexdigest()
+            if key in self._seen:
+                continue
+            self._seen[key] = None
+            self.next(id=key, title=title, published=it.get("published") or "",
+                      source=it.get("source") or "", ts=it.get("ts") or _now_iso())
+            sent += 1
+        while len(self._seen) > self.max_seen:
+            del self._seen[next(iter(self._seen))]
+        return sent
+
+# --- Pathway pipeline ---
+def build_pipeline(symbols: Optional[List[str]] = None,
+                   feeds: Optional[List[str]] = None,
+                   quote_fetch: QuoteFetcher = fetch_market,
+                   news_fetch: NewsFetcher = fetch_news,
+                   quote_interval_sec: float = 20,
+                   news_interval_sec: float = 60,
+                   max_polls: Optional[int] = None,
+                   news_retention_sec: float = 6 * 3600):
+    """
+    Returns (latest_quotes, headlines):
+      latest_quotes  one row per symbol, its most recent quote
+      headlines      one row per distinct title, first sighting wins; each
+                     item is retracted once the newest item was first seen
+                     news_retention_sec after it, whether or not the title
+                     reappeared, so engine state stays bounded
+    Both update incrementally as the connectors emit changed rows.
+    """
+    quotes = pw.io.python.read(
+        QuoteSubject(symbols or DEFAULT_SYMBOLS, quote_fetch, quote_interval_sec, max_polls),
+        schema=QuoteSchema,
+    )
+    news = pw.io.python.read(
+        NewsSubject(feeds or FEEDS, news_fetch, news_interval_sec, max_polls),
+        schema=NewsSchema,
+    )
 
-    return market_stream, news_stream
+    latest_quotes = quotes.groupby(pw.this.symbol).reduce(
+        symbol=pw.this.symbol,
+        last=pw.reducers.latest(pw.this.last),
+        d1_pct=pw.reducers.latest(pw.this.d1_pct),
+        ts=pw.reducers.latest(pw.this.ts),
+    )
+    # forget items older than the retention window before they reach the groupby
+    news = news.select(
+        pw.this.title, pw.this.published, pw.this.source, pw.this.ts,
+        seen_at=pw.apply_with_type(lambda ts: datetime.fromisoformat(ts).timestamp(), float, pw.this.ts),
+    ).forget(pw.this.seen_at, float(news_retention_sec))
+    # same story syndicated across feeds carries different GUIDs; dedupe by title.
+    # argmin (not earliest) so forgetting's deletions are handled
+    first = news.groupby(pw.this.title).reduce(row=pw.reducers.argmin(pw.this.seen_at))
+    seen = news.ix(first.row)
+    headlines = first.select(title=seen.title, published=seen.published, source=seen.source, ts=seen.ts)
+    return latest_quotes, headlines
@@ -4,28 +4,31 @@ from typing import Dict, List, Any
 import numpy as np
 from dotenv import load_dotenv
 from email.utils import parsedate_to_datetime
+from webapi.vector_store import VectorStore, row_timestamp
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 # Use the same cache file produced by pathway_livebus.py
 CACHE_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache", "live_snapshot.json"))
-INDEX_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache", "rag_index.json"))
+# Pre-binary JSON index; imported once into the vector store, then left alone
+LEGACY_INDEX_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache", "rag_index.json"))
+_store = VectorStore()
 
-# --- Embeddings (OpenAI) ---
-try:
-    from openai import OpenAI
-    _emb = OpenAI()  # auto-reads OPENAI_API_KEY from environment
-except Exception:
-    _emb = None
+# --- Retention ---
+# items older than TTL are neither ingested nor kept; the newest MAX_ITEMS survive compaction
+RAG_TTL_DAYS = float(os.getenv("RAG_TTL_DAYS", "3"))
+RAG_MAX_ITEMS = int(os.getenv("RAG_MAX_ITEMS", "50000"))
+# compact once at least this fraction of rows is evictable
+RAG_COMPACT_MIN_DEAD = float(os.getenv("RAG_COMPACT_MIN_DEAD", "0.1"))
+
+# --- Embeddings (OpenAI, shared process-wide client) ---
+from webapi.embeddings import openai_embed, DEFAULT_MODEL
 
 def _hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 def _embed_batch(texts: List[str]) -> List[List[float]]:
-    if not _emb:
-        raise RuntimeError("OpenAI client not available")
-    # small, fast embedding model
-    model = os.getenv("OPENAI_EMBED_MODEL", "text-embedding-3-small")
-    out = _emb.embeddings.create(model=model, input=texts)  # type: ignore
-    return [d.embedding for d in out.data]
+    # small, fast embedding model; must match the query side (webapi.embeddings)
+    model = os.getenv("OPENAI_EMBED_MODEL", DEFAULT_MODEL)
+    return openai_embed(texts, model)
 
 def _load_json(path: str) -> Any:
     try:
@@ -34,16 +37,18 @@ def _load_json(path: str) -> Any:
     except Exception:
         return None
 
-def _save_json(path: str, obj: Any):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(obj, f)
-    os.replace(tmp, path)
+def _published_dt(pub_str: str) -> datetime:
+    try:
+        pub_dt = parsedate_to_datetime(pub_str)
+        if pub_dt.tzinfo is None:  # naive datetime → make UTC
+            pub_dt = pub_dt.replace(tzinfo=timezone.utc)
+        return pub_dt
+    except Exception:
+        return datetime.min.replace(tzinfo=timezone.utc)
 
 def _normalize_news_items(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
     items = []
-    cutoff = datetime.now(timezone.utc) - timedelta(days=3)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=RAG_TTL_DAYS)
 
     for it in snapshot.get("news", []) or []:
         title = (it.get("title") or "").strip()
@@ -51,12 +56,7 @@ def _normalize_news_items(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
             continue
 
         pub_str = it.get("published") or ""
-        try:
-            pub_dt = parsedate_to_datetime(pub_str)
-            if pub_dt.tzinfo is None:  # naive datetime → make UTC
-                pub_dt = pub_dt.replace(tzinfo=timezone.utc)
-        except Exception:
-            pub_dt = datetime.min.replace(tzinfo=timezone.utc)
+        pub_dt = _published_dt(pub_str)
 
         # only keep if recent enough
         if pub_dt >= cutoff:
@@ -64,6 +64,7 @@ def _normalize_news_items(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
                 "id": _hash(title),
                 "title": title,
                 "published": pub_str,
+                "ts": pub_dt.timestamp(),
             })
 
     return items
@@ -74,13 +75,29 @@ def _cosine(a: np.ndarray, b: np.ndarray) -> float:
         return 0.0
     return float(np.dot(a, b) / (da * db))
 
+def _unit_rows(vecs: Any) -> np.ndarray:
+    # store L2-normalized rows so search is a plain matrix-vector product
+    mat = np.asarray(vecs, dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return mat / norms
+
+def _migrate_legacy_index():
+    if len(_store) or not os.path.exists(LEGACY_INDEX_FILE):
+        return
+    idx = _load_json(LEGACY_INDEX_FILE) or {}
+    items = [it for it in idx.get("items", []) if it.get("vector")]
+    for it in items:
+        it["ts"] = _published_dt(it.get("published") or "").timestamp()
+    if items:
+        _store.append(items, _unit_rows([it["vector"] for it in items]))
+        print(f"[ragbus] migrated {len(items)} items from {os.path.basename(LEGACY_INDEX_FILE)}")
+
 def _build_or_update_index():
     snap = _load_json(CACHE_FILE)
     if not snap:
         return False, "no snapshot"
-    # read existing index
-    idx = _load_json(INDEX_FILE) or {"updated_at": None, "dim": None, "items": []}
-    existing = {it["id"]: it for it in idx.get("items", [])}
+    existing = _store.ids()
 
     # new/changed items
     news = _normalize_news_items(snap)
@@ -89,23 +106,50 @@ def _build_or_update_index():
     if not new_titles:
         return True, f"no new items (total {len(existing)})"
 
-    # embed new titles
+    # embed new titles and append; the store never rewrites old rows
     vecs = _embed_batch([x["title"] for x in new_titles])
-    dim = len(vecs[0]) if vecs else idx.get("dim")
-    for it, v in zip(new_titles, vecs):
-        it["vector"] = v
-        existing[it["id"]] = it
-
-    # persist
-    idx = {
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-        "dim": dim,
-        "items": list(existing.values()),
-    }
-    _save_json(INDEX_FILE, idx)
-    return True, f"indexed {len(new_titles)} new (total {len(existing)})"
-
-def _writer_loop(interval_sec: int = 30):
+    total = _store.append(new_titles, _unit_rows(vecs))
+    return True, f"indexed {len(new_titles)} new (total {total})"
+
+def _retention_mask(ts: np.ndarray, now: float) -> np.ndarray:
+    keep = ts >= now - RAG_TTL_DAYS * 86400
+    if keep.sum() > RAG_MAX_ITEMS:
+        # newest MAX_ITEMS among the survivors
+        order = np.argsort(np.where(keep, ts, -np.inf))[::-1]
+        keep = np.zeros_like(keep)
+        keep[order[:RAG_MAX_ITEMS]] = True
+    return keep
+
+def _compact_once(force: bool = False):
+    meta = _store.metadata()
+    if not meta:
+        return False, "empty"
+    ts = np.array([row_timestamp(m) for m in meta], dtype=np.float64)
+    keep = _retention_mask(ts, time.time())
+    dead = len(meta) - int(keep.sum())
+    if not dead or (not force and dead < RAG_COMPACT_MIN_DEAD * len(meta)
+                    and len(meta) <= RAG_MAX_ITEMS):
+        return True, f"compaction skipped ({dead} evictable of {len(meta)})"
+    total = _store.compact(keep)
+    return True, f"compacted: evicted {dead}, kept {total}"
+
+def _compaction_loop(interval_sec: int = 600):
+    while True:
+        time.sleep(interval_sec)
+        try:
+            ok, msg = _compact_once()
+            print(f"[ragbus] {msg}")
+        except Exception as e:
+            print("[ragbus] compaction ERROR:", e)
+
+def _writer_loop(interval_sec: int = 30, compact_every_sec: int = 600):
+    try:
+        _migrate_legacy_index()
+    except Exception as e:
+        print("[ragbus] WARN: legacy index migration failed:", e)
+    # compaction rewrites into a new generation in the background; appends wait
+    # on the store's write lock, searchers keep reading the old generation
+    threading.Thread(target=_compaction_loop, args=(compact_every_sec,), daemon=True).start()
     while True:
         try:
             ok, msg = _build_or_update_index()
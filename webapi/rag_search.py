@@ -1,33 +1,209 @@
-import json, os, numpy as np
-from typing import List, Dict
+import os, time, threading, numpy as np
+from typing import List, Dict, Any, Optional, Tuple
 
-CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
-INDEX_FILE = os.path.join(CACHE_DIR, "rag_index.json")
+from webapi.ann_index import ExactIndex, make_index, topk as _topk
+from webapi.embeddings import QueryEmbedder, get_query_embedder
+from webapi.lexical_index import BM25Index, is_symbol_query, rrf_fuse
+from webapi.live_context import DEFAULT_SYMBOLS
+from webapi.vector_store import VectorStore, row_timestamp
+
+_store = VectorStore()
 
 
 def _embed(q: str) -> np.ndarray:
-    """Single query embedding"""
-    from openai import OpenAI
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    res = client.embeddings.create(model="text-embedding-3-small", input=q)
-    return np.array(res.data[0].embedding, dtype=np.float32)
+    """Single query embedding (cached, shared client)"""
+    return get_query_embedder().embed(q)
+
+
+def _normalize_rows(mat: np.ndarray) -> np.ndarray:
+    out = np.array(mat, dtype=np.float32, order="C", copy=True)
+    norms = np.linalg.norm(out, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    out /= norms
+    return out
+
+
+class RagSearcher:
+    """
+    Resident searcher over the vector store. Holds a contiguous, L2-normalized
+    copy of the matrix (inside an ANN index, see webapi.ann_index) and only
+    touches disk when the store header changes.
+
+    Query-time retention: rows older than `ttl_days` are skipped even before
+    the indexer compacts them away, and with `half_life_hours` set scores are
+    multiplied by 2**(-age / half_life) so fresher headlines win ties.
+
+    A BM25 index over the titles is kept next to the vector index. `search`
+    modes: "vector", "lexical", "hybrid" (reciprocal-rank fusion of both) and
+    "auto" (lexical-only for ticker lookups that have lexical hits, so no
+    embedding round-trip; hybrid otherwise). A bare word counts as a ticker
+    only if it is in `symbols` (default: the live quotes universe).
+    """
+
+    MODES = ("auto", "hybrid", "vector", "lexical")
+
+    def __init__(self, store: Optional[VectorStore] = None,
+                 embedder: Optional[QueryEmbedder] = None,
+                 backend: Optional[str] = None,
+                 ttl_days: Optional[float] = None,
+                 half_life_hours: Optional[float] = None,
+                 symbols: Optional[List[str]] = None):
+        self.store = store if store is not None else _store
+        self.symbols = frozenset(s.upper() for s in (symbols or DEFAULT_SYMBOLS))
+        self.embedder = embedder
+        self.backend = backend
+        self.ttl_days = float(os.getenv("RAG_TTL_DAYS", "3")) if ttl_days is None else ttl_days
+        self.half_life_hours = (float(os.getenv("RAG_RECENCY_HALF_LIFE_HOURS", "0"))
+                                if half_life_hours is None else half_life_hours)
+        self._lock = threading.Lock()
+        self._sig: Optional[Tuple[int, int]] = None  # (header mtime_ns, generation)
+        # (index, bm25, titles, published, ts) swapped as one tuple; the lists
+        # are never mutated in place, so a reader's copy stays consistent
+        self._state: Tuple[ExactIndex, BM25Index, List[str], List[str], np.ndarray] = (
+            make_index(backend), BM25Index(), [], [], np.zeros(0)
+        )
+
+    def _header_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.store.header_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload if the header changed. Returns True when state was swapped.
+        Never waits: if another thread is already reloading (e.g. rebuilding
+        after a compaction), callers keep serving the current state.
+        """
+        mtime = self._header_mtime()
+        if mtime is None:
+            return False
+        if not force and self._sig is not None and self._sig[0] == mtime:
+            return False
+        if not self._lock.acquire(blocking=force):
+            return False
+        try:
+            if not force and self._sig is not None and self._sig[0] == mtime:
+                return False
+            hdr = self.store.header()
+            gen, count = int(hdr["generation"] or 0), int(hdr["count"] or 0)
+            index, bm25, titles, published, ts = self._state
+            old_n = len(titles)
+
+            if not force and self._sig is not None and self._sig[1] == gen and count >= old_n:
+                # same generation => append-only; index just the new tail
+                if count > old_n:
+                    index.add(_normalize_rows(self.store.matrix(hdr)[old_n:count]))
+                    meta = self.store.metadata(hdr)[old_n:count]
+                    bm25.add(m["title"] for m in meta)
+                    self._state = (
+                        index,
+                        bm25,
+                        titles + [m["title"] for m in meta],
+                        published + [m.get("published") or "" for m in meta],
+                        np.concatenate([ts, [row_timestamp(m) for m in meta]]),
+                    )
+            else:
+                # new generation (compaction) => rebuild off to the side, then swap
+                meta = self.store.metadata(hdr)
+                index = make_index(self.backend)
+                index.add(_normalize_rows(self.store.matrix(hdr)))
+                bm25 = BM25Index()
+                bm25.add(m["title"] for m in meta)
+                self._state = (
+                    index,
+                    bm25,
+                    [m["title"] for m in meta],
+                    [m.get("published") or "" for m in meta],
+                    np.array([row_timestamp(m) for m in meta], dtype=np.float64),
+                )
+
+            self._sig = (mtime, gen)
+            return True
+        finally:
+            self._lock.release()
+
+    def __len__(self) -> int:
+        return len(self._state[2])
+
+    def _retain(self, ids: np.ndarray, scores: np.ndarray, ts: np.ndarray):
+        """Apply query-time TTL and recency weighting to (ids, scores)."""
+        if self.ttl_days <= 0 and self.half_life_hours <= 0:
+            return ids, scores
+        age = time.time() - ts[ids]
+        if self.ttl_days > 0:
+            live = age <= self.ttl_days * 86400
+            ids, scores, age = ids[live], scores[live], age[live]
+        if self.half_life_hours > 0:
+            scores = scores * np.exp2(-np.maximum(age, 0.0) / (self.half_life_hours * 3600))
+        return ids, scores
+
+    def _vector_ranked(self, state, qvec: np.ndarray, k: int):
+        index, _, titles, _, ts = state
+        qn = np.linalg.norm(qvec)
+        if qn == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        q = np.asarray(qvec, dtype=np.float32) / qn
+        if self.ttl_days <= 0 and self.half_life_hours <= 0:
+            return index.search(q, k, n=len(titles))
+        ids, scores = self._retain(*index.scores(q, n=len(titles)), ts)
+        best = _topk(scores, k)
+        return ids[best], scores[best]
+
+    def _lexical_ranked(self, state, query: str, k: int):
+        _, bm25, titles, _, ts = state
+        ids, scores = self._retain(*bm25.scores(query, n=len(titles)), ts)
+        best = _topk(scores, k)
+        return ids[best], scores[best]
+
+    @staticmethod
+    def _rows(state, ids, scores) -> List[Dict[str, Any]]:
+        _, _, titles, published, _ = state
+        return [
+            {"title": titles[i], "published": published[i], "score": float(s)}
+            for i, s in zip(ids, scores)
+        ]
+
+    def search_vector(self, qvec: np.ndarray, topk: int = 3) -> List[Dict[str, Any]]:
+        self.refresh()
+        state = self._state
+        if not state[2]:
+            return []
+        return self._rows(state, *self._vector_ranked(state, qvec, topk))
+
+    def search(self, query: str, topk: int = 3, mode: str = "auto") -> List[Dict[str, Any]]:
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        self.refresh()
+        state = self._state
+        if not state[2]:
+            return []
+
+        if mode in ("lexical", "auto"):
+            lex = self._lexical_ranked(state, query, topk if mode == "lexical" else 4 * topk)
+            if mode == "lexical" or (is_symbol_query(query, symbols=self.symbols) and lex[0].size):
+                return self._rows(state, lex[0][:topk], lex[1][:topk])
+        qvec = self.embedder.embed(query) if self.embedder else _embed(query)
+        if mode == "vector":
+            return self._rows(state, *self._vector_ranked(state, qvec, topk))
+
+        if mode == "hybrid":
+            lex = self._lexical_ranked(state, query, 4 * topk)
+        vec = self._vector_ranked(state, qvec, 4 * topk)
+        ids, scores = rrf_fuse([vec[0], lex[0]])
+        return self._rows(state, ids[:topk], scores[:topk])
+
+
+_default_searcher: Optional[RagSearcher] = None
+
+
+def get_searcher() -> RagSearcher:
+    global _default_searcher
+    if _default_searcher is None:
+        _default_searcher = RagSearcher()
+    return _default_searcher
 
 
-def rag_search(query: str, topk: int = 3) -> List[Dict[str, str]]:
+def rag_search(query: str, topk: int = 3, mode: str = "auto") -> List[Dict[str, str]]:
     """Search cached RAG index for relevant news titles"""
-    if not os.path.exists(INDEX_FILE):
-        return []
-
-    with open(INDEX_FILE, "r") as f:
-        idx = json.load(f)
-
-    qvec = _embed(query)
-    scored = []
-    for it in idx.get("items", []):
-        v = np.array(it.get("vector", []), dtype=np.float32)
-        if v.size:
-            sim = float(np.dot(qvec, v) / (np.linalg.norm(qvec) * np.linalg.norm(v)))
-            scored.append({"title": it["title"], "published": it["published"], "score": sim})
-
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    return scored[:topk]
\ No newline at end of file
+    return get_searcher().search(query, topk, mode)
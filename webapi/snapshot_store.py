@@ -0,0 +1,127 @@
+"""
+In-process holder for the livebus snapshot.
+
+A watcher thread polls the snapshot file's mtime and reloads it only when it
+changes; producers in the same process can also push with `update()`. Each
+load pre-serializes the /live body (everything except age/stale, which are
+spliced in per request) and the market line used by /chat, so requests never
+touch disk or upstream APIs. A bad or half-written file leaves the last good
+snapshot in place; readers see it marked stale as it ages.
+"""
+import os, json, time, threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+CACHE_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache", "live_snapshot.json"))
+
+
+def format_market_line(j: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not j:
+        return None
+    mk = j.get("markets", [])
+    if not mk:
+        return None
+    row = " | ".join([f"{m['symbol']}: {m['last']} ({m['d1_pct']}%)" for m in mk])
+    ts = j.get("ts_utc", "?")
+    return f"(Live markets @ {ts})\nMarkets: {row}"
+
+
+def _parse_ts(ts: Optional[str]) -> Optional[float]:
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except Exception:
+        return None
+
+
+class SnapshotStore:
+    def __init__(self, path: str = CACHE_FILE, poll_sec: float = 0.5, max_stale_sec: float = 120,
+                 bootstrap: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.path = path
+        self.poll_sec = poll_sec
+        self.max_stale_sec = max_stale_sec
+        self.bootstrap = bootstrap  # one-off background fill when no file exists yet
+        self._mtime: Optional[int] = None
+        # (snapshot, ts epoch, pre-serialized body tail, market line), swapped as one
+        self._state: tuple = ()
+        self.update({})
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------- producers ----------------
+
+    def update(self, snap: Dict[str, Any]):
+        ts = snap.get("ts_utc")
+        tail = json.dumps({
+            "markets": snap.get("markets", []),
+            "news": snap.get("news", []),
+            "context": snap.get("context", ""),
+        }, separators=(",", ":")).encode("utf-8")[1:]  # drop "{" so age/stale can be prefixed
+        head = b'"ts_utc":' + json.dumps(ts).encode("utf-8") + b","
+        self._state = (snap, _parse_ts(ts), head + tail, format_market_line(snap))
+
+    def poll_once(self) -> bool:
+        """Reload if the file changed. Returns True if a new snapshot was loaded."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                snap = json.loads(f.read())
+        except Exception:
+            return False  # mid-write or corrupt: keep the last good one, retry next tick
+        self._mtime = mtime
+        self.update(snap)
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                print("[snapshots] watcher error:", e)
+            self._stop.wait(self.poll_sec)
+
+    def _run_bootstrap(self):
+        try:
+            snap = self.bootstrap()
+            if self._mtime is None:  # the livebus may have written meanwhile
+                self.update(snap)
+        except Exception as e:
+            print("[snapshots] bootstrap failed:", e)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.poll_once()
+        if self._mtime is None and self.bootstrap:
+            threading.Thread(target=self._run_bootstrap, name="snapshot-bootstrap", daemon=True).start()
+        self._thread = threading.Thread(target=self._run, name="snapshot-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    # ---------------- readers ----------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self._state[0]
+
+    def market_line(self) -> Optional[str]:
+        return self._state[3]
+
+    def age_sec(self) -> Optional[float]:
+        ts = self._state[1]
+        return None if ts is None else max(0.0, time.time() - ts)
+
+    def live_bytes(self) -> bytes:
+        """The /live response body, with age and staleness as of now."""
+        _, ts, body, _ = self._state
+        age = None if ts is None else max(0.0, time.time() - ts)
+        stale = age is None or age > self.max_stale_sec
+        return (b'{"age_sec":' + (b"null" if age is None else repr(round(age, 3)).encode())
+                + b',"stale":' + (b"true" if stale else b"false") + b"," + body)
@@ -0,0 +1,193 @@
+"""
+Append-only float32 vector store for the news RAG index.
+
+Files (all under cache/), per generation g (g=0 has no suffix):
+  rag_vectors[.g<g>].f32   raw row-major float32 matrix, count x dim
+  rag_meta[.g<g>].jsonl    one JSON object per row (id, title, published, ts)
+  rag_store.json           small header: dim, count, meta_bytes, generation, updated_at
+
+The header is replaced atomically *after* the data files are written, so a
+reader only ever maps the rows the header declares, even mid-append.
+`compact()` writes the surviving rows into the next generation's files and
+then swaps the header; readers that already mapped the previous generation
+keep working, and its files are removed one compaction later.
+"""
+import os, json, threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Sequence, Set
+
+import numpy as np
+
+CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "cache"))
+META_FIELDS = ("id", "title", "published", "ts")
+_F32 = np.dtype(np.float32).itemsize
+_COPY_ROWS = 65536  # rows per chunk when rewriting a segment
+
+
+def _empty_header() -> Dict[str, Any]:
+    return {"dim": None, "count": 0, "meta_bytes": 0, "generation": 0, "updated_at": None}
+
+
+def row_timestamp(meta: Dict[str, Any]) -> float:
+    """Epoch seconds of `published`; rows written before `ts` existed are parsed."""
+    ts = meta.get("ts")
+    if ts is not None:
+        return float(ts)
+    try:
+        dt = parsedate_to_datetime(meta.get("published") or "")
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except Exception:
+        return 0.0
+
+
+class VectorStore:
+    def __init__(self, cache_dir: str = CACHE_DIR, name: str = "rag"):
+        self.cache_dir = cache_dir
+        self.name = name
+        self.header_path = os.path.join(cache_dir, f"{name}_store.json")
+        self._write_lock = threading.Lock()  # appends vs. compaction in the writer process
+
+    # ---------------- paths ----------------
+
+    def _suffix(self, gen: int) -> str:
+        return f".g{gen}" if gen else ""
+
+    def vec_path_for(self, gen: int) -> str:
+        return os.path.join(self.cache_dir, f"{self.name}_vectors{self._suffix(gen)}.f32")
+
+    def meta_path_for(self, gen: int) -> str:
+        return os.path.join(self.cache_dir, f"{self.name}_meta{self._suffix(gen)}.jsonl")
+
+    # ---------------- header ----------------
+
+    def header(self) -> Dict[str, Any]:
+        try:
+            with open(self.header_path, "r") as f:
+                return {**_empty_header(), **json.load(f)}
+        except Exception:
+            return _empty_header()
+
+    def _write_header(self, hdr: Dict[str, Any]):
+        tmp = self.header_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(hdr, f)
+        os.replace(tmp, self.header_path)
+
+    @staticmethod
+    def _meta_blob(items: Sequence[Dict[str, Any]]) -> bytes:
+        return "".join(
+            json.dumps({k: it.get(k) for k in META_FIELDS}) + "\n" for it in items
+        ).encode("utf-8")
+
+    # ---------------- write path ----------------
+
+    def append(self, items: Sequence[Dict[str, Any]], vectors: Any) -> int:
+        """Append rows (metadata + vectors). Returns the new row count."""
+        with self._write_lock:
+            hdr = self.header()
+            count = int(hdr["count"] or 0)
+            if not items:
+                return count
+
+            mat = np.ascontiguousarray(vectors, dtype=np.float32)
+            if mat.ndim != 2 or mat.shape[0] != len(items):
+                raise ValueError(f"expected {len(items)} vectors, got shape {mat.shape}")
+            dim = int(hdr["dim"] or mat.shape[1])
+            if mat.shape[1] != dim:
+                raise ValueError(f"vector dim {mat.shape[1]} does not match store dim {dim}")
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            gen = int(hdr["generation"] or 0)
+            meta_bytes = int(hdr["meta_bytes"] or 0)
+            blob = self._meta_blob(items)
+
+            # truncate first: drops any tail left behind by an interrupted append
+            with open(self.vec_path_for(gen), "ab") as f:
+                f.truncate(count * dim * _F32)
+                f.write(mat.tobytes())
+            with open(self.meta_path_for(gen), "ab") as f:
+                f.truncate(meta_bytes)
+                f.write(blob)
+
+            self._write_header({
+                **hdr,
+                "dim": dim,
+                "count": count + len(items),
+                "meta_bytes": meta_bytes + len(blob),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            })
+            return count + len(items)
+
+    def compact(self, keep: np.ndarray) -> int:
+        """
+        Rewrite the store keeping only rows where `keep` is True (a mask over
+        the current rows). Rows appended meanwhile are not lost: the mask is
+        extended with True. Returns the surviving row count.
+        """
+        with self._write_lock:
+            hdr = self.header()
+            count, dim = int(hdr["count"] or 0), int(hdr["dim"] or 0)
+            gen = int(hdr["generation"] or 0)
+            if not count:
+                return 0
+            keep = np.asarray(keep, dtype=bool)
+            if keep.shape[0] < count:
+                keep = np.concatenate([keep, np.ones(count - keep.shape[0], dtype=bool)])
+            keep = keep[:count]
+
+            src = self.matrix(hdr)
+            meta = self.metadata(hdr)
+            new_gen = gen + 1
+            rows = np.flatnonzero(keep)
+            with open(self.vec_path_for(new_gen), "wb") as f:
+                for s in range(0, rows.shape[0], _COPY_ROWS):
+                    f.write(np.ascontiguousarray(src[rows[s : s + _COPY_ROWS]]).tobytes())
+            blob = self._meta_blob([meta[i] for i in rows])
+            with open(self.meta_path_for(new_gen), "wb") as f:
+                f.write(blob)
+            del src
+
+            self._write_header({
+                **hdr,
+                "count": int(rows.shape[0]),
+                "meta_bytes": len(blob),
+                "generation": new_gen,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            })
+            # the generation before `gen` can no longer be referenced by a fresh header read
+            if gen >= 1:
+                for p in (self.vec_path_for(gen - 1), self.meta_path_for(gen - 1)):
+                    try:
+                        os.remove(p)
+                    except OSError:
+                        pass  # still mapped on Windows, or already gone
+            return int(rows.shape[0])
+
+    # ---------------- read path ----------------
+
+    def matrix(self, hdr: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Read-only memory map of the first `count` rows."""
+        hdr = hdr or self.header()
+        count, dim = int(hdr["count"] or 0), int(hdr["dim"] or 0)
+        if not count or not dim:
+            return np.zeros((0, dim), dtype=np.float32)
+        path = self.vec_path_for(int(hdr["generation"] or 0))
+        return np.memmap(path, dtype=np.float32, mode="r", shape=(count, dim))
+
+    def metadata(self, hdr: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        hdr = hdr or self.header()
+        size = int(hdr["meta_bytes"] or 0)
+        if not size:
+            return []
+        with open(self.meta_path_for(int(hdr["generation"] or 0)), "rb") as f:
+            raw = f.read(size)
+        return [json.loads(line) for line in raw.splitlines() if line]
+
+    def ids(self) -> Set[str]:
+        return {m["id"] for m in self.metadata()}
+
+    def __len__(self) -> int:
+        return int(self.header()["count"] or 0)